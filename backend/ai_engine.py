@@ -1,11 +1,32 @@
 import os
+import json
+import time
+import fcntl
+import shutil
+import queue
+import threading
+import numpy as np
+from contextlib import contextmanager
+from datetime import datetime
 import torch
 from ultralytics import YOLO
 
-def get_model(model_url):
+from config import BaseConfig
+
+# 지원 추론 백엔드 / 정밀도
+INFERENCE_BACKENDS = ('pytorch', 'onnx', 'openvino')
+INFERENCE_PRECISIONS = ('fp32', 'int8')
+VERIFY_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+
+def get_model(model_url, backend=None, precision=None):
     """
     Function for load AI model (YOLO)
     """
+    backend = (backend or BaseConfig.INFERENCE_BACKEND).lower()
+    precision = (precision or BaseConfig.INFERENCE_PRECISION).lower()
+    device = 'cpu'
+
     try:
         if not model_url:
             raise ValueError("환경 변수 'AI_MODEL_URL'이 설정되지 않았습니다.")
@@ -15,12 +36,32 @@ def get_model(model_url):
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"YOLO 모델 파일이 존재하지 않습니다: {model_path}")
 
+        if backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"지원하지 않는 추론 백엔드입니다: {backend}")
+
+        if precision not in INFERENCE_PRECISIONS:
+            raise ValueError(f"지원하지 않는 추론 정밀도입니다: {precision}")
+
+        if backend == 'pytorch' and precision == 'int8':
+            print("int8 추론은 onnx / openvino 백엔드에서만 지원됩니다. fp32로 진행합니다.")
+
         # Model run environment
         if torch.cuda.is_available():
             device = 'cuda'
         else: # TODO : MPS device is temporarily suspended for avoiding torchvision Error
             device = 'cpu'
-        
+
+        if backend != 'pytorch':
+            try:
+                export_path = load_exported_model_path(model_path, backend, precision)
+                model = YOLO(export_path, task='detect')
+                device = 'cpu'
+                print(f"YOLO 모델 로드 완료: {export_path} (백엔드: {backend}, 정밀도: {precision}, 디바이스: {device})")
+                return model, device
+
+            except Exception as e:
+                print(f"{backend} ({precision}) 백엔드 로드 실패, pytorch 백엔드로 전환합니다: {e}")
+
         # Load Model
         model = YOLO(model_path).to(device)
         print(f"YOLO 모델 로드 완료: {model_path} (디바이스: {device})")
@@ -29,4 +70,374 @@ def get_model(model_url):
         print(f"Error: {e}")
         model = None
         
-    return model, device
\ No newline at end of file
+    return model, device
+
+
+def get_export_path(model_path, backend, precision='fp32'):
+    """
+    Exported model path next to the weights (ultralytics export naming)
+    """
+    stem = os.path.splitext(model_path)[0]
+    suffix = '_int8' if precision == 'int8' else ''
+    if backend == 'onnx':
+        return f"{stem}{suffix}.onnx"
+    elif backend == 'openvino':
+        return f"{stem}{suffix}_openvino_model"
+    raise ValueError(f"지원하지 않는 추론 백엔드입니다: {backend}")
+
+
+@contextmanager
+def export_lock(export_path):
+    """
+    Inter-process lock for exporting / verifying one model (web and model-pool workers start together)
+    """
+    with open(f"{export_path}.lock", 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_exported_model_path(model_path, backend, precision='fp32'):
+    """
+    Return cached export of the weights, exporting (and verifying) it once if missing or stale
+    """
+    export_path = get_export_path(model_path, backend, precision)
+
+    # 먼저 lock을 얻은 프로세스만 export / 검증, 나머지는 완료 후 결과 사용
+    with export_lock(export_path):
+        if os.path.exists(export_path) and os.path.getmtime(export_path) >= os.path.getmtime(model_path):
+            return export_path
+
+        if precision == 'int8':
+            # 같은 가중치로 검증에 실패한 기록이 있으면 export / 검증을 반복하지 않음
+            report = read_int8_report(model_path, backend)
+            if report and report.get('weights_mtime') == os.path.getmtime(model_path) and not report.get('passed'):
+                raise RuntimeError(f"{backend} (int8) 모델 검증 실패 기록 (mAP50 drift {report['map50_drift']:.4f}), "
+                                   f"가중치 변경 시 재시도합니다: {get_int8_report_path(model_path, backend)}")
+
+        print(f"{backend} ({precision}) 모델 export 진행: {model_path}")
+        if precision == 'int8':
+            # int8은 box 단위 오차 비교 대신 검증 데이터셋 mAP50 하락폭으로 검증
+            export_path = export_int8_model(model_path, backend)
+            verified = check_int8_drift(model_path, export_path, backend)
+        else:
+            images = get_verify_images()  # 검증 이미지가 없으면 export 전에 실패
+            export_path = YOLO(model_path).export(format=backend, dynamic=True, device='cpu')
+            verified = verify_backend(model_path, export_path, images)
+
+        if not verified:
+            if os.path.isdir(export_path):
+                shutil.rmtree(export_path, ignore_errors=True)
+            elif os.path.exists(export_path):
+                os.remove(export_path)
+            raise RuntimeError(f"{backend} ({precision}) 모델 검증 실패: {export_path}")
+
+    return export_path
+
+
+def get_int8_data():
+    """
+    Validation dataset yaml (ultralytics format) used for INT8 calibration and mAP50 drift
+    """
+    data = BaseConfig.INFERENCE_INT8_DATA
+    if not data:
+        raise FileNotFoundError("int8 검증 데이터셋이 설정되지 않았습니다 (INFERENCE_INT8_DATA)")
+    if not os.path.exists(data):
+        raise FileNotFoundError(f"int8 검증 데이터셋이 존재하지 않습니다: {data}")
+    return data
+
+
+def get_int8_report_path(model_path, backend):
+    return f"{os.path.splitext(model_path)[0]}_{backend}_int8_report.json"
+
+
+def read_int8_report(model_path, backend):
+    """
+    Last INT8 drift report of the weights (None if missing or unreadable)
+    """
+    try:
+        with open(get_int8_report_path(model_path, backend), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class _CalibrationReader:
+    """
+    onnxruntime CalibrationDataReader : letterboxed validation images as model input
+    """
+    def __init__(self, onnx_path, images, imgsz=640):
+        import onnxruntime
+
+        session = onnxruntime.InferenceSession(onnx_path, providers=['CPUExecutionProvider'])
+        self.input_name = session.get_inputs()[0].name
+        self.images = images
+        self.imgsz = imgsz
+        self._index = 0
+
+    def _preprocess(self, path):
+        import cv2
+        from ultralytics.data.augment import LetterBox
+
+        image = LetterBox((self.imgsz, self.imgsz), auto=False)(image=cv2.imread(path))
+        image = image[..., ::-1].transpose(2, 0, 1)  # BGR HWC -> RGB CHW
+        return (np.ascontiguousarray(image, dtype=np.float32) / 255)[None]
+
+    def get_next(self):
+        if self._index >= len(self.images):
+            return None
+        path = self.images[self._index]
+        self._index += 1
+        return {self.input_name: self._preprocess(path)}
+
+
+def export_int8_model(model_path, backend):
+    """
+    Build a static INT8 model calibrated on the validation dataset
+    """
+    data = get_int8_data()
+
+    if backend == 'openvino':
+        # NNCF 정적 양자화 (calibration : 데이터셋의 val 이미지)
+        return YOLO(model_path).export(format='openvino', int8=True, data=data, dynamic=True, device='cpu')
+
+    if backend == 'onnx':
+        # fp32 onnx export 이후 onnxruntime 정적 양자화 (QDQ, per-channel)
+        from onnxruntime.quantization import quantize_static, QuantFormat, QuantType
+        from ultralytics.data.utils import check_det_dataset
+
+        fp32_path = load_exported_model_path(model_path, 'onnx')
+        int8_path = get_export_path(model_path, 'onnx', 'int8')
+
+        val_dir = check_det_dataset(data)['val']
+        images = get_verify_images(val_dir)[:BaseConfig.INFERENCE_INT8_CALIBRATION_SIZE]
+
+        quantize_static(fp32_path, int8_path,
+                        _CalibrationReader(fp32_path, images),
+                        quant_format=QuantFormat.QDQ,
+                        activation_type=QuantType.QUInt8,
+                        weight_type=QuantType.QInt8,
+                        per_channel=True)
+        return int8_path
+
+    raise ValueError(f"int8을 지원하지 않는 추론 백엔드입니다: {backend}")
+
+
+def check_int8_drift(model_path, int8_path, backend):
+    """
+    Record mAP50 of the fp32 and INT8 models on the validation dataset and check the drift
+    """
+    data = get_int8_data()
+
+    fp32_map50 = float(YOLO(model_path).val(data=data, batch=1, device='cpu',
+                                            plots=False, verbose=False).box.map50)
+    int8_map50 = float(YOLO(int8_path, task='detect').val(data=data, batch=1, device='cpu',
+                                                          plots=False, verbose=False).box.map50)
+    drift = fp32_map50 - int8_map50
+    passed = drift <= BaseConfig.INFERENCE_INT8_MAX_MAP50_DRIFT
+
+    report = {
+        'backend': backend,
+        'model': int8_path,
+        # 검증 결과는 이 가중치에 대해서만 유효 (실패 시 가중치가 바뀔 때까지 재시도하지 않음)
+        'weights_mtime': os.path.getmtime(model_path),
+        'passed': passed,
+        'data': data,
+        'fp32_map50': fp32_map50,
+        'int8_map50': int8_map50,
+        'map50_drift': drift,
+        'max_map50_drift': BaseConfig.INFERENCE_INT8_MAX_MAP50_DRIFT,
+        'created_at': datetime.now().isoformat(),
+    }
+    with open(get_int8_report_path(model_path, backend), "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"check_int8_drift : mAP50 fp32 {fp32_map50:.4f} / int8 {int8_map50:.4f} (drift {drift:.4f})")
+    return passed
+
+
+def get_verify_images(verify_dir=None):
+    """
+    Image paths for backend verification (INFERENCE_VERIFY_DIR : fish images the model detects)
+    """
+    verify_dir = verify_dir or BaseConfig.INFERENCE_VERIFY_DIR
+    if not verify_dir or not os.path.isdir(verify_dir):
+        # 물고기가 없는 이미지로는 비교할 검출 결과가 없어 검증이 의미 없음
+        raise FileNotFoundError(f"검증 이미지 폴더가 존재하지 않습니다 (INFERENCE_VERIFY_DIR): {verify_dir}")
+
+    images = sorted(os.path.join(verify_dir, name) for name in os.listdir(verify_dir)
+                    if name.lower().endswith(VERIFY_IMAGE_EXTENSIONS))
+    if not images:
+        raise FileNotFoundError(f"검증 이미지가 없습니다: {verify_dir}")
+    return images
+
+
+def box_iou(box, boxes):
+    """
+    IoU between one xyxy box and (n, 4) xyxy boxes
+    """
+    x1 = np.maximum(box[0], boxes[:, 0])
+    y1 = np.maximum(box[1], boxes[:, 1])
+    x2 = np.minimum(box[2], boxes[:, 2])
+    y2 = np.minimum(box[3], boxes[:, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+
+    area = (box[2] - box[0]) * (box[3] - box[1])
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    return inter / np.maximum(area + areas - inter, 1e-9)
+
+
+def detections_match(reference, candidate, conf_threshold, conf_tolerance, iou_threshold):
+    """
+    Check every confident box of `reference` has a same-class box in `candidate` within tolerance
+    """
+    # threshold 경계의 box는 백엔드 간 수치 오차로 나타나거나 사라질 수 있으므로 제외
+    confident = reference[reference[:, 4] >= conf_threshold + conf_tolerance]
+
+    for det in confident:
+        same_class = candidate[candidate[:, 5] == det[5]]
+        if not len(same_class):
+            return False
+
+        ious = box_iou(det[:4], same_class[:, :4])
+        best = int(np.argmax(ious))
+        if ious[best] < iou_threshold or abs(same_class[best, 4] - det[4]) > conf_tolerance:
+            return False
+
+    return True
+
+
+def verify_backend(model_path, export_path, images=None):
+    """
+    Compare exported model detections with the PyTorch model on verification images
+    """
+    conf_threshold = 0.1
+    conf_tolerance = BaseConfig.INFERENCE_VERIFY_CONF_TOLERANCE
+    iou_threshold = BaseConfig.INFERENCE_VERIFY_IOU
+
+    reference_model = YOLO(model_path)
+    candidate_model = YOLO(export_path, task='detect')
+    confident_boxes = 0
+
+    for image in images or get_verify_images():
+        reference = to_detection_array(reference_model(image, conf=conf_threshold, device='cpu', verbose=False)[0])
+        candidate = to_detection_array(candidate_model(image, conf=conf_threshold, device='cpu', verbose=False)[0])
+        confident_boxes += int((reference[:, 4] >= conf_threshold + conf_tolerance).sum())
+
+        # 양방향 비교 (누락 / 추가 검출 모두 확인)
+        if not (detections_match(reference, candidate, conf_threshold, conf_tolerance, iou_threshold) and
+                detections_match(candidate, reference, conf_threshold, conf_tolerance, iou_threshold)):
+            print(f"verify_backend : Detection mismatch on {image}")
+            return False
+
+    # 비교한 box가 없으면 검증되지 않은 것으로 처리
+    if not confident_boxes:
+        print(f"verify_backend : No confident reference detections to compare")
+        return False
+
+    print(f"verify_backend : {export_path} 검증 완료 ({confident_boxes} boxes)")
+    return True
+
+
+def to_detection_array(result):
+    """
+    Convert YOLO result into (n, 6) float32 array : x1, y1, x2, y2, conf, cls
+    """
+    return result.boxes.data.cpu().numpy().astype('float32', copy=False)
+
+
+class _PendingInference:
+    """
+    Single image waiting for a batched forward pass
+    """
+    __slots__ = ('image', 'result', 'error', 'done')
+
+    def __init__(self, image):
+        self.image = image
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class BatchInferenceEngine:
+    """
+    Collect concurrent inference requests into one batched forward pass (micro-batching)
+    """
+    def __init__(self, model, device, max_batch_size=8, max_wait_ms=10):
+        self.model = model
+        self.device = device
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000
+
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def __call__(self, image):
+        """
+        Run inference for one image and return [detection array] (see `to_detection_array`)
+        """
+        if self.model is None:
+            raise RuntimeError("YOLO 모델이 로드되지 않았습니다.")
+
+        # Batch size 1 : 기존 단일 이미지 경로 그대로 사용
+        if self.max_batch_size == 1:
+            results = self.model(image, exist_ok=True, device=self.device, verbose=False)
+            return [to_detection_array(result) for result in results]
+
+        self._ensure_worker()
+
+        pending = _PendingInference(image)
+        self._queue.put(pending)
+        pending.done.wait()
+
+        if pending.error is not None:
+            raise pending.error
+        return [pending.result]
+
+    def _ensure_worker(self):
+        # Worker thread는 첫 요청 시 생성 (gunicorn fork 이후 프로세스마다 생성되도록)
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run,
+                                                name='batch-inference',
+                                                daemon=True)
+                self._worker.start()
+
+    def _collect_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            try:
+                results = self.model([pending.image for pending in batch],
+                                     exist_ok=True,
+                                     device=self.device,
+                                     verbose=False)
+                for pending, result in zip(batch, results):
+                    pending.result = to_detection_array(result)
+            except Exception as e:
+                print(f"BatchInferenceEngine : Error Occured on {e}")
+                for pending in batch:
+                    pending.error = e
+            finally:
+                for pending in batch:
+                    pending.done.set()
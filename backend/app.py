@@ -1,5 +1,5 @@
-from ai_engine import get_model
 from routes.route import set_route
+from services.predict_jobs import predict_jobs
 from config import BaseConfig
 from flask import Flask
 from flask_cors import CORS
@@ -9,7 +9,18 @@ import os
 BASE_URL = os.getenv('BASE_URL')
 AI_MODEL_URL = os.getenv('AI_MODEL_URL')
 
-model, device = get_model(AI_MODEL_URL)
+if BaseConfig.MODEL_POOL_ADDRESS:
+    # 모델은 model_pool 프로세스에서만 로드 (python model_pool.py)
+    from model_pool import ModelPoolClient
+    device = 'model-pool'
+    inference_engine = ModelPoolClient(BaseConfig.MODEL_POOL_ADDRESS,
+                                       timeout=BaseConfig.MODEL_POOL_TIMEOUT)
+else:
+    from ai_engine import get_model, BatchInferenceEngine
+    model, device = get_model(AI_MODEL_URL)
+    inference_engine = BatchInferenceEngine(model, device,
+                                            max_batch_size=BaseConfig.INFERENCE_MAX_BATCH_SIZE,
+                                            max_wait_ms=BaseConfig.INFERENCE_MAX_WAIT_MS)
 
 def create_app():
     app = Flask(__name__)
@@ -25,10 +36,14 @@ def create_app():
     }}, supports_credentials=True)
 
     # 엔드포인트 등록
-    set_route(app, model, device)
+    set_route(app, inference_engine, device)
+
+    # /predict 결과 백그라운드 저장 (남아있는 spool 작업 재처리 포함)
+    if BaseConfig.PREDICT_ASYNC_PERSISTENCE:
+        predict_jobs.start()
     
     return app
         
 if __name__ == '__main__':
     app = create_app()
-    app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=5000, debug=False)
@@ -0,0 +1,47 @@
+"""
+Benchmark : single-image latency of pytorch / onnx / openvino inference backends (fp32, int8)
+
+Usage : AI_MODEL_URL=<model.pt> python -m benchmarks.bench_backends [iterations]
+"""
+import os
+import sys
+import time
+import numpy as np
+from PIL import Image
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_engine import get_model, get_verify_images, INFERENCE_BACKENDS
+
+BENCHMARK_TARGETS = [(backend, 'fp32') for backend in INFERENCE_BACKENDS] + [('onnx', 'int8'), ('openvino', 'int8')]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    images = [Image.open(path).convert('RGB') for path in get_verify_images()]
+
+    for backend, precision in BENCHMARK_TARGETS:
+        name = f"{backend}/{precision}"
+        model, device = get_model(os.getenv('AI_MODEL_URL'), backend=backend, precision=precision)
+        if model is None:
+            print(f"{name:>13} | load failed")
+            continue
+
+        # Warm-up
+        for img in images:
+            model(img, device=device, verbose=False)
+
+        latencies = []
+        for i in range(iterations):
+            img = images[i % len(images)]
+            start = time.perf_counter()
+            model(img, device=device, verbose=False)
+            latencies.append(time.perf_counter() - start)
+
+        latencies = np.array(latencies) * 1000
+        print(f"{name:>13} | mean {latencies.mean():8.1f} ms | "
+              f"p50 {np.percentile(latencies, 50):8.1f} ms | p99 {np.percentile(latencies, 99):8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
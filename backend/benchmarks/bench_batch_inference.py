@@ -0,0 +1,84 @@
+"""
+Benchmark : single-image inference vs BatchInferenceEngine
+
+Usage : AI_MODEL_URL=<model.pt> python -m benchmarks.bench_batch_inference [threads] [requests_per_thread]
+"""
+import os
+import sys
+import time
+import threading
+import numpy as np
+from PIL import Image
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_engine import get_model, BatchInferenceEngine
+
+
+def make_images(count, size=1024):
+    rng = np.random.default_rng(0)
+    return [Image.fromarray(rng.integers(0, 255, (size, size, 3), dtype=np.uint8))
+            for _ in range(count)]
+
+
+def run_load(infer, images, threads, requests_per_thread):
+    latencies = []
+    latencies_lock = threading.Lock()
+
+    def worker(worker_id):
+        local = []
+        for i in range(requests_per_thread):
+            img = images[(worker_id + i) % len(images)]
+            start = time.perf_counter()
+            infer(img)
+            local.append(time.perf_counter() - start)
+        with latencies_lock:
+            latencies.extend(local)
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'images_per_sec': len(latencies) / elapsed,
+        'p50_ms': float(np.percentile(latencies, 50)) * 1000,
+        'p99_ms': float(np.percentile(latencies, 99)) * 1000,
+    }
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    requests_per_thread = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    model, device = get_model(os.getenv('AI_MODEL_URL'))
+    if model is None:
+        sys.exit(1)
+
+    images = make_images(threads)
+
+    # Warm-up
+    model(images[0], exist_ok=True, device=device, verbose=False)
+
+    # 기존 경로 : 공유 모델에 이미지 1장씩 순차 추론
+    model_lock = threading.Lock()
+
+    def single(img):
+        with model_lock:
+            return model(img, exist_ok=True, device=device, verbose=False)
+
+    engine = BatchInferenceEngine(model, device,
+                                  max_batch_size=int(os.getenv('INFERENCE_MAX_BATCH_SIZE', 8)),
+                                  max_wait_ms=float(os.getenv('INFERENCE_MAX_WAIT_MS', 10)))
+
+    for name, infer in (('single', single), ('batched', engine)):
+        stats = run_load(infer, images, threads, requests_per_thread)
+        print(f"{name:>8} | {stats['images_per_sec']:8.2f} img/s | "
+              f"p50 {stats['p50_ms']:8.1f} ms | p99 {stats['p99_ms']:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark : outbound API call latency (new connection per call vs shared keep-alive pool)
+
+A local stub server answers with a small JSON body. Each new TCP connection is delayed by
+`setup_ms` to stand in for the TCP + TLS handshake to a remote API (KHOA / OpenWeather / Kakao).
+
+before : requests.get (new connection per call)
+after  : utils.http_client.http_get (pooled keep-alive session)
+
+Usage : python -m benchmarks.bench_http_client [calls] [setup_ms]
+"""
+import os
+import sys
+import socket
+import time
+import json
+import threading
+import statistics
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.http_client import http_get
+
+BODY = json.dumps({'result': {'data': [{'tide_level': 123}]}}).encode('utf-8')
+
+
+def make_handler(setup_ms):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive 지원
+
+        def setup(self):
+            super().setup()
+            # 헤더 / 본문 분할 전송 시 Nagle + delayed ACK 지연 방지
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # 연결마다 한 번 : 원격 API 핸드셰이크 지연 흉내
+            time.sleep(setup_ms / 1000)
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def log_message(self, *args):
+            pass
+
+    return StubHandler
+
+
+def measure(fetch, url, calls):
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        response = fetch(url, timeout=5)
+        response.raise_for_status()
+        response.json()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(name, latencies):
+    latencies = sorted(latencies)
+    print(f"{name:<28} mean {statistics.mean(latencies):7.2f} ms | "
+          f"p50 {latencies[len(latencies) // 2]:7.2f} ms | "
+          f"p95 {latencies[int(len(latencies) * 0.95) - 1]:7.2f} ms")
+    return statistics.mean(latencies)
+
+
+if __name__ == '__main__':
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    setup_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(setup_ms))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/oceangrid/tideObsRecent/search.do"
+
+    print(f"calls: {calls}, simulated connection setup: {setup_ms} ms")
+    before = report('requests.get (per call)', measure(requests.get, url, calls))
+    after = report('http_get (keep-alive pool)', measure(http_get, url, calls))
+    print(f"saved per call : {before - after:.2f} ms")
+
+    server.shutdown()
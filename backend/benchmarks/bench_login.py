@@ -0,0 +1,97 @@
+"""
+Benchmark : sustainable logins/sec at a fixed p99 latency per password-hash method
+
+Open-loop load : verify requests arrive at a fixed rate (independent of completions) and go
+through services.credentials.CredentialService, as /login does. The rate is raised step by
+step; the highest rate whose p99 stays within the target (with no rejected requests) is reported.
+
+Usage : python -m benchmarks.bench_login [p99_target_ms] [duration_s] [workers]
+"""
+import os
+import sys
+import time
+import threading
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from werkzeug.security import generate_password_hash
+from services.credentials import CredentialService, CredentialServiceBusy
+
+METHODS = ['scrypt:32768:8:1', 'scrypt:16384:8:1', 'pbkdf2:sha256:600000', 'pbkdf2:sha256:260000']
+PASSWORD = 'snapish-bench-password'
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def run_rate(service, password_hash, rate, duration):
+    """
+    Send `rate` logins/sec for `duration` seconds, return (p99 ms, rejected)
+    """
+    latencies = []
+    rejected = 0
+    lock = threading.Lock()
+
+    def login(arrived):
+        nonlocal rejected
+        try:
+            service.verify_password(password_hash, PASSWORD)
+        except CredentialServiceBusy:
+            with lock:
+                rejected += 1
+            return
+        with lock:
+            latencies.append((time.perf_counter() - arrived) * 1000)
+
+    # 요청 스레드 역할 (waitress 기본 스레드 수보다 넉넉하게)
+    with ThreadPoolExecutor(max_workers=64) as clients:
+        start = time.perf_counter()
+        for i in range(int(rate * duration)):
+            arrival = start + i / rate
+            delay = arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            clients.submit(login, arrival)
+
+    p99 = percentile(latencies, 0.99) if latencies else float('inf')
+    return p99, rejected
+
+
+def main():
+    p99_target = float(sys.argv[1]) if len(sys.argv) > 1 else 500
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else max(1, os.cpu_count() or 1)
+
+    print(f"p99 target : {p99_target:.0f} ms, duration : {duration:.0f} s / step, hash workers : {workers}")
+    for method in METHODS:
+        service = CredentialService(method, workers=workers, max_pending=64)
+        password_hash = generate_password_hash(PASSWORD, method=method)
+
+        # 단일 요청 해시 시간 기준으로 시작 부하 결정
+        samples = []
+        for _ in range(5):
+            started = time.perf_counter()
+            service.verify_password(password_hash, PASSWORD)
+            samples.append((time.perf_counter() - started) * 1000)
+        single_ms = statistics.median(samples)
+
+        best = 0.0
+        rate = max(0.5, 0.25 * workers * 1000 / single_ms)
+        while True:
+            p99, rejected = run_rate(service, password_hash, rate, duration)
+            ok = p99 <= p99_target and not rejected
+            print(f"  {method:<22} {rate:7.1f} req/s -> p99 {p99:8.1f} ms, rejected {rejected}{'' if ok else '  (over)'}")
+            if not ok:
+                break
+            best = rate
+            rate *= 1.25
+
+        print(f"{method:<24} single {single_ms:7.1f} ms | max logins/sec at p99 <= {p99_target:.0f} ms : {best:.1f}")
+
+
+if __name__ == '__main__':
+    main()
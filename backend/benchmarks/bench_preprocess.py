@@ -0,0 +1,96 @@
+"""
+Benchmark : /predict image preprocessing (per-request CPU time, peak memory)
+
+before : decode -> LANCZOS resize -> JPEG encode/decode round trip -> JPEG encode for storage
+after  : single decode (JPEG draft mode) -> resize -> single JPEG encode
+
+Usage : python -m benchmarks.bench_preprocess [iterations] [width] [height]
+"""
+import os
+import sys
+import time
+import resource
+import multiprocessing
+from io import BytesIO
+import numpy as np
+from PIL import Image
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.file_utils import decode_image, encode_image
+
+
+def make_upload(width, height):
+    rng = np.random.default_rng(0)
+    # 부드러운 그라디언트 + 노이즈 (실제 사진과 비슷한 압축률)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    base = np.stack([x + 0 * y, y + 0 * x, (x + y) / 2], axis=-1)
+    pixels = np.clip(base + rng.normal(0, 8, base.shape), 0, 255).astype(np.uint8)
+
+    buffer = BytesIO()
+    Image.fromarray(pixels).save(buffer, format='JPEG', quality=92)
+    return buffer.getvalue()
+
+
+def before(upload, max_size=1024):
+    image = Image.open(BytesIO(upload)).convert('RGB')
+
+    if max(image.size) > max_size:
+        ratio = max_size / max(image.size)
+        new_size = tuple(int(dim * ratio) for dim in image.size)
+        image = image.resize(new_size, Image.Resampling.LANCZOS)
+
+    buffer = BytesIO()
+    image.save(buffer, format='JPEG', quality=85, optimize=True)
+    buffer.seek(0)
+    image = Image.open(buffer)
+
+    model_input = np.asarray(image)
+
+    stored = BytesIO()
+    image.save(stored, format='JPEG')
+    return model_input, stored.getvalue()
+
+
+def after(upload, max_size=1024):
+    image = decode_image(BytesIO(upload), max_size)
+    model_input = np.asarray(image)
+    return model_input, encode_image(image)
+
+
+def run(name, iterations, upload, queue):
+    func = before if name == 'before' else after
+
+    func(upload)  # Warm-up
+    start = time.process_time()
+    for _ in range(iterations):
+        func(upload)
+    cpu_ms = (time.process_time() - start) / iterations * 1000
+
+    # ru_maxrss : Linux KB / macOS bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+    queue.put((name, cpu_ms, peak_mb))
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 4032
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 3024
+
+    upload = make_upload(width, height)
+    print(f"upload : {width}x{height} JPEG, {len(upload) / 1024:.0f} KB")
+
+    # 프로세스별 peak RSS 측정을 위해 각각 새 프로세스에서 실행
+    queue = multiprocessing.Queue()
+    for name in ('before', 'after'):
+        process = multiprocessing.Process(target=run, args=(name, iterations, upload, queue))
+        process.start()
+        process.join()
+        name, cpu_ms, peak_mb = queue.get()
+        print(f"{name:>6} | cpu {cpu_ms:8.1f} ms/request | peak rss {peak_mb:8.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -13,13 +13,123 @@ class BaseConfig(object):
     UPLOAD_FOLDER = 'uploads'
     AVATAR_UPLOAD_FOLDER = os.path.join(UPLOAD_FOLDER, 'avatars')
     
+    # Upload store - content hash 기반 저장 (디렉토리 분산 단계 수), 미참조 blob 삭제 유예 시간(초)
+    UPLOAD_SHARD_DEPTH = 2
+    UPLOAD_GC_GRACE_PERIOD = int(os.getenv('UPLOAD_GC_GRACE_PERIOD', 3600))
+    
+    # Upload derivatives - 첫 요청 시 생성 후 디스크 캐시 (UPLOAD_FOLDER 기준 폴더, 너비 목록, 인코딩 품질)
+    UPLOAD_VARIANT_FOLDER = 'variants'
+    UPLOAD_VARIANT_WIDTHS = (160, 480, 1024)
+    UPLOAD_VARIANT_QUALITY = 80
+    # 응답 URL에 사용하는 너비 (아바타, 피드 이미지, 인기 게시물 썸네일)
+    AVATAR_IMAGE_WIDTH = 160
+    FEED_IMAGE_WIDTH = 1024
+    THUMBNAIL_IMAGE_WIDTH = 160
+    
+    # Upload serving - 'direct' : Flask (wsgi.file_wrapper), 'x-sendfile' : Apache / lighttpd,
+    # 'x-accel' : nginx internal location (UPLOAD_ACCEL_PREFIX -> UPLOAD_FOLDER alias)
+    UPLOAD_SERVE_MODE = os.getenv('UPLOAD_SERVE_MODE', 'direct')
+    UPLOAD_ACCEL_PREFIX = os.getenv('UPLOAD_ACCEL_PREFIX', '/protected-uploads/')
+    USE_X_SENDFILE = UPLOAD_SERVE_MODE == 'x-sendfile'
+    UPLOAD_CACHE_MAX_AGE = 31536000  # 1년
+    UPLOAD_ETAG_CACHE_SIZE = 4096
+    
     # Client-allowed extension setup
     ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg'}
     
+    # Upload image setup (긴 변 기준 최대 크기, 저장 JPEG 품질)
+    IMAGE_MAX_SIZE = 1024
+    IMAGE_JPEG_QUALITY = 85
+    
+    # /predict 결과 저장 (이미지 / Catch / Assistant 요청) 백그라운드 처리 여부
+    # True : 추론 직후 응답, 저장 결과는 /predict/status/<job_id>로 조회
+    PREDICT_ASYNC_PERSISTENCE = os.getenv('PREDICT_ASYNC_PERSISTENCE', 'false').lower() == 'true'
+    PREDICT_JOB_WORKERS = int(os.getenv('PREDICT_JOB_WORKERS', 2))
+    PREDICT_JOB_QUEUE_SIZE = int(os.getenv('PREDICT_JOB_QUEUE_SIZE', 256))
+    PREDICT_JOB_SPOOL_FOLDER = os.path.join('spool', 'predict')
+    PREDICT_JOB_STATUS_SIZE = 4096
+    PREDICT_JOB_STATUS_TTL = 3600
+    # 처리 중 표시가 이 시간(초) 이상 갱신되지 않은 작업은 다른 워커가 재처리 (종료된 워커의 작업)
+    PREDICT_JOB_CLAIM_TIMEOUT = int(os.getenv('PREDICT_JOB_CLAIM_TIMEOUT', 120))
+    
+    # OpenAI Assistant run 결과 - 백그라운드 상태 확인 주기 / 제한 시간(초) / 전용 스레드 수, 결과 보관
+    ASSISTANT_POLL_INTERVAL = 0.5
+    ASSISTANT_POLL_WORKERS = 4
+    ASSISTANT_RUN_TIMEOUT = 60
+    ASSISTANT_RESULT_CACHE_SIZE = 4096
+    ASSISTANT_RESULT_TTL = 3600
+    
+    # 어종별 Assistant 답변 캐시 (ASSISTANT_PROMPT_VERSION 변경 시 전체 무효화, 미리 생성 : python warm_assistant_answers.py)
+    ASSISTANT_PROMPT_VERSION = os.getenv('ASSISTANT_PROMPT_VERSION', 'v1')
+    ASSISTANT_ANSWER_CACHE_SIZE = 256
+    ASSISTANT_ANSWER_TTL = int(os.getenv('ASSISTANT_ANSWER_TTL', 7 * 24 * 3600))
+    
+    # Community - 게시물 목록 페이지 크기 제한, 전체 게시물 수 캐시 시간(초)
+    POSTS_MAX_PER_PAGE = 50
+    POST_TOTAL_CACHE_TTL = 30
+    
+    # 해양 관측소 인덱스 - TidalObservations 테이블 변경 확인 주기(초)
+    TIDAL_INDEX_CHECK_INTERVAL = 300
+    
+    # 낚시터 공간 검색
+    SPOT_INDEX_CHECK_INTERVAL = 300
+    SPOTS_NEAREST_MAX = 100
+    SPOTS_MAX_RESULTS = 500
+    SPOTS_MAX_RADIUS_KM = 200
+    
+    # 외부 날씨 API 캐시 - 육상 날씨는 격자(도) 단위, 해양 관측은 관측소 + 날짜 단위
+    WEATHER_GRID_SIZE = 0.05
+    WEATHER_CACHE_SIZE = 4096
+    WEATHER_CACHE_TTL = 600
+    SEA_WEATHER_CACHE_SIZE = 1024
+    SEA_RECENT_CACHE_TTL = 300
+    SEA_PRETAB_CACHE_TTL = 3600
+    
+    # 외부 API HTTP 클라이언트 (keep-alive 연결 풀, timeout(초), 재시도)
+    HTTP_CONNECT_TIMEOUT = 3.05
+    HTTP_READ_TIMEOUT = 10
+    HTTP_RETRIES = 2
+    HTTP_RETRY_BACKOFF = 0.3
+    HTTP_POOL_CONNECTIONS = 10
+    HTTP_POOL_MAXSIZE = 20
+    HTTP_EXECUTOR_WORKERS = 8
+    
+    # /api/conditions source별 timeout(초)
+    CONDITIONS_LAND_TIMEOUT = 4
+    CONDITIONS_SEA_TIMEOUT = 6
+    CONDITIONS_TIDE_TIMEOUT = 1
+    
+    # 역지오코딩 (Kakao coord2regioncode) - 좌표 반올림 자릿수(3 : 약 100m), 캐시 / 오프라인 대체
+    GEOCODE_PRECISION = 3
+    GEOCODE_CACHE_SIZE = 20000
+    GEOCODE_CACHE_FILE = os.getenv('GEOCODE_CACHE_FILE')  # ex) cache/geocode.json (메모리 캐시일 때만 사용)
+    GEOCODE_SAVE_EVERY = 50
+    GEOCODE_LOCAL_RADIUS_M = 1000  # 이 거리 안에 낚시터 주소가 있으면 Kakao 호출 없이 응답
+    GEOCODE_FALLBACK_RADIUS_M = 30000  # Kakao 장애 시 낚시터 주소로 대체할 최대 거리
+    GEOCODE_TIMEOUT = (1, 2)
+    GEOCODE_OUTAGE_BACKOFF = 60  # Kakao 호출 실패 후 재시도까지 대기(초)
+    
+    # 인증 - 검증된 JWT claims / 사용자 정보 캐시 (토큰 캐시는 토큰 만료 시각을 넘지 않음)
+    AUTH_TOKEN_CACHE_SIZE = 10000
+    AUTH_TOKEN_CACHE_TTL = 300
+    AUTH_PRINCIPAL_CACHE_SIZE = 10000
+    AUTH_PRINCIPAL_TTL = 60
+    
+    # 비밀번호 해시 - 목표 해시 방식(로그인 성공 시 다른 방식의 해시는 재해시), 전용 스레드 수, 최대 대기 작업 수
+    # benchmarks/bench_login.py 결과로 p99 목표 내 처리량에 맞춰 조정
+    PASSWORD_HASH_METHOD = os.getenv('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', max(1, (os.cpu_count() or 2) // 2)))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', 64))
+    
     # Os environment
     SECRET_KEY = os.getenv('SECRET_KEY')
     DATABASE_URL = os.getenv('DATABASE_URL')
 
+    # Cache - Redis 연결 정보 (미설정 시 : 프로세스 내 LRU 캐시 사용)
+    REDIS_URL = os.getenv('REDIS_URL')
+    # Cache - /api/cache/stats 노출 여부 (내부 캐시 크기 / 적중률, 운영 확인 시에만 사용)
+    CACHE_STATS_ENABLED = os.getenv('CACHE_STATS_ENABLED', 'false').lower() == 'true'
+
     # Initialize directory : upload folder
     @staticmethod
     def init_app(app):
@@ -28,10 +138,42 @@ class BaseConfig(object):
         """
         os.makedirs(BaseConfig.UPLOAD_FOLDER, exist_ok=True)
         os.makedirs(BaseConfig.AVATAR_UPLOAD_FOLDER, exist_ok=True)
+        os.makedirs(BaseConfig.PREDICT_JOB_SPOOL_FOLDER, exist_ok=True)
         
     # AI model config
     os.environ["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"
     CONF_SCORE = 0.5
+
+    # AI model - Inference backend ('pytorch', 'onnx', 'openvino')
+    # onnx / openvino : 가중치 파일 옆에 export 결과를 캐시하고, export 시 pytorch 결과와 비교 검증
+    # INFERENCE_VERIFY_DIR : 검증용 물고기 이미지 폴더 (필수, 미설정 시 pytorch 백엔드 사용)
+    INFERENCE_BACKEND = os.getenv('INFERENCE_BACKEND', 'pytorch')
+    INFERENCE_VERIFY_DIR = os.getenv('INFERENCE_VERIFY_DIR')
+    INFERENCE_VERIFY_CONF_TOLERANCE = 0.05
+    INFERENCE_VERIFY_IOU = 0.9
+
+    # AI model - Inference precision ('fp32', 'int8' : onnx / openvino 백엔드 전용)
+    # int8 : 검증 데이터셋으로 정적 양자화 후 mAP50 하락폭이 허용치를 넘으면 사용하지 않음
+    INFERENCE_PRECISION = os.getenv('INFERENCE_PRECISION', 'fp32')
+    INFERENCE_INT8_DATA = os.getenv('INFERENCE_INT8_DATA')  # ex) data/validation/data.yaml (필수, 저장소에 포함되지 않음)
+    INFERENCE_INT8_CALIBRATION_SIZE = int(os.getenv('INFERENCE_INT8_CALIBRATION_SIZE', 300))
+    INFERENCE_INT8_MAX_MAP50_DRIFT = float(os.getenv('INFERENCE_INT8_MAX_MAP50_DRIFT', 0.02))
+
+    # AI model - Batch inference (INFERENCE_MAX_BATCH_SIZE=1 : 단일 이미지 추론)
+    INFERENCE_MAX_BATCH_SIZE = int(os.getenv('INFERENCE_MAX_BATCH_SIZE', 8))
+    INFERENCE_MAX_WAIT_MS = float(os.getenv('INFERENCE_MAX_WAIT_MS', 10))
+
+    # AI model - Detection cache (동일 이미지 재업로드 시 추론 생략)
+    DETECTION_CACHE_SIZE = int(os.getenv('DETECTION_CACHE_SIZE', 2048))
+    DETECTION_CACHE_TTL = int(os.getenv('DETECTION_CACHE_TTL', 7 * 24 * 3600))
+    DETECTION_CACHE_VERSION = os.getenv('DETECTION_CACHE_VERSION', os.path.basename(os.getenv('AI_MODEL_URL') or 'model'))
+
+    # AI model - Out-of-process model worker pool (MODEL_POOL_ADDRESS 미설정 시 : 웹 워커 내 모델 로드)
+    MODEL_POOL_ADDRESS = os.getenv('MODEL_POOL_ADDRESS')  # ex) /tmp/snapish-model.sock
+    MODEL_POOL_WORKERS = int(os.getenv('MODEL_POOL_WORKERS', 1))
+    MODEL_POOL_THREADS = int(os.getenv('MODEL_POOL_THREADS', 4))
+    MODEL_POOL_TIMEOUT = float(os.getenv('MODEL_POOL_TIMEOUT', 30))
+    MODEL_POOL_AUTHKEY = os.getenv('MODEL_POOL_AUTHKEY', SECRET_KEY)
     
     # AI model - Detect result label mapping
     LABELS_KOREAN = {
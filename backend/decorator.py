@@ -1,22 +1,20 @@
 from flask import request, jsonify
 from functools import wraps
-from config import BaseConfig
+from services.auth import verify_token, get_bearer_token
 import jwt
 
 def token_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = None
-
         # 헤더에서 토큰 가져오기
-        if 'Authorization' in request.headers:
-            token = request.headers['Authorization'].split(' ')[1]
+        token = get_bearer_token(request.headers)
 
         if not token:
             return jsonify({'message': '토큰이 필요합니다.'}), 401
 
         try:
-            data = jwt.decode(token, BaseConfig.SECRET_KEY, algorithms=['HS256'])
+            # 토큰별 검증 결과 캐시 (요청마다 HMAC 재검증하지 않음)
+            data = verify_token(token)
             user_id = data['user_id']
         except jwt.ExpiredSignatureError:
             return jsonify({'message': '토큰이 만료되었습니다.'}), 401
@@ -25,4 +23,4 @@ def token_required(f):
 
         # Pass user_id to the route
         return f(user_id, *args, **kwargs)
-    return decorated
\ No newline at end of file
+    return decorated
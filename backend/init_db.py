@@ -1,7 +1,10 @@
 import os
-from sqlalchemy import inspect
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateColumn
 from models import Base, engine
+from models.model import Session
 from services.initialize_db import insert_fishing_place_data, insert_tidal_data
+from services.community_feed import reconcile_post_counters
 
 
 def get_json_file_path(filename):
@@ -10,6 +13,23 @@ def get_json_file_path(filename):
     
     return json_file_path
 
+def add_missing_columns(inspector):
+    """
+    Add model columns that do not exist yet on already-created tables
+    """
+    preparer = engine.dialect.identifier_preparer
+    
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing_columns:
+                    column_ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                    conn.execute(text(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {column_ddl}"))
+                    print(f"Added column {table.name}.{column.name}")
+
 def init_db():
     inspector = inspect(engine)
     tables = inspector.get_table_names()
@@ -17,6 +37,12 @@ def init_db():
     if tables:
         print("✅ Database already initialized.")
         
+        # 기존 테이블에 추가된 컬럼 / 인덱스 생성
+        add_missing_columns(inspector)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
+        
     else:
         Base.metadata.create_all(engine)
         print("✅ Database tables created successfully.")
@@ -27,6 +53,13 @@ def init_db():
     
     insert_fishing_place_data(fishing_place_json_file_path)
     insert_tidal_data(tidal_json_file_path)
+    
+    # 게시물 좋아요 / 댓글 수 컬럼 보정
+    session = Session()
+    try:
+        print(f"Reconciled post counters : {reconcile_post_counters(session)} posts")
+    finally:
+        session.close()
         
     print("Done")
         
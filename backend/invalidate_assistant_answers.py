@@ -0,0 +1,22 @@
+import sys
+
+from utils.cache import get_redis_client
+from services.assistant_answers import invalidate_answers
+
+
+def invalidate_assistant_answers(label=None):
+    """
+    Drop cached per-species assistant answers (shared Redis cache)
+
+    Without REDIS_URL each web process keeps its own cache : bump ASSISTANT_PROMPT_VERSION instead.
+    """
+    if get_redis_client() is None:
+        print("REDIS_URL is not set : change ASSISTANT_PROMPT_VERSION and restart to invalidate answers")
+        return
+
+    invalidate_answers(label)
+    print(f"Invalidated assistant answers : {label or 'all labels'}")
+
+
+if __name__ == "__main__":
+    invalidate_assistant_answers(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,105 @@
+import os
+import sys
+
+from models.model import Session, Catch, CommunicationBoard, User
+from services.upload_store import upload_store, key_from_url, get_extension
+from services.upload_variants import upload_variants
+
+
+def _migrate_key(key, migrated, missing, dry_run=False):
+    """
+    Content-addressed key for a legacy key (stores the file once), None if not migratable
+
+    Legacy keys : uuid file names.
+    """
+    if not key or upload_store.is_blob_key(key) or '..' in key.split('/'):
+        return None
+    if key not in migrated:
+        path = upload_store.path(key)
+        if not os.path.isfile(path):
+            missing.add(key)
+            return None
+        with open(path, 'rb') as f:
+            data = f.read()
+        migrated[key] = upload_store.key_for_data(data, get_extension(key))
+        if not dry_run:
+            upload_store.write(migrated[key], data)
+    return migrated[key]
+
+
+def migrate_uploads(dry_run=False):
+    """
+    Move legacy uuid-named uploads into the content-addressed store and rewrite their references
+
+    Old files are deleted only after the new references are committed.
+    """
+    session = Session()
+    migrated = {}
+    missing = set()
+    updated = 0
+    try:
+        for catch in session.query(Catch).filter(Catch.photo_url.isnot(None)):
+            new_key = _migrate_key(key_from_url(catch.photo_url), migrated, missing, dry_run)
+            if new_key:
+                catch.photo_url = new_key
+                updated += 1
+
+        for user in session.query(User).filter(User.avatar.isnot(None)):
+            new_key = _migrate_key(key_from_url(user.avatar), migrated, missing, dry_run)
+            if new_key:
+                user.avatar = upload_store.url(new_key)
+                updated += 1
+
+        for post in session.query(CommunicationBoard):
+            images = []
+            for image in post.images or []:
+                new_key = _migrate_key(key_from_url(image), migrated, missing, dry_run)
+                images.append(upload_store.url(new_key) if new_key else image)
+            if images != (post.images or []):
+                # JSON 컬럼은 새 리스트를 할당해야 변경으로 인식
+                post.images = images
+                updated += 1
+
+        if dry_run:
+            session.rollback()
+        else:
+            session.commit()
+            for key in migrated:
+                upload_store.delete(key)
+
+        print(f"Migrated uploads : {len(migrated)} files, {updated} rows"
+              f"{' (dry run)' if dry_run else ''}, {len(missing)} missing files")
+    except Exception as e:
+        session.rollback()
+        print(f"Error migrating uploads : {e}")
+    finally:
+        session.close()
+
+
+def collect_upload_garbage(dry_run=False):
+    """
+    Delete stored blobs no longer referenced by catches, posts or avatars, then their derivatives
+    (run periodically, e.g. cron)
+    """
+    session = Session()
+    try:
+        orphans = upload_store.collect_garbage(session, dry_run=dry_run)
+        print(f"Orphaned uploads : {len(orphans)} {'found (dry run)' if dry_run else 'deleted'}")
+        variants = upload_variants.collect_garbage(dry_run=dry_run)
+        print(f"Orphaned derivatives : {len(variants)} {'found (dry run)' if dry_run else 'deleted'}")
+    except Exception as e:
+        print(f"Error collecting upload garbage : {e}")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    # Usage : python manage_uploads.py [migrate | gc] [--dry-run]
+    command = sys.argv[1] if len(sys.argv) > 1 else 'gc'
+    dry_run = '--dry-run' in sys.argv
+    if command == 'migrate':
+        migrate_uploads(dry_run)
+    elif command == 'gc':
+        collect_upload_garbage(dry_run)
+    else:
+        print("Usage : python manage_uploads.py [migrate | gc] [--dry-run]")
@@ -0,0 +1,246 @@
+import os
+import sys
+import time
+import errno
+import atexit
+import socket
+import struct
+import threading
+import multiprocessing
+import numpy as np
+from multiprocessing import resource_tracker
+from multiprocessing.connection import Listener, Connection, wait, answer_challenge, deliver_challenge
+from multiprocessing.shared_memory import SharedMemory
+
+from config import BaseConfig
+
+# NOTE : 이 모듈은 torch / ultralytics를 import 하지 않음
+# (웹 워커는 ModelPoolClient만 사용하여 모델 가중치 없이 가볍게 유지)
+
+
+def _authkey():
+    return (BaseConfig.MODEL_POOL_AUTHKEY or '').encode('utf-8')
+
+
+def _connect(address, authkey, timeout):
+    """
+    `multiprocessing.connection.Client` with a deadline on connect and the authkey handshake
+    """
+    sock = socket.socket(socket.AF_UNIX)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(address)
+        # Connection은 blocking fd를 os.read 하므로 settimeout 대신 SO_RCVTIMEO / SO_SNDTIMEO 사용
+        sock.setblocking(True)
+        seconds = int(timeout)
+        interval = struct.pack('ll', seconds, int((timeout - seconds) * 1e6))
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, interval)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDTIMEO, interval)
+        conn = Connection(sock.detach())
+    except socket.timeout:
+        sock.close()
+        raise TimeoutError("Model pool did not accept the connection within the timeout period.")
+    except BaseException:
+        sock.close()
+        raise
+
+    try:
+        answer_challenge(conn, authkey)
+        deliver_challenge(conn, authkey)
+    except OSError as e:
+        conn.close()
+        if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+            raise TimeoutError("Model pool handshake did not finish within the timeout period.")
+        raise
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+class ModelPoolClient:
+    """
+    Send decoded RGB frames to the model worker pool through shared memory
+    """
+    def __init__(self, address, authkey=None, timeout=30):
+        self.address = address
+        self.authkey = authkey if authkey is not None else _authkey()
+        self.timeout = timeout
+
+        # 스레드별 공유 메모리 버퍼 재사용 (요청마다 생성/삭제하지 않음)
+        self._local = threading.local()
+        self._buffers = []
+        self._buffers_lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _buffer(self, nbytes):
+        shm = getattr(self._local, 'shm', None)
+        if shm is not None and shm.size >= nbytes:
+            return shm
+
+        if shm is not None:
+            self._release(shm)
+
+        shm = SharedMemory(create=True, size=nbytes)
+        self._local.shm = shm
+        with self._buffers_lock:
+            self._buffers.append(shm)
+        return shm
+
+    def _release(self, shm):
+        with self._buffers_lock:
+            if shm in self._buffers:
+                self._buffers.remove(shm)
+        try:
+            shm.close()
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __call__(self, image):
+        """
+        Run inference for one image and return [detection array] (see `ai_engine.to_detection_array`)
+        """
+        frame = np.asarray(image, dtype=np.uint8)
+        if frame.ndim != 3 or frame.shape[2] != 3:
+            raise ValueError(f"RGB 이미지만 지원합니다: {frame.shape}")
+
+        shm = self._buffer(frame.nbytes)
+        np.ndarray(frame.shape, dtype=np.uint8, buffer=shm.buf)[:] = frame
+
+        with _connect(self.address, self.authkey, self.timeout) as conn:
+            conn.send((shm.name, frame.shape))
+            if not conn.poll(self.timeout):
+                raise TimeoutError("Model pool did not respond within the timeout period.")
+            status, payload = conn.recv()
+
+        if status != 'ok':
+            raise RuntimeError(f"Model pool error: {payload}")
+        return [payload]
+
+    def close(self):
+        with self._buffers_lock:
+            buffers, self._buffers = self._buffers, []
+        for shm in buffers:
+            try:
+                shm.close()
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _read_frame(shm_name, shape):
+    """
+    Copy the RGB frame out of shared memory as a BGR array (YOLO numpy input format)
+    """
+    shm = SharedMemory(name=shm_name)
+    # 생성한 쪽(웹 워커)이 unlink 하므로 이 프로세스의 resource tracker에서는 제외
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    try:
+        view = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        frame = np.ascontiguousarray(view[..., ::-1])
+        del view
+    finally:
+        shm.close()
+    return frame
+
+
+def _serve_connections(listener, engine):
+    while True:
+        try:
+            conn = listener.accept()
+        except Exception as e:
+            print(f"model_pool : accept failed on {e}")
+            continue
+
+        with conn:
+            try:
+                shm_name, shape = conn.recv()
+                frame = _read_frame(shm_name, shape)
+                conn.send(('ok', engine(frame)[0]))
+            except Exception as e:
+                try:
+                    conn.send(('error', str(e)))
+                except Exception:
+                    pass
+
+
+def _worker_main(listener, model_url, threads):
+    # 모델은 프로세스마다 한 번만 로드
+    import torch
+    from ai_engine import get_model, BatchInferenceEngine
+
+    # 프로세스 수만큼 CPU 코어를 나누어 사용 (oversubscription 방지)
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // max(1, BaseConfig.MODEL_POOL_WORKERS)))
+
+    model, device = get_model(model_url)
+    if model is None:
+        sys.exit(1)
+
+    engine = BatchInferenceEngine(model, device,
+                                  max_batch_size=BaseConfig.INFERENCE_MAX_BATCH_SIZE,
+                                  max_wait_ms=BaseConfig.INFERENCE_MAX_WAIT_MS)
+
+    handlers = [threading.Thread(target=_serve_connections, args=(listener, engine), daemon=True)
+                for _ in range(max(1, threads))]
+    for handler in handlers:
+        handler.start()
+    for handler in handlers:
+        handler.join()
+
+
+def _start_worker(context, listener, model_url, threads, index):
+    process = context.Process(target=_worker_main,
+                              args=(listener, model_url, threads),
+                              name=f'model-pool-{index}')
+    process.start()
+    return process
+
+
+def serve_model_pool(model_url, address, workers, threads=4):
+    """
+    Start `workers` model-owning processes accepting inference requests on a unix socket
+
+    Workers that die are restarted. If a worker cannot load the model (exit code 1)
+    the whole pool exits non-zero so the process supervisor sees the failure.
+    """
+    if os.path.exists(address):
+        os.remove(address)
+
+    listener = Listener(address, family='AF_UNIX', authkey=_authkey())
+    print(f"Model pool listening on {address} (workers: {workers}, threads: {threads})")
+
+    # fork : 모든 워커가 같은 listener 소켓에서 accept (유휴 워커가 요청을 가져감)
+    context = multiprocessing.get_context('fork')
+    processes = [_start_worker(context, listener, model_url, threads, i) for i in range(workers)]
+
+    try:
+        while True:
+            # 종료된 워커가 생길 때까지 대기
+            wait([process.sentinel for process in processes])
+            for i, process in enumerate(processes):
+                if process.is_alive():
+                    continue
+                process.join()
+                if process.exitcode == 1:
+                    print(f"model_pool : {process.name} failed to load the model, shutting down")
+                    sys.exit(1)
+
+                print(f"model_pool : {process.name} exited with {process.exitcode}, restarting")
+                # 즉시 재시작 반복(crash loop) 방지
+                time.sleep(1)
+                processes[i] = _start_worker(context, listener, model_url, threads, i)
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+        listener.close()
+
+
+if __name__ == '__main__':
+    serve_model_pool(os.getenv('AI_MODEL_URL'),
+                     BaseConfig.MODEL_POOL_ADDRESS,
+                     BaseConfig.MODEL_POOL_WORKERS,
+                     BaseConfig.MODEL_POOL_THREADS)
@@ -1,6 +1,6 @@
 from sqlalchemy import (
                     create_engine, Column, Integer, String, DateTime, ForeignKey, 
-                    Enum, Boolean, Text, DECIMAL, JSON, Float, VARCHAR, 
+                    Enum, Boolean, Text, DECIMAL, JSON, Float, VARCHAR, Index,
                     )
 from sqlalchemy.orm import relationship, sessionmaker, scoped_session, declarative_base
 
@@ -140,6 +140,8 @@ class CommunicationBoard(Base):
     title = Column(String(255))
     content = Column(Text)
     images = Column(JSON, default=list)  # Store multiple image URLs as JSON array
+    likes_count = Column(Integer, nullable=False, default=0, server_default='0')  # 좋아요 수 (PostLikes 집계값)
+    comments_count = Column(Integer, nullable=False, default=0, server_default='0')  # 댓글 수 (PostComments 집계값)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -148,6 +150,12 @@ class CommunicationBoard(Base):
     comments = relationship('PostComment', back_populates='post', cascade='all, delete')
     retweets = relationship('PostRetweet', back_populates='post', cascade='all, delete')
 
+    # 게시물 목록 정렬 / keyset pagination, 인기 게시물 정렬 용 복합 인덱스
+    __table_args__ = (
+        Index('ix_CommunicationBoard_created_at_post_id', 'created_at', 'post_id'),
+        Index('ix_CommunicationBoard_likes_count_created_at', 'likes_count', 'created_at'),
+    )
+
 
 class PostLike(Base):
     __tablename__ = 'PostLikes'
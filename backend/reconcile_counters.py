@@ -0,0 +1,21 @@
+from models.model import Session
+from services.community_feed import reconcile_post_counters
+
+
+def reconcile_counters():
+    """
+    Repair drift of CommunicationBoard like / comment counters (run periodically, e.g. cron)
+    """
+    session = Session()
+    try:
+        fixed = reconcile_post_counters(session)
+        print(f"Reconciled post counters : {fixed} posts")
+    except Exception as e:
+        session.rollback()
+        print(f"Error reconciling post counters : {e}")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    reconcile_counters()
@@ -1,30 +1,46 @@
 from datetime import datetime, timedelta, timezone
-from werkzeug.utils import secure_filename
-from PIL import Image
-from werkzeug.security import generate_password_hash, check_password_hash
-from flask import Flask, request, jsonify, send_from_directory, current_app
-from sqlalchemy import text, func
-import os
+from flask import Flask, Response, request, jsonify, send_from_directory, current_app
+from sqlalchemy import text
+import mimetypes
 import logging
 import base64
-import uuid
 import jwt
 import io
 import requests
 
 from config import BaseConfig
 from decorator import token_required
+from services.auth import get_user_principal, invalidate_user_principal
+from services.credentials import credentials, find_user_conflicts, CredentialServiceBusy
+from services.upload_store import upload_store
+from services.upload_variants import upload_variants, negotiate_format
+from services.upload_serving import get_upload_etag, is_content_addressed
 from services.weather_service import get_sea_weather_by_seapostid, get_weather_by_coordinates
-from services.lunar_tide_cycle_info import get_tide_cycle, calculate_moon_phase
-from services.openai_assistant import assistant_talk_request, assistant_talk_get
-from utils import allowed_file, optimize_image, get_full_url, success_response, error_response, custom_sort_key
+from services.lunar_tide_cycle_info import get_tide_info, get_tide_calendar
+from services.assistant_runs import assistant_runs, RUN_PENDING, RUN_COMPLETED, RUN_EMPTY, RUN_TIMEOUT
+from services.community_feed import query_feed_posts, after_cursor, encode_cursor, get_total_posts, invalidate_total_posts
+from services.predict_jobs import predict_jobs, create_predict_job, JOB_NOT_FOUND
+from services.detection_cache import get_image_digest, get_cached_detections, set_cached_detections
+from services.conditions_service import conditions_fetcher
+from services.fishing_spots import get_fishing_spot_index
+from services.tidal_stations import get_tidal_station_index, OBSRECENT_REQUIRED, OBSPRETAB_REQUIRED, OBSPRETAB_EXCLUDED
+from utils import allowed_file, decode_image, encode_image, get_full_url, success_response, error_response, custom_sort_key, cache_stats
 
 from models.model import (
     Session,
     User, Catch, AIConsent, CommunicationBoard, PostLike,
-    PostComment, FishingPlace, TidalObservation
+    PostComment, FishingPlace
 )
 
+def busy_response():
+    # 비밀번호 해시 대기열 초과 : 잠시 후 재시도
+    response, status_code = error_response("요청이 많아 잠시 후 다시 시도해주세요.",
+                                           "Service Unavailable",
+                                           503)
+    response.headers['Retry-After'] = '1'
+    return response, status_code
+
+
 def set_route(app: Flask, model, device):
     # Base Page
     @app.route('/')
@@ -47,15 +63,8 @@ def set_route(app: Flask, model, device):
                                 400)
 
         try:
-            lunar_date, seohae, other = get_tide_cycle(parsed_date)
-            moon_phase = calculate_moon_phase(parsed_date)
-            
-            json_result = {
-                "lunar_date": lunar_date,
-                "seohae": seohae,
-                "other": other,
-                "moon_phase": moon_phase,
-            }
+            # 사전 계산된 물때 달력 조회
+            json_result = get_tide_info(parsed_date)
             return success_response("요청이 성공적으로 처리되었습니다.",
                                     json_result)
 
@@ -65,6 +74,35 @@ def set_route(app: Flask, model, device):
                                   500)
         
 
+    # 달력 화면용 물때 정보 (월 / 연 단위)
+    @app.route('/api/tide-cycles/calendar', methods=['GET'])
+    def get_tide_cycles_calendar():
+        try:
+            year = int(request.args['year'])
+            month = request.args.get('month')
+            month = int(month) if month else None
+            if month is not None and not 1 <= month <= 12:
+                raise ValueError(month)
+        except (KeyError, ValueError):
+            return error_response("'year' (및 선택적으로 'month') 파라미터가 필요합니다.",
+                                "Bad Request",
+                                400)
+
+        tide_calendar = get_tide_calendar()
+        if not tide_calendar.start.year <= year <= tide_calendar.end.year:
+            return error_response(f"{tide_calendar.start.year}~{tide_calendar.end.year}년만 지원합니다.",
+                                "Bad Request",
+                                400)
+
+        try:
+            days = tide_calendar.get_month(year, month) if month else tide_calendar.get_year(year)
+            return success_response("요청이 성공적으로 처리되었습니다.",
+                                    days)
+        except Exception as e:
+            return error_response("요청 진행 중 오류가 발생하였습니다.",
+                                  "Internal server error",
+                                  500)
+
     @app.route('/signup', methods=['POST', 'GET'])
     def signup():
         data = request.get_json()
@@ -85,8 +123,8 @@ def set_route(app: Flask, model, device):
                 
             session = Session()
             
-            existing_user_by_username = session.query(User).filter(User.username == username).first()
-            existing_user_by_email = session.query(User).filter(User.email == email).first()
+            # 아이디 / 이메일 중복 여부를 한 번의 쿼리로 확인
+            existing_user_by_username, existing_user_by_email = find_user_conflicts(session, username, email)
 
             if existing_user_by_username and existing_user_by_email:
                 return error_response("이미 가입된 유저입니다.", "Conflicted : Username and Email already exist", 409)
@@ -95,7 +133,8 @@ def set_route(app: Flask, model, device):
             elif existing_user_by_email:
                 return error_response("이미 가입된 이메일입니다.", "Conflicted : Email already exists", 409)
 
-            hashed_password = generate_password_hash(password)
+            # 해시 계산은 전용 executor에서 수행
+            hashed_password = credentials.hash_password(password)
             new_user = User(
                 username=username,
                 email=email,
@@ -109,6 +148,9 @@ def set_route(app: Flask, model, device):
             return success_response("요청이 성공적으로 처리되었습니다.",
                                     None,
                                     201)
+        except CredentialServiceBusy:
+            session.rollback()
+            return busy_response()
         except Exception as e:
             session.rollback()
             return error_response("서버 오류", 
@@ -133,7 +175,11 @@ def set_route(app: Flask, model, device):
         try:
             user = session.query(User).filter_by(username=username).first()
 
-            if user and check_password_hash(user.password_hash, password):
+            if user and credentials.verify_password(user.password_hash, password):
+                # 이전 방식 / 비용의 해시는 백그라운드에서 현재 설정으로 재해시
+                if credentials.needs_rehash(user.password_hash):
+                    credentials.rehash_in_background(user.user_id, user.password_hash, password)
+
                 # 토큰 생성
                 payload = {
                     'user_id': user.user_id,
@@ -156,6 +202,8 @@ def set_route(app: Flask, model, device):
                 return error_response("로그인 실패 : 잘못된 아이디나 비밀번호입니다.",
                                       "Unauthorized",
                                       401)
+        except CredentialServiceBusy:
+            return busy_response()
         except Exception as e:
             return error_response("요청 진행 중 오류가 발생하였습니다.",
                                 'Internal Server Error', 
@@ -183,49 +231,47 @@ def set_route(app: Flask, model, device):
                                           "Unsupported Media Type",
                                           415)               
                 try:
-                    img = Image.open(file.stream).convert('RGB')
+                    # 업로드 이미지 1회 디코딩 (JPEG draft 축소 디코딩, 최대 크기 내로 리사이즈)
+                    img = decode_image(file.stream, current_app.config["IMAGE_MAX_SIZE"])
                 except Exception as e:
                     return error_response("요청 파일을 처리할 수 없습니다",
                                           "Bad Request",
                                           400)
 
-            # 이미지 최적화
-            try:
-                img = optimize_image(img)
-            except:
-                return error_response("요청 파일을 처리할 수 없습니다",
-                                    "Bad Request",
-                                    400)
+            # 동일 이미지 재업로드 시 캐시된 검출 결과 사용 (추론 생략)
+            image_digest = get_image_digest(img)
+            cached = get_cached_detections(image_digest)
 
-            results = model(img, exist_ok=True, device=device)
-            detections = []
-            
-            with app.app_context():
-                for result in results:  # Iterate over results
-                    for cls, conf, bbox in zip(result.boxes.cls, result.boxes.conf, result.boxes.xyxy):
-                        if float(conf) > current_app.config["CONF_SCORE"]:
-                            detections.append({
-                                'label': current_app.config["LABELS_KOREAN"].get(int(cls), '알 수 없는 라벨'),
-                                'confidence': float(conf),
-                                'prohibited_dates': current_app.config["PROHIBITED_DATES"].get(
-                                                    current_app.config["LABELS_KOREAN"].get(int(cls), ''), ''),
-                                'bbox': bbox.tolist()
-                            })
-                        
-            detections.sort(key=lambda x: x['confidence'], reverse=True)
+            image_key = None
+            if cached:
+                detections = cached['detections']
+                box_count = cached['box_count']
+                # 이전에 저장한 같은 이미지의 blob key (인코딩 / 해시 생략)
+                image_key = cached.get('image_key')
+            else:
+                # 동시 요청은 BatchInferenceEngine 내에서 하나의 batch로 묶여 추론
+                results = model(img)
+                detections = []
+                
+                with app.app_context():
+                    for result in results:  # Iterate over results : (n, 6) x1, y1, x2, y2, conf, cls
+                        for *bbox, conf, cls in result.tolist():
+                            if float(conf) > current_app.config["CONF_SCORE"]:
+                                detections.append({
+                                    'label': current_app.config["LABELS_KOREAN"].get(int(cls), '알 수 없는 라벨'),
+                                    'confidence': float(conf),
+                                    'prohibited_dates': current_app.config["PROHIBITED_DATES"].get(
+                                                        current_app.config["LABELS_KOREAN"].get(int(cls), ''), ''),
+                                    'bbox': bbox
+                                })
+                            
+                detections.sort(key=lambda x: x['confidence'], reverse=True)
+                box_count = len(results[0])
+                set_cached_detections(image_digest, detections, box_count)
             
             # 검출 여부에 따라 if-else
-            if detections:
-                top_fish = detections[0]['label']
-                try:
-                    assistant_request_id = assistant_talk_request(f"{top_fish}")
-                
-                except Exception as e:
-                    print(f"assistant_request_id 호출 실패 : {e}")
-                    assistant_request_id = None
-
-            else:
-                if not results[0].boxes.cls.size(0) :
+            if not detections:
+                if not box_count:
                     return error_response("물고기를 감지할 수 없습니다.",
                                           "Unprocessable Entity",
                                           422)
@@ -234,144 +280,146 @@ def set_route(app: Flask, model, device):
                                           "No content",
                                           204)
 
-            # 결과 DB 저장
-            session = Session()
-            
-            # 토큰 확인
-            token = request.headers.get('Authorization')
-            if token:
-                token = token.split(' ')[1]
-                try:
-                    data = jwt.decode(token, current_app.config["SECRET_KEY"], algorithms=['HS256'])
-                    user_id = data['user_id']
-                    current_user = session.query(User).filter_by(user_id=user_id).first()
-                except:
-                    current_user = None
-            else:
-                current_user = None
+            # 토큰은 token_required에서 검증됨 : 캐시된 사용자 정보로 확인
+            current_user = get_user_principal(user_id)
 
             if current_user:
                 # Check if catchId is provided in the request
                 catch_id = request.args.get('catchId')
+
+                # 저장용 JPEG 인코딩은 저장할 때만, 같은 이미지의 blob이 이미 있으면 생략
+                if image_key and upload_store.touch(image_key):
+                    filename = image_key
+                    encoded_image = None
+                else:
+                    encoded_image = encode_image(img, current_app.config["IMAGE_JPEG_QUALITY"])
+                    # 저장 key : 저장할 JPEG의 sha256 (게시물 / 아바타와 같은 방식, 같은 이미지는 한 번만 저장)
+                    filename = upload_store.key_for_data(encoded_image, 'jpg')
+                    set_cached_detections(image_digest, detections, box_count, filename)
                 
-                if not catch_id:
-                    # Save new catch
-                    filename = secure_filename(f"{uuid.uuid4().hex}.jpg")
-                    file_path = os.path.join(current_app.config["UPLOAD_FOLDER"], filename)
-                    img.save(file_path, format='JPEG')
-
-                    new_catch = Catch(
-                        user_id=current_user.user_id,
-                        photo_url=filename,
-                        detect_data=detections,
-                        catch_date=datetime.now()
-                    )
-                    session.add(new_catch)
-                    session.commit()
+                # 이미지 저장, Catch 저장 / 수정, Assistant 답변 요청
+                job = create_predict_job(current_user['user_id'], catch_id, filename, detections)
+                
+                if current_app.config["PREDICT_ASYNC_PERSISTENCE"]:
+                    # 검출 결과 즉시 응답, 저장 결과는 /predict/status/<job_id>로 조회
                     response_data = {
-                        'id': new_catch.catch_id,
+                        'id': None,
+                        'job_id': predict_jobs.submit(job, encoded_image),
                         'detections': detections,
                         'imageUrl': filename,
-                        'assistant_request_id': assistant_request_id
+                        'assistant_request_id': None,
+                        'assistant_answer': None
                     }
                     return success_response("요청이 성공적으로 처리되었습니다",
                                             response_data)
-                    
-                else:
-                    # Update existing catch
-                    catch_result = session.query(Catch).filter_by(catch_id=catch_id, user_id=current_user.user_id).first()
-                    if catch_result:
-                        catch_result.detect_data = detections
-                        catch_result.photo_url = filename
-                        catch_result.catch_date = datetime.now()
-                        session.commit()
-                        response_data = {
-                            'id': catch_result.catch_id,
-                            'detections': detections,
-                            'imageUrl': filename
-                        }
-                        return success_response("요청이 성공적으로 처리되었습니다",
-                                                response_data)
-                    else:
-                        return error_response("요청한 정보를 찾을 수 없습니다.",
-                                              "Not found : existed catch_id",
-                                              404)
+                
+                job_status = predict_jobs.run(job, encoded_image)
+                if job_status['status'] == JOB_NOT_FOUND:
+                    return error_response("요청한 정보를 찾을 수 없습니다.",
+                                          "Not found : existed catch_id",
+                                          404)
+                
+                response_data = {
+                    'id': job_status['catch_id'],
+                    'detections': detections,
+                    'imageUrl': filename,
+                    'assistant_request_id': job_status['assistant_request_id'],
+                    # 어종별 캐시된 답변이 있으면 바로 전달 (이 경우 assistant_request_id는 None)
+                    'assistant_answer': job_status['assistant_answer']
+                }
+                return success_response("요청이 성공적으로 처리되었습니다",
+                                        response_data)
             else:
                 raise Exception("토큰이 필요합니다.", 
                                 400)
 
         except Exception as e:
-            session.rollback()
             return error_response("요청 진행 중 오류가 발생하였습니다.",
                                   "Internal Server Error",
                                   500)
-        finally:
-            session.close()
             
         
+    @app.route('/predict/status/<job_id>', methods=['GET'])
+    @token_required
+    def predict_status(user_id, job_id):
+        job_status = predict_jobs.get_status(job_id)
+        if not job_status or job_status['user_id'] != user_id:
+            return error_response("요청한 정보를 찾을 수 없습니다.",
+                                  "Not Found",
+                                  404)
+        
+        return success_response("요청이 성공적으로 처리되었습니다.",
+                                {key: value for key, value in job_status.items() if key != 'user_id'})
+        
+
     @app.route('/predict/chat', methods=['POST'])
     def assistant_talk_result():
         thread_id = request.form.get('thread_id')
         run_id = request.form.get('run_id')
-        
-        print(thread_id, run_id)
-        
+
+        if not thread_id or not run_id:
+            return error_response("thread_id, run_id가 필요합니다.",
+                                  "Bad Request",
+                                  400)
+
         try:
-            formatted_text = assistant_talk_get(thread_id, run_id)
-            
-            print(formatted_text)
-            
-            if not formatted_text:
-                return error_response("생성된 답변이 없습니다",
-                                      "Not Found",
-                                      404)
-                
-            return success_response("요청을 성공적으로 처리하였습니다",
-                                    formatted_text)
-                        
-        except TimeoutError:
-            return error_response("요청 시간이 초과되었습니다.",
-                                "TimeOut",
-                                408)
+            # 백그라운드 tracker에 등록 후 현재 결과만 확인 (요청 스레드에서 대기하지 않음)
+            result = assistant_runs.track(thread_id, run_id)
         except Exception as e:
             return error_response("요청 진행 중 오류가 발생하였습니다.",
                                   "Internal server error",
                                   500)
 
+        if result['status'] == RUN_PENDING:
+            response, status_code = success_response("답변을 생성 중입니다.",
+                                                     {'status': RUN_PENDING},
+                                                     202)
+            response.headers['Retry-After'] = '1'
+            return response, status_code
+        if result['status'] == RUN_COMPLETED:
+            return success_response("요청을 성공적으로 처리하였습니다",
+                                    result['text'])
+        if result['status'] == RUN_EMPTY:
+            return error_response("생성된 답변이 없습니다",
+                                  "Not Found",
+                                  404)
+        if result['status'] == RUN_TIMEOUT:
+            return error_response("요청 시간이 초과되었습니다.",
+                                "TimeOut",
+                                408)
+        return error_response("요청 진행 중 오류가 발생하였습니다.",
+                              "Internal server error",
+                              500)
+
     @app.route('/profile', methods=['GET', 'PUT'])
     @token_required
     def profile(user_id):
+        # 로그인 이후 Profile 표시 시, 사용 (캐시된 사용자 정보, DB 조회 없음)
+        if request.method == 'GET':
+            try:
+                user_data = get_user_principal(user_id)
+            except Exception as e:
+                return error_response(f"서버 오류: {str(e)}", 500)
+
+            # TO-DO : Add login route
+            if not user_data:
+                return error_response("현재 세션에 로그인된 유저를 찾을 수 없습니다.",
+                                      "Not Found",
+                                      404)
+            return success_response("요청이 성공적으로 처리되었습니다.",
+                                    user_data)
+
         session = Session()
         current_user = session.query(User).filter_by(user_id=user_id).first()
         
-        # TO-DO : Add login route
         if not current_user:
             session.close()
             return error_response("현재 세션에 로그인된 유저를 찾을 수 없습니다.",
                                   "Not Found",
                                   404)
-
-        # 로그인 이후 Profile 표시 시, 사용
-        if request.method == 'GET':
-            try:
-                user_data = {
-                    'user_id': current_user.user_id,
-                    'username': current_user.username,
-                    'email': current_user.email,
-                    'full_name': current_user.full_name,
-                    'age': current_user.age,
-                    'avatar': current_user.avatar,
-                }
-                return success_response("요청이 성공적으로 처리되었습니다.",
-                                        user_data)
-            except Exception as e:
-                return error_response(f"서버 오류: {str(e)}", 500)
-                
-            finally:
-                session.close()
         
         # 로그인 이후 Profile 페이지에서 프로필 변경 시 사용
-        elif request.method == 'PUT':
+        if request.method == 'PUT':
             data = request.get_json()
             # 기존 Form과 다른 형태거나, 데이터가 없는 경우
             if not data:
@@ -383,11 +431,11 @@ def set_route(app: Flask, model, device):
             # 비밀번호 검증 작업 수행 후, 데이터 업데이트
             try:
                 if data.get('current_password') and data.get('new_password'):
-                    if not check_password_hash(current_user.password_hash, data['current_password']):
+                    if not credentials.verify_password(current_user.password_hash, data['current_password']):
                         return error_response("입력된 비밀번호가 맞지 않습니다.", 
                                               400)
                     
-                    current_user.password_hash = generate_password_hash(data['new_password'])
+                    current_user.password_hash = credentials.hash_password(data['new_password'])
 
                 current_user.username = data.get('username', current_user.username)
                 current_user.email = data.get('email', current_user.email)
@@ -395,9 +443,13 @@ def set_route(app: Flask, model, device):
                 current_user.age = data.get('age', current_user.age)
 
                 session.commit() 
-                return success_response("요청이 성공적으로 처리되었습니다.", 
+                invalidate_user_principal(user_id)
+                return success_response("요청이 성공적으로 처리되었습니다.",
                                         None)
 
+            except CredentialServiceBusy:
+                session.rollback()
+                return busy_response()
             except Exception as e:
                 session.rollback()
                 return error_response(f"서버 오류: {str(e)}", 
@@ -488,13 +540,12 @@ def set_route(app: Flask, model, device):
     def get_catches(user_id):
         session = Session()
         try:
-            current_user = session.query(User).filter_by(user_id=user_id).first()
-            if not current_user:
+            if not get_user_principal(user_id):
                 return error_response("요청한 유저를 찾을 수 없습니다.",
                                   "User not found",
                                   404)
                 
-            catches = session.query(Catch).filter_by(user_id=current_user.user_id).all()
+            catches = session.query(Catch).filter_by(user_id=user_id).all()
             catches_json = [{'id': catch.catch_id,
                             'imageUrl': catch.photo_url,
                             'detections': catch.detect_data,
@@ -607,14 +658,13 @@ def set_route(app: Flask, model, device):
         
         try:
             # Check if request-User exist
-            current_user = session.query(User).filter_by(user_id=user_id).first()
-            if not current_user:
+            if not get_user_principal(user_id):
                 return error_response("요청한 대상을 찾을 수 없습니다.",
                                       "Not Found : User",
                                       404)
             
             # Check if request-User exist
-            catch = session.query(Catch).filter_by(catch_id=catch_id, user_id=current_user.user_id).first()
+            catch = session.query(Catch).filter_by(catch_id=catch_id, user_id=user_id).first()
             if not catch:
                 return error_response("요청한 대상을 찾을 수 없습니다.",
                                       "Not Found : Catch",
@@ -622,6 +672,7 @@ def set_route(app: Flask, model, device):
 
             session.delete(catch)
             session.commit()
+            upload_store.release(session, [catch.photo_url])
             return success_response("요청을 성공적으로 수행하였습니다.")
         
         except Exception as e:
@@ -634,10 +685,39 @@ def set_route(app: Flask, model, device):
 
     @app.route('/uploads/<path:filename>', methods=['GET', 'POST'])
     def uploaded_file(filename):
-        response = send_from_directory('uploads', filename)
-        # 캐시 컨트롤 헤더 추가
-        response.headers['Cache-Control'] = 'public, max-age=31536000'  # 1년
-        response.headers['Vary'] = 'Accept-Encoding'
+        # ?w= (너비) / ?format= 또는 Accept 헤더(WebP)에 맞는 derivative 선택
+        variant = upload_variants.resolve(filename,
+                                          request.args.get('w', type=int),
+                                          negotiate_format(request.args.get('format'), request.headers.get('Accept')))
+
+        etag = get_upload_etag(variant)
+        if etag is None:
+            return error_response("요청한 파일을 찾을 수 없습니다.",
+                                  "Not Found : File",
+                                  404)
+
+        if etag in request.if_none_match:
+            # 클라이언트 캐시와 동일 : 파일을 열지 않고 304 응답
+            response = Response(status=304)
+            response.set_etag(etag)
+        elif current_app.config["UPLOAD_SERVE_MODE"] == 'x-accel':
+            # nginx가 파일 / Range 요청 처리 (이미지 바이트가 Python을 거치지 않음)
+            response = Response(mimetype=mimetypes.guess_type(variant)[0] or 'application/octet-stream')
+            response.headers['X-Accel-Redirect'] = f'{current_app.config["UPLOAD_ACCEL_PREFIX"].rstrip("/")}/{variant}'
+            response.set_etag(etag)
+        else:
+            # Range / If-Range 처리, USE_X_SENDFILE 설정 시 X-Sendfile 헤더로 전달
+            response = send_from_directory(current_app.config["UPLOAD_FOLDER"], variant,
+                                           etag=etag,
+                                           max_age=current_app.config["UPLOAD_CACHE_MAX_AGE"])
+
+        # 캐시 헤더 (이 라우트에서만 설정)
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = current_app.config["UPLOAD_CACHE_MAX_AGE"]
+        if is_content_addressed(variant):
+            response.cache_control.immutable = True
+        response.vary.update(['Accept-Encoding', 'Accept'])
         return response
 
     @app.route('/predict/save', methods=['GET', 'POST'])
@@ -650,7 +730,8 @@ def set_route(app: Flask, model, device):
                                   400)
         try:
             session = Session()
-            catch = session.query(Catch).filter_by(photo_url=imageUrl).first()
+            # 같은 이미지는 사용자 간에 blob을 공유하므로 본인 Catch만 조회
+            catch = session.query(Catch).filter_by(photo_url=imageUrl, user_id=user_id).first()
 
             if not catch:
                 return error_response("잘못된 요청입니다.",
@@ -671,31 +752,99 @@ def set_route(app: Flask, model, device):
 
     @app.route('/api/spots', methods=['GET'])
     def fishing_spot_all():
-        session = Session()
-        fishing_spots = session.query(FishingPlace).all()
-        session.close()
-
         try:
-            locations = [{
-                'fishing_place_id': spot.fishing_place_id,
-                'name': spot.name,
-                'type': spot.type,
-                'latitude': spot.latitude,
-                'longitude': spot.longitude,
-                'address_road': " ".join(spot.address_road.split()[:3]),
-                'address_land': " ".join(spot.address_land.split()[:3]),
-            } for spot in fishing_spots]
-            
-            locations = sorted(locations, key=custom_sort_key)
-            
-            return success_response("요청을 성공적으로 처리하였습니다",
-                                    locations)
+            snapshot = get_fishing_spot_index().snapshot("요청을 성공적으로 처리하였습니다")
+
+            # gzip 지원 클라이언트에는 미리 압축된 본문 전송
+            if 'gzip' in request.accept_encodings:
+                response = Response(snapshot.gzip_body, mimetype='application/json')
+                response.headers['Content-Encoding'] = 'gzip'
+                response.set_etag(snapshot.gzip_etag)
+            else:
+                response = Response(snapshot.body, mimetype='application/json')
+                response.set_etag(snapshot.etag)
+
+            response.vary.add('Accept-Encoding')
+            # 매 요청 재검증 : 변경이 없으면 304 (본문 없음)
+            response.cache_control.no_cache = True
+            return response.make_conditional(request)
 
         except Exception as e:
             return error_response("요청 진행 중 오류가 발생하였습니다.",
                                 'Internal Server Error', 
                                 500)
             
+    @app.route('/api/spots/nearest', methods=['GET'])
+    def fishing_spot_nearest():
+        try:
+            lat = float(request.args['lat'])
+            lon = float(request.args['lon'])
+            k = min(int(request.args.get('k', 10)), BaseConfig.SPOTS_NEAREST_MAX)
+        except (KeyError, ValueError):
+            return error_response("잘못된 요청입니다.",
+                                  'lat, lon (and optional k) are required',
+                                  400)
+        if k < 1:
+            return error_response("잘못된 요청입니다.", 'k must be positive', 400)
+
+        try:
+            spots = get_fishing_spot_index().nearest(lat, lon, k)
+            return success_response("요청을 성공적으로 처리하였습니다", spots)
+        except Exception as e:
+            return error_response("요청 진행 중 오류가 발생하였습니다.",
+                                'Internal Server Error', 
+                                500)
+
+    @app.route('/api/spots/radius', methods=['GET'])
+    def fishing_spot_radius():
+        try:
+            lat = float(request.args['lat'])
+            lon = float(request.args['lon'])
+            radius = float(request.args['radius'])  # km
+        except (KeyError, ValueError):
+            return error_response("잘못된 요청입니다.",
+                                  'lat, lon and radius (km) are required',
+                                  400)
+        if not 0 < radius <= BaseConfig.SPOTS_MAX_RADIUS_KM:
+            return error_response("잘못된 요청입니다.",
+                                  f'radius must be in (0, {BaseConfig.SPOTS_MAX_RADIUS_KM}] km',
+                                  400)
+
+        try:
+            spots = get_fishing_spot_index().within_radius(lat, lon, radius, limit=BaseConfig.SPOTS_MAX_RESULTS)
+            return success_response("요청을 성공적으로 처리하였습니다", spots)
+        except Exception as e:
+            return error_response("요청 진행 중 오류가 발생하였습니다.",
+                                'Internal Server Error', 
+                                500)
+
+    @app.route('/api/spots/bbox', methods=['GET'])
+    def fishing_spot_bbox():
+        # 지도 화면 영역 (남서쪽 / 북동쪽 좌표)
+        try:
+            south = float(request.args['south'])
+            west = float(request.args['west'])
+            north = float(request.args['north'])
+            east = float(request.args['east'])
+        except (KeyError, ValueError):
+            return error_response("잘못된 요청입니다.",
+                                  'south, west, north and east are required',
+                                  400)
+        if south > north or west > east:
+            return error_response("잘못된 요청입니다.", 'Invalid bounding box', 400)
+
+        try:
+            spots = sorted(get_fishing_spot_index().within_bbox(south, west, north, east), key=custom_sort_key)
+            return success_response("요청을 성공적으로 처리하였습니다", {
+                'spots': spots[:BaseConfig.SPOTS_MAX_RESULTS],
+                'total': len(spots),
+                'truncated': len(spots) > BaseConfig.SPOTS_MAX_RESULTS,
+            })
+        except Exception as e:
+            return error_response("요청 진행 중 오류가 발생하였습니다.",
+                                'Internal Server Error', 
+                                500)
+
     @app.route('/api/spots/<int:spot_id>', methods=['GET'])
     def fishing_spot_by_id(spot_id):
         try:
@@ -753,9 +902,7 @@ def set_route(app: Flask, model, device):
         
         # After checking file, update profile images
         if file and allowed_file(file.filename):
-            filename = secure_filename(f"{user_id}_{uuid.uuid4().hex}.jpg")
-            file_path = os.path.join(current_app.config["AVATAR_UPLOAD_FOLDER"], filename)
-            file.save(file_path)
+            key = upload_store.put_file(file)
             
             session = Session()
             try:
@@ -767,9 +914,13 @@ def set_route(app: Flask, model, device):
                                   404)
 
                 # Update user's avatar URL
-                current_user.avatar = f"/uploads/avatars/{filename}"
+                previous_avatar = current_user.avatar
+                current_user.avatar = upload_store.url(key)
                 session.commit()
+                invalidate_user_principal(user_id)
                 avatar_url = current_user.avatar
+                if previous_avatar and previous_avatar != avatar_url:
+                    upload_store.release(session, [previous_avatar])
                 
             except Exception as e:
                 session.rollback()
@@ -798,41 +949,24 @@ def set_route(app: Flask, model, device):
                                   'Invalid input',
                                   400)
 
-        ## ST_Distance_Sphere를 사용하여 DB 내 데이터 비교 후 조건에 맞는 데이터 선정 (1)
         try:
-            with Session() as session:
-                query_obsrecent = session.query(
-                        TidalObservation.obs_station_id,
-                        TidalObservation.obs_post_id,
-                        TidalObservation.obs_post_name,
-                        func.ST_Distance_Sphere(
-                            func.Point(lon, lat), func.Point(TidalObservation.obs_lon, TidalObservation.obs_lat)
-                        ).label('distance')
-                    ).filter(
-                        TidalObservation.obs_object.like('%조위%'),
-                        TidalObservation.obs_object.like('%수온%'),
-                        TidalObservation.obs_object.like('%기온%'),
-                        TidalObservation.obs_object.like('%기압%')
-                    ).order_by('distance').first()
-        except:
-            query_obsrecent = None
-            
-        ## ST_Distance_Sphere를 사용하여 DB 내 데이터 비교 후 조건에 맞는 데이터 선정 (2)
+            lat = float(lat)
+            lon = float(lon)
+        except ValueError:
+            return error_response('입력값이 잘못되었습니다.', 
+                                  'Invalid coordinate format',
+                                  400)
+
+        ## 메모리 내 관측소 공간 인덱스에서 조건에 맞는 최근접 관측소 선정 (DB 조회 없음)
         try:
-            with Session() as session:
-                query_obspretab = session.query(
-                        TidalObservation.obs_station_id,
-                        TidalObservation.obs_post_id,
-                        TidalObservation.obs_post_name,
-                        func.ST_Distance_Sphere(
-                            func.Point(lon, lat), func.Point(TidalObservation.obs_lon, TidalObservation.obs_lat)
-                        ).label('distance')
-                    ).filter(
-                        TidalObservation.obs_object.like('%조수간만%'),
-                        TidalObservation.obs_object.notlike('%없음%')
-                    ).order_by('distance').first()
-        except:
-            query_obspretab = None
+            station_index = get_tidal_station_index()
+            # (1) 조위 / 수온 / 기온 / 기압 관측소
+            query_obsrecent = station_index.nearest(lat, lon, OBSRECENT_REQUIRED)
+            # (2) 조수간만 관측소
+            query_obspretab = station_index.nearest(lat, lon, OBSPRETAB_REQUIRED, OBSPRETAB_EXCLUDED)
+        except Exception as e:
+            print(f"Tidal station lookup failed on {e}")
+            query_obsrecent = query_obspretab = None
         
         # 선정된 데이터 기반 해양 관측소 API 호출    
         try:
@@ -841,18 +975,18 @@ def set_route(app: Flask, model, device):
                 print(f"obs pretab : {query_obspretab}")
                 # 조위 관측 정보
                 obsrecent_data = {
-                    'obs_station_id': query_obsrecent[0],
-                    'obs_post_id': query_obsrecent[1],
-                    'obs_post_name': query_obsrecent[2],
-                    'distance': query_obsrecent[3] / 1000
+                    'obs_station_id': query_obsrecent['obs_station_id'],
+                    'obs_post_id': query_obsrecent['obs_post_id'],
+                    'obs_post_name': query_obsrecent['obs_post_name'],
+                    'distance': query_obsrecent['distance'] / 1000
                 }
 
                 # 조수간만 관측소 정보
                 obspretab_data = {
-                    'obs_station_id': query_obspretab[0],
-                    'obs_post_id': query_obspretab[1],
-                    'obs_post_name': query_obspretab[2],
-                    'distance': query_obspretab[3] / 1000
+                    'obs_station_id': query_obspretab['obs_station_id'],
+                    'obs_post_id': query_obspretab['obs_post_id'],
+                    'obs_post_name': query_obspretab['obs_post_name'],
+                    'distance': query_obspretab['distance'] / 1000
                 }
 
                 # KHOA API 호출
@@ -889,6 +1023,27 @@ def set_route(app: Flask, model, device):
                                 'Internal Server Error', 
                                 500)
             
+    @app.route('/api/conditions', methods=['GET'])
+    def get_conditions_api():
+        # 육상 날씨 / 해양 관측 / 물때 정보를 한 번에 조회
+        try:
+            lat = float(request.args['lat'])
+            lon = float(request.args['lon'])
+            date = request.args.get('date')
+            date = datetime.strptime(date, "%Y-%m-%d") if date else datetime.now()
+        except (KeyError, ValueError):
+            return error_response("잘못된 요청입니다.",
+                                  'lat, lon and optional date (YYYY-MM-DD) are required',
+                                  400)
+
+        try:
+            conditions = conditions_fetcher.get_conditions(lat, lon, date)
+            return success_response("요청이 성공적으로 처리되었습니다.", conditions)
+        except Exception as e:
+            return error_response("요청 진행 중 오류가 발생하였습니다.",
+                                'Internal Server Error', 
+                                500)
+
     @app.route('/api/weather/land', methods=['POST'])
     def get_weather_api():
         try:
@@ -967,6 +1122,17 @@ def set_route(app: Flask, model, device):
         finally:
             session.close()
             
+    # 캐시 적중률 통계 (운영 확인용 : CACHE_STATS_ENABLED 설정 시에만 노출, 로그인 필요)
+    @app.route('/api/cache/stats', methods=['GET'])
+    @token_required
+    def get_cache_stats(user_id):
+        if not current_app.config["CACHE_STATS_ENABLED"]:
+            return error_response("요청한 정보를 찾을 수 없습니다.",
+                                  "Not Found",
+                                  404)
+        return success_response("요청이 성공적으로 처리되었습니다.",
+                                cache_stats())
+
     # 서비스 목록 API 추가
     @app.route('/api/services', methods=['GET', 'POST'])
     def get_services():
@@ -1008,52 +1174,73 @@ def set_route(app: Flask, model, device):
         try:
             page = request.args.get('page', 1, type=int)
             per_page = request.args.get('per_page', 10, type=int)
+            per_page = min(max(per_page, 1), current_app.config["POSTS_MAX_PER_PAGE"])
+            
+            # cursor 파라미터 사용 시 keyset pagination (빈 값 : 첫 페이지)
+            cursor = request.args.get('cursor')
             
             session = Session()
             
-            # Calculate total posts and pages
-            total = session.query(CommunicationBoard).count()
-            offset = (page - 1) * per_page
+            # Get posts with pagination (작성자, 좋아요 / 댓글 수, 좋아요 여부 포함 단일 쿼리)
+            query = query_feed_posts(session, user_id)
+            if cursor is not None:
+                if cursor:
+                    try:
+                        query = after_cursor(query, cursor)
+                    except ValueError:
+                        return error_response("잘못된 요청입니다.",
+                                              "Bad Request : Invalid cursor",
+                                              400)
+            else:
+                query = query.offset((page - 1) * per_page)
             
-            # Get posts with pagination
-            posts = session.query(CommunicationBoard)\
-                .order_by(CommunicationBoard.created_at.desc())\
-                .offset(offset)\
-                .limit(per_page)\
-                .all()
+            # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+            posts = query.limit(per_page + 1).all()
+            has_more = len(posts) > per_page
+            posts = posts[:per_page]
                 
             result = []
-            for post in posts:
-                user = session.query(User).get(post.user_id)
-                
-                # Get like status for current user
-                is_liked = session.query(PostLike)\
-                    .filter_by(post_id=post.post_id, user_id=user_id)\
-                    .first() is not None
-                
+            for post, username, avatar, is_liked in posts:
                 post_data = {
                     'post_id': post.post_id,
                     'user_id': post.user_id,
-                    'username': user.username if user else 'Unknown',
-                    'avatar': get_full_url(user.avatar) if user and user.avatar else None,
+                    'username': username if username else 'Unknown',
+                    'avatar': get_full_url(avatar, current_app.config["AVATAR_IMAGE_WIDTH"]) if avatar else None,
                     'title': post.title,
                     'content': post.content,
                     'images': [get_full_url(image) for image in (post.images or [])],
+                    # 피드 표시용 축소 이미지 (원본은 images)
+                    'thumbnails': [get_full_url(image, current_app.config["FEED_IMAGE_WIDTH"]) for image in (post.images or [])],
                     'created_at': post.created_at.astimezone(timezone(timedelta(hours=9))).isoformat(),
-                    'likes_count': session.query(PostLike).filter_by(post_id=post.post_id).count(),
-                    'comments_count': session.query(PostComment).filter_by(post_id=post.post_id).count(),
-                    'is_liked': is_liked
+                    'likes_count': post.likes_count,
+                    'comments_count': post.comments_count,
+                    'is_liked': bool(is_liked)
                 }
                 result.append(post_data)
                 
-            total_pages = (total + per_page - 1) // per_page
+            next_cursor = encode_cursor(posts[-1][0]) if has_more else None
             
-            result_total = {
-                            'posts': result,
-                            'total': total,
-                            'pages': total_pages,
-                            'current_page': page
-                        }
+            if cursor is not None:
+                result_total = {
+                                'posts': result,
+                                'next_cursor': next_cursor,
+                                'has_more': has_more
+                            }
+                # 전체 게시물 수는 요청 시에만 포함 (캐시된 값)
+                if request.args.get('include_total', 'false').lower() == 'true':
+                    result_total['total'] = get_total_posts(session)
+            else:
+                # Calculate total posts and pages
+                total = get_total_posts(session)
+                total_pages = (total + per_page - 1) // per_page
+                
+                result_total = {
+                                'posts': result,
+                                'total': total,
+                                'pages': total_pages,
+                                'current_page': page,
+                                'next_cursor': next_cursor
+                            }
             
             return success_response("요청이 성공적으로 처리되었습니다.",
                                     result_total)
@@ -1094,16 +1281,14 @@ def set_route(app: Flask, model, device):
             for image in images:
                 if image and allowed_file(image.filename):
                     try:
-                        filename = secure_filename(f"{uuid.uuid4()}_{image.filename}")
-                        image_path = os.path.join(current_app.config["UPLOAD_FOLDER"], filename)
-                        image.save(image_path)
-                        new_post.images.append(f'/uploads/{filename}')
+                        new_post.images.append(upload_store.url(upload_store.put_file(image)))
                     except Exception as e:
                         logging.error(f"Error saving image {image.filename}: {str(e)}")
                         continue
 
             session.add(new_post)
             session.commit()
+            invalidate_total_posts()
 
             # Get user info for response
             user = session.query(User).get(user_id)
@@ -1161,10 +1346,6 @@ def set_route(app: Flask, model, device):
                 user_id=user_id
             ).first() is not None
 
-            # Get counts
-            likes_count = session.query(PostLike).filter_by(post_id=post_id).count()
-            comments_count = session.query(PostComment).filter_by(post_id=post_id).count()
-
             # Handle images safely
             images = []
             if post.images:
@@ -1184,8 +1365,8 @@ def set_route(app: Flask, model, device):
                 'images': images,
                 'created_at': post.created_at.astimezone(timezone(timedelta(hours=9))).isoformat(),
                 'updated_at': post.updated_at if post.updated_at else post.created_at.astimezone(timezone(timedelta(hours=9))).isoformat(),
-                'likes_count': likes_count,
-                'comments_count': comments_count,
+                'likes_count': post.likes_count,
+                'comments_count': post.comments_count,
                 'is_liked': is_liked
             }
 
@@ -1231,23 +1412,10 @@ def set_route(app: Flask, model, device):
             for image in new_images:
                 if image and allowed_file(image.filename):
                     try:
-                        filename = secure_filename(f"{uuid.uuid4()}_{image.filename}")
-                        image_path = os.path.join(current_app.config["UPLOAD_FOLDER"], filename)
-                        image.save(image_path)
-                        post.images.append(f'/uploads/{filename}')
+                        post.images.append(upload_store.url(upload_store.put_file(image)))
                     except Exception as e:
                         logging.error(f"Error saving image {image.filename}: {str(e)}")
 
-            # 삭제된 이미지 파일 제거
-            for image_url in removed_images:
-                if image_url in current_images:
-                    try:
-                        file_path = os.path.join(app.root_path, image_url.lstrip('/'))
-                        if os.path.exists(file_path):
-                            os.remove(file_path)
-                    except Exception as e:
-                        logging.error(f"Error removing file {image_url}: {str(e)}")
-
             # 게시물 내용 업데이트
             post.title = data.get('title', post.title)
             post.content = data.get('content', post.content)
@@ -1255,6 +1423,10 @@ def set_route(app: Flask, model, device):
 
             session.commit()
 
+            # 삭제된 이미지 : 다른 곳에서 참조하지 않는 파일만 제거
+            upload_store.release(session, [image_url for image_url in removed_images
+                                           if image_url in current_images and image_url not in post.images])
+
             response_data = {
                 'message': '게시물이 성공적으로 수정되었습니다.',
                 'post': {
@@ -1288,15 +1460,13 @@ def set_route(app: Flask, model, device):
                                       'Not Found',
                                       404)
 
-            # Delete all associated images
-            if post.images:
-                for image_url in post.images:
-                    image_path = os.path.join(current_app.config["UPLOAD_FOLDER"], os.path.basename(image_url))
-                    if os.path.exists(image_path):
-                        os.remove(image_path)
-
+            images = list(post.images or [])
             session.delete(post)
             session.commit()
+            invalidate_total_posts()
+
+            # Delete associated images no longer referenced elsewhere
+            upload_store.release(session, images)
 
             return success_response('게시물이 성공적으로 삭제되었습니다.')
         except Exception as e:
@@ -1327,10 +1497,11 @@ def set_route(app: Flask, model, device):
             ).first()
 
             if existing_like:
-                # Unlike
+                # Unlike (좋아요 수 컬럼을 같은 트랜잭션에서 갱신)
                 session.delete(existing_like)
+                post.likes_count = CommunicationBoard.likes_count - 1
                 session.commit()
-                likes_count = session.query(PostLike).filter_by(post_id=post_id).count()
+                likes_count = post.likes_count
                 return success_response('좋아요가 취소되었습니다.',
                                         data = {'is_liked': False,
                                                 'likes_count': likes_count,
@@ -1340,8 +1511,9 @@ def set_route(app: Flask, model, device):
                 # Like
                 new_like = PostLike(post_id=post_id, user_id=user_id)
                 session.add(new_like)
+                post.likes_count = CommunicationBoard.likes_count + 1
                 session.commit()
-                likes_count = session.query(PostLike).filter_by(post_id=post_id).count()
+                likes_count = post.likes_count
                 return success_response('좋아요가 추가되었습니다.',
                                         data = {'is_liked': True,
                                                 'likes_count': likes_count,
@@ -1381,7 +1553,7 @@ def set_route(app: Flask, model, device):
                 'comment_id': comment.comment_id,
                 'user_id': comment.user_id,
                 'username': user.username,
-                'avatar': get_full_url(user.avatar),
+                'avatar': get_full_url(user.avatar, current_app.config["AVATAR_IMAGE_WIDTH"]),
                 'content': comment.content,
                 'created_at': comment.created_at.astimezone(timezone(timedelta(hours=9))).isoformat(),
             } for comment, user in comments]
@@ -1422,6 +1594,7 @@ def set_route(app: Flask, model, device):
                 content=data['content']
             )
             session.add(new_comment)
+            post.comments_count = CommunicationBoard.comments_count + 1
             session.commit()
 
             # Get user info for response
@@ -1431,7 +1604,7 @@ def set_route(app: Flask, model, device):
                 'comment_id': new_comment.comment_id,
                 'user_id': user_id,
                 'username': user.username,
-                'avatar': get_full_url(user.avatar),
+                'avatar': get_full_url(user.avatar, current_app.config["AVATAR_IMAGE_WIDTH"]),
                 'content': new_comment.content,
                 'created_at': new_comment.created_at.astimezone(timezone(timedelta(hours=9))).isoformat(),
             }
@@ -1452,35 +1625,25 @@ def set_route(app: Flask, model, device):
     def get_top_posts():
         session = Session()
         try:
-            # Get top 5 posts by likes
-            top_posts = session.query(CommunicationBoard)\
-                .outerjoin(PostLike)\
-                .group_by(CommunicationBoard.post_id)\
-                .order_by(func.count(PostLike.like_id).desc(), CommunicationBoard.created_at.desc())\
+            # Get top 5 posts by likes (좋아요가 없으면 최신순)
+            top_posts = query_feed_posts(session, order_by_likes=True)\
                 .limit(5)\
                 .all()
 
-            if not top_posts:
-                # If no posts with likes, get the most recent 5 posts
-                top_posts = session.query(CommunicationBoard)\
-                    .order_by(CommunicationBoard.created_at.desc())\
-                    .limit(5)\
-                    .all()
-
             result = []
-            for post in top_posts:
-                user = session.query(User).get(post.user_id)
+            for post, username, avatar, _ in top_posts:
                 post_data = {
                     'post_id': post.post_id,
                     'user_id': post.user_id,
-                    'username': user.username if user else 'Unknown',
-                    # 'avatar': get_full_url(user.avatar) if user else None,
+                    'username': username if username else 'Unknown',
+                    # 'avatar': get_full_url(avatar) if avatar else None,
                     'title': post.title,
                     'content': post.content,
                     'images': [get_full_url(image) for image in (post.images or [])],
+                    'thumbnails': [get_full_url(image, current_app.config["THUMBNAIL_IMAGE_WIDTH"]) for image in (post.images or [])],
                     'created_at': post.created_at.astimezone(timezone(timedelta(hours=9))).isoformat(),
-                    'likes_count': session.query(PostLike).filter_by(post_id=post.post_id).count(),
-                    'comments_count': session.query(PostComment).filter_by(post_id=post.post_id).count(),
+                    'likes_count': post.likes_count,
+                    'comments_count': post.comments_count,
                 }
                 result.append(post_data)
                 
@@ -1494,17 +1657,6 @@ def set_route(app: Flask, model, device):
         finally:
             session.close()
             
-    # Flask 모든 응답에 대해 후처리 수행하도록 설정
-    @app.after_request
-    def add_header(response):
-        """
-        Cache setting for upload directory (1 year)
-        """
-        if request.path.startswith('/uploads/'):
-            response.cache_control.max_age = 31536000  
-            response.cache_control.public = True
-        return response
-        
     # 애플리케이션 종료 시 세 제거
     @app.teardown_appcontext
     def remove_session(exception=None):
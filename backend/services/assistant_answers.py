@@ -0,0 +1,64 @@
+from config import BaseConfig
+from utils.cache import get_cache, SingleFlight
+
+# 같은 어종의 답변 생성 요청은 동시에 하나만 시작
+_run_flight = SingleFlight()
+
+
+def _answer_cache():
+    return get_cache('assistant_answers', BaseConfig.ASSISTANT_ANSWER_CACHE_SIZE, BaseConfig.ASSISTANT_ANSWER_TTL)
+
+
+def _pending_runs():
+    # 진행 중인 어종별 run (thread_id, run_id) : 완료 전 요청은 같은 run을 공유
+    return get_cache('assistant_answer_runs', BaseConfig.ASSISTANT_ANSWER_CACHE_SIZE, BaseConfig.ASSISTANT_RUN_TIMEOUT)
+
+
+def _answer_key(label):
+    # 프롬프트 / Assistant 설정이 바뀌면 버전을 올려 이전 답변을 사용하지 않음
+    return f"{BaseConfig.ASSISTANT_PROMPT_VERSION}:{label}"
+
+
+def get_cached_answer(label):
+    """
+    Cached cleaned assistant answer for the species label, None on miss
+    """
+    return _answer_cache().get(_answer_key(label))
+
+
+def set_cached_answer(label, text):
+    if text:
+        _answer_cache().set(_answer_key(label), text)
+
+
+def invalidate_answers(label=None):
+    """
+    Drop the cached answer of one label (or of every label)
+    """
+    if label is None:
+        _answer_cache().clear()
+    else:
+        _answer_cache().delete(_answer_key(label))
+
+
+def request_answer(label):
+    """
+    Start (or join) the assistant run for the species label and return its [thread_id, run_id]
+
+    Concurrent cache misses of the same label share one run; the answer is cached when it completes.
+    """
+    from services.openai_assistant import assistant_talk_request
+    from services.assistant_runs import assistant_runs, RUN_PENDING
+
+    key = _answer_key(label)
+
+    def start():
+        request_id = _pending_runs().get(key)
+        # 실패 / 시간 초과로 끝난 run은 공유하지 않고 새로 요청
+        if request_id is None or assistant_runs.get(*request_id)['status'] != RUN_PENDING:
+            request_id = assistant_talk_request(f"{label}")
+            _pending_runs().set(key, request_id)
+        assistant_runs.track(*request_id, label=label)
+        return request_id
+
+    return _run_flight.do(key, start)
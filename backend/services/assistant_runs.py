@@ -0,0 +1,117 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from config import BaseConfig
+from services.openai_assistant import get_run_status, get_assistant_answer
+from services.assistant_answers import set_cached_answer
+from utils.cache import get_cache
+
+# Run 결과 상태
+RUN_PENDING = 'pending'
+RUN_COMPLETED = 'completed'
+RUN_EMPTY = 'empty'
+RUN_FAILED = 'failed'
+RUN_TIMEOUT = 'timeout'
+
+# OpenAI run 종료(실패) 상태
+FAILED_RUN_STATUSES = ('failed', 'error', 'cancelled', 'expired', 'incomplete')
+
+
+class AssistantRunTracker:
+    """
+    Single background poller for every outstanding assistant run
+
+    Request handlers only register runs and read results, they never wait on OpenAI.
+    """
+    def __init__(self, poll_interval=0.5, run_timeout=60, workers=4):
+        self.poll_interval = poll_interval
+        self.run_timeout = run_timeout
+        self.workers = workers
+        # 날씨 / 관측 API용 공유 executor와 분리 (느린 run 확인이 다른 외부 호출을 막지 않도록)
+        self._executor = None
+
+        self._runs = {}  # (thread_id, run_id) -> (등록 시각, 어종 label)
+        self._runs_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def _results(self):
+        return get_cache('assistant_runs', BaseConfig.ASSISTANT_RESULT_CACHE_SIZE, BaseConfig.ASSISTANT_RESULT_TTL)
+
+    def _key(self, thread_id, run_id):
+        return f"{thread_id}:{run_id}"
+
+    def track(self, thread_id, run_id, label=None):
+        """
+        Register the run (idempotent) and return its current result
+
+        With `label`, the completed answer is also stored in the per-species answer cache.
+        """
+        result = self.get(thread_id, run_id)
+        if result['status'] != RUN_PENDING:
+            return result
+
+        self.start()
+        with self._runs_lock:
+            self._runs.setdefault((thread_id, run_id), (time.monotonic(), label))
+        self._wakeup.set()
+        return result
+
+    def get(self, thread_id, run_id):
+        return self._results().get(self._key(thread_id, run_id)) or {'status': RUN_PENDING, 'text': None}
+
+    def _finish(self, run, status, text=None):
+        self._results().set(self._key(*run), {'status': status, 'text': text})
+        with self._runs_lock:
+            self._runs.pop(run, None)
+
+    def _check(self, run, registered):
+        registered_at, label = registered
+        try:
+            status = get_run_status(*run)
+            if status == 'completed':
+                text = get_assistant_answer(run[0])
+                if label:
+                    set_cached_answer(label, text)
+                self._finish(run, RUN_COMPLETED if text else RUN_EMPTY, text)
+            elif status in FAILED_RUN_STATUSES:
+                self._finish(run, RUN_FAILED)
+            elif time.monotonic() - registered_at > self.run_timeout:
+                self._finish(run, RUN_TIMEOUT)
+        except Exception as e:
+            print(f"AssistantRunTracker : run {run[1]} check failed on {e}")
+            if time.monotonic() - registered_at > self.run_timeout:
+                self._finish(run, RUN_TIMEOUT)
+
+    def _poll(self):
+        while True:
+            with self._runs_lock:
+                runs = list(self._runs.items())
+
+            if not runs:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            # 진행 중인 run 상태를 한 번에 병렬 확인
+            list(self._executor.map(lambda item: self._check(*item), runs))
+            time.sleep(self.poll_interval)
+
+    def start(self):
+        """
+        Start the poller thread (once per process)
+        """
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='assistant-runs')
+                self._thread = threading.Thread(target=self._poll, name='assistant-runs', daemon=True)
+                self._thread.start()
+
+
+assistant_runs = AssistantRunTracker(poll_interval=BaseConfig.ASSISTANT_POLL_INTERVAL,
+                                     run_timeout=BaseConfig.ASSISTANT_RUN_TIMEOUT,
+                                     workers=BaseConfig.ASSISTANT_POLL_WORKERS)
@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+import hashlib
+import jwt
+
+from config import BaseConfig
+from models.model import Session, User
+from utils.cache import get_cache
+
+
+def _token_cache():
+    # 검증된 토큰은 프로세스 내부에만 보관 (Redis 미사용)
+    return get_cache('verified_tokens', BaseConfig.AUTH_TOKEN_CACHE_SIZE, BaseConfig.AUTH_TOKEN_CACHE_TTL,
+                     use_redis=False)
+
+
+def _principal_cache():
+    return get_cache('user_principals', BaseConfig.AUTH_PRINCIPAL_CACHE_SIZE, BaseConfig.AUTH_PRINCIPAL_TTL,
+                     use_redis=False)
+
+
+def _token_digest(token):
+    return hashlib.blake2b(token.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def verify_token(token):
+    """
+    Verified JWT claims (HMAC checked once per token, then served from cache until `exp`)
+
+    Raises jwt.ExpiredSignatureError / jwt.InvalidTokenError like jwt.decode.
+    """
+    cache = _token_cache()
+    key = _token_digest(token)
+    now = datetime.now(timezone.utc).timestamp()
+
+    claims = cache.get(key)
+    if claims is not None:
+        if 'exp' in claims and claims['exp'] <= now:
+            cache.delete(key)
+            raise jwt.ExpiredSignatureError('Signature has expired')
+        return claims
+
+    claims = jwt.decode(token, BaseConfig.SECRET_KEY, algorithms=['HS256'])
+
+    # 캐시 유지 시간은 토큰 만료 시각을 넘지 않음
+    ttl = BaseConfig.AUTH_TOKEN_CACHE_TTL
+    if 'exp' in claims:
+        ttl = min(ttl, claims['exp'] - now)
+    if ttl > 0:
+        cache.set(key, claims, ttl)
+    return claims
+
+
+def get_bearer_token(headers):
+    """
+    Token of the 'Authorization: Bearer <token>' header, None if missing
+    """
+    parts = headers.get('Authorization', '').split(' ')
+    return parts[1] if len(parts) > 1 and parts[1] else None
+
+
+def get_user_principal(user_id):
+    """
+    Lightweight cached user info (None if the user does not exist)
+    """
+    cache = _principal_cache()
+    principal = cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    # 라우트의 scoped session과 분리된 세션 사용
+    with Session.session_factory() as session:
+        user = session.query(User).filter_by(user_id=user_id).first()
+        if not user:
+            return None
+        principal = {
+            'user_id': user.user_id,
+            'username': user.username,
+            'email': user.email,
+            'full_name': user.full_name,
+            'age': user.age,
+            'avatar': user.avatar,
+        }
+
+    cache.set(user_id, principal)
+    return principal
+
+
+def invalidate_user_principal(user_id):
+    """
+    Drop the cached principal after the user row changes
+    """
+    _principal_cache().delete(user_id)
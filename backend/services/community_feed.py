@@ -0,0 +1,106 @@
+from datetime import datetime
+from sqlalchemy import select, update, func, literal, or_, and_
+import base64
+
+from config import BaseConfig
+from models.model import User, CommunicationBoard, PostLike, PostComment
+from utils.cache import get_cache
+
+
+def query_feed_posts(session, viewer_id=None, order_by_likes=False):
+    """
+    Posts (with like / comment counter columns), author and viewer like status in a single statement
+    """
+    # 좋아요 여부는 게시물마다 따로 조회하지 않도록 상관 서브쿼리로 한 번에 조회
+    if viewer_id is not None:
+        is_liked = select(PostLike.like_id)\
+            .where(PostLike.post_id == CommunicationBoard.post_id, PostLike.user_id == viewer_id)\
+            .correlate(CommunicationBoard)\
+            .exists()
+    else:
+        is_liked = literal(False)
+
+    query = session.query(
+            CommunicationBoard,
+            User.username,
+            User.avatar,
+            is_liked.label('is_liked'),
+        ).outerjoin(User, User.user_id == CommunicationBoard.user_id)
+
+    # 좋아요 많은 순 (동일 시 최신순) : (likes_count, created_at) 인덱스 사용
+    if order_by_likes:
+        query = query.order_by(CommunicationBoard.likes_count.desc(), CommunicationBoard.created_at.desc())
+    else:
+        # (created_at, post_id) 복합 인덱스 순서와 동일 : keyset pagination에 사용
+        query = query.order_by(CommunicationBoard.created_at.desc(), CommunicationBoard.post_id.desc())
+
+    return query
+
+
+def encode_cursor(post):
+    """
+    Opaque keyset cursor for the position right after `post`
+    """
+    raw = f"{post.created_at.isoformat()}|{post.post_id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """
+    Decode keyset cursor into (created_at, post_id), raises ValueError on invalid cursor
+    """
+    try:
+        created_at, post_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|')
+        return datetime.fromisoformat(created_at), int(post_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def after_cursor(query, cursor):
+    """
+    Keyset filter : posts older than the cursor position (index range scan, no OFFSET)
+    """
+    created_at, post_id = decode_cursor(cursor)
+    return query.filter(or_(
+        CommunicationBoard.created_at < created_at,
+        and_(CommunicationBoard.created_at == created_at, CommunicationBoard.post_id < post_id)
+    ))
+
+
+def get_total_posts(session):
+    """
+    Total number of posts (cached for POST_TOTAL_CACHE_TTL seconds)
+    """
+    cache = get_cache('post_total', maxsize=1, ttl=BaseConfig.POST_TOTAL_CACHE_TTL)
+    total = cache.get('total')
+    if total is None:
+        total = session.query(func.count(CommunicationBoard.post_id)).scalar()
+        cache.set('total', total)
+    return total
+
+
+def invalidate_total_posts():
+    get_cache('post_total', maxsize=1, ttl=BaseConfig.POST_TOTAL_CACHE_TTL).delete('total')
+
+
+def reconcile_post_counters(session):
+    """
+    Repair drift of likes_count / comments_count against PostLikes / PostComments, returns fixed rows
+    """
+    likes_count = select(func.count(PostLike.like_id))\
+        .where(PostLike.post_id == CommunicationBoard.post_id)\
+        .scalar_subquery()
+
+    comments_count = select(func.count(PostComment.comment_id))\
+        .where(PostComment.post_id == CommunicationBoard.post_id)\
+        .scalar_subquery()
+
+    result = session.execute(
+        update(CommunicationBoard)
+        .where(or_(CommunicationBoard.likes_count != likes_count,
+                   CommunicationBoard.comments_count != comments_count))
+        .values(likes_count=likes_count, comments_count=comments_count)
+        .execution_options(synchronize_session=False)
+    )
+    session.commit()
+    return result.rowcount
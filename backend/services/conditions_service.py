@@ -0,0 +1,183 @@
+from datetime import datetime
+import threading
+import asyncio
+import httpx
+import os
+
+from config import BaseConfig
+from utils.cache import get_cache, LRUCache
+from services.weather_service import (
+    OPENWEATHER_API_BASE_URL, KHOA_API_BASE_URL, SEA_WEATHER_CACHE_TTL,
+    get_grid_cell, get_openweather_params, process_weather_data,
+    get_khoa_params, parse_khoa_response, is_cacheable_sea_data, get_sea_cache_key
+)
+from services.lunar_tide_cycle_info import get_tide_info
+from services.tidal_stations import (
+    get_tidal_station_index, OBSRECENT_REQUIRED, OBSPRETAB_REQUIRED, OBSPRETAB_EXCLUDED
+)
+
+# Source 상태
+SOURCE_OK = 'ok'
+SOURCE_TIMEOUT = 'timeout'
+SOURCE_ERROR = 'error'
+SOURCE_UNAVAILABLE = 'unavailable'
+
+
+class ConditionsFetcher:
+    """
+    Fan out land weather, both KHOA data types and the tide calculation on one background event loop
+    """
+    def __init__(self):
+        self._loop = None
+        self._pid = None
+        self._client = None
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    # ---- event loop / client ----
+    def _ensure_loop(self):
+        if self._loop is not None and self._pid == os.getpid():
+            return self._loop
+
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                # 프로세스마다 하나의 loop 스레드 (fork 이후 새로 생성)
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='conditions-loop', daemon=True).start()
+                self._loop, self._pid = loop, os.getpid()
+                self._client, self._inflight = None, {}
+        return self._loop
+
+    def _get_client(self):
+        # loop 스레드에서만 생성 / 사용 (keep-alive 연결 풀 공유)
+        if self._client is None:
+            limits = httpx.Limits(max_connections=BaseConfig.HTTP_POOL_MAXSIZE,
+                                  max_keepalive_connections=BaseConfig.HTTP_POOL_MAXSIZE)
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(BaseConfig.HTTP_READ_TIMEOUT, connect=BaseConfig.HTTP_CONNECT_TIMEOUT),
+                transport=httpx.AsyncHTTPTransport(limits=limits, retries=BaseConfig.HTTP_RETRIES),
+            )
+        return self._client
+
+    # ---- cache with in-loop coalescing ----
+    async def _cache_call(self, cache, method, *args):
+        # Redis 접근은 loop를 막지 않도록 스레드에서 실행
+        if isinstance(cache, LRUCache):
+            return getattr(cache, method)(*args)
+        return await asyncio.to_thread(getattr(cache, method), *args)
+
+    async def _cached(self, cache, key, loader, ttl=None, should_cache=None):
+        value = await self._cache_call(cache, 'get', key)
+        if value is not None:
+            return value
+
+        async def load():
+            value = await loader()
+            if should_cache is None or should_cache(value):
+                await self._cache_call(cache, 'set', key, value, ttl)
+            return value
+
+        # 같은 key의 동시 요청은 하나의 upstream 호출 결과를 공유
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(load())
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # 한 요청의 timeout이 공유 작업을 취소하지 않도록 shield
+        return await asyncio.shield(task)
+
+    # ---- sources ----
+    async def _land_weather(self, lat, lon):
+        cell, cell_lat, cell_lon = get_grid_cell(lat, lon, BaseConfig.WEATHER_GRID_SIZE)
+
+        async def load():
+            response = await self._get_client().get(OPENWEATHER_API_BASE_URL,
+                                                    params=get_openweather_params(cell_lat, cell_lon))
+            response.raise_for_status()
+            return process_weather_data(response.json())
+
+        cache = get_cache('land_weather', BaseConfig.WEATHER_CACHE_SIZE, BaseConfig.WEATHER_CACHE_TTL)
+        return await self._cached(cache, cell, load)
+
+    async def _sea_weather(self, DATA_TYPE, obs_post_id, date):
+        async def load():
+            response = await self._get_client().get(KHOA_API_BASE_URL.format(DATA_TYPE),
+                                                    params=get_khoa_params(obs_post_id, date))
+            response.raise_for_status()
+            return parse_khoa_response(response.json())
+
+        cache = get_cache('sea_weather', BaseConfig.SEA_WEATHER_CACHE_SIZE)
+        data = await self._cached(cache, get_sea_cache_key(DATA_TYPE, obs_post_id, date), load,
+                                  ttl=SEA_WEATHER_CACHE_TTL[DATA_TYPE],
+                                  should_cache=is_cacheable_sea_data)
+        if not is_cacheable_sea_data(data):
+            raise RuntimeError(data['error'])
+        return data
+
+    async def _tide(self, date):
+        tide = get_tide_info(date)
+        if tide['lunar_date'] is None:
+            raise RuntimeError('Tide cycle calculation failed')
+        return tide
+
+    async def _run_source(self, coro, timeout):
+        """
+        Source result with its own timeout : failures become partial results
+        """
+        try:
+            return {'status': SOURCE_OK, 'data': await asyncio.wait_for(coro, timeout)}
+        except asyncio.TimeoutError:
+            return {'status': SOURCE_TIMEOUT, 'error': f'No response within {timeout}s'}
+        except Exception as e:
+            return {'status': SOURCE_ERROR, 'error': str(e)}
+
+    async def _unavailable(self, reason):
+        return {'status': SOURCE_UNAVAILABLE, 'error': reason}
+
+    async def _gather(self, lat, lon, date, stations):
+        khoa_date = date.strftime('%Y%m%d')
+        sources = {
+            'land': self._run_source(self._land_weather(lat, lon), BaseConfig.CONDITIONS_LAND_TIMEOUT)
+            if date.date() == datetime.now().date()
+            else self._unavailable('Current weather is only available for today'),
+            'tide': self._run_source(self._tide(date), BaseConfig.CONDITIONS_TIDE_TIMEOUT),
+        }
+        for name, DATA_TYPE in (('obsrecent', 'tideObsRecent'), ('obspretab', 'tideObsPreTab')):
+            station = stations[name]
+            sources[name] = self._run_source(self._sea_weather(DATA_TYPE, station['obs_post_id'], khoa_date),
+                                             BaseConfig.CONDITIONS_SEA_TIMEOUT) \
+                if station else self._unavailable('No matching observation station')
+
+        # 전체 소요 시간 = 가장 느린 source (합이 아님)
+        results = dict(zip(sources, await asyncio.gather(*sources.values())))
+
+        return {
+            'date': date.strftime('%Y-%m-%d'),
+            'land': results['land'],
+            'sea': {name: {**results[name], 'station': stations[name]} for name in ('obsrecent', 'obspretab')},
+            'tide': results['tide'],
+        }
+
+    def get_conditions(self, lat, lon, date):
+        """
+        Merged conditions document for the coordinates and date (partial on source failures)
+        """
+        station_index = get_tidal_station_index()
+        stations = {
+            'obsrecent': station_index.nearest(lat, lon, OBSRECENT_REQUIRED),
+            'obspretab': station_index.nearest(lat, lon, OBSPRETAB_REQUIRED, OBSPRETAB_EXCLUDED),
+        }
+        stations = {name: {
+            'obs_station_id': station['obs_station_id'],
+            'obs_post_id': station['obs_post_id'],
+            'obs_post_name': station['obs_post_name'],
+            'distance': station['distance'] / 1000,
+        } if station else None for name, station in stations.items()}
+
+        future = asyncio.run_coroutine_threadsafe(self._gather(lat, lon, date, stations), self._ensure_loop())
+        timeout = max(BaseConfig.CONDITIONS_LAND_TIMEOUT, BaseConfig.CONDITIONS_SEA_TIMEOUT,
+                      BaseConfig.CONDITIONS_TIDE_TIMEOUT)
+        return future.result(timeout=timeout + 1)
+
+
+conditions_fetcher = ConditionsFetcher()
@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import or_
+import threading
+
+from config import BaseConfig
+from models.model import Session, User
+
+
+class CredentialServiceBusy(Exception):
+    """
+    Raised when the hashing queue is full (caller should answer 503)
+    """
+
+
+class CredentialService:
+    """
+    Password hashing on a dedicated bounded executor
+
+    Hashing is CPU-bound : a fixed number of hashing threads keeps a login burst from
+    starving request threads, and the bounded queue sheds load instead of growing latency.
+    """
+    def __init__(self, method, workers=2, max_pending=64, timeout=10):
+        self.method = method
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='credential-hash')
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def _run(self, fn, *args, **kwargs):
+        if not self._slots.acquire(blocking=False):
+            raise CredentialServiceBusy("Too many pending password hash operations")
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def hash_password(self, password):
+        return self._run(generate_password_hash, password, method=self.method).result(self.timeout)
+
+    def verify_password(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password).result(self.timeout)
+
+    def needs_rehash(self, password_hash):
+        # werkzeug 형식 : "method$salt$hash" (method 예 : scrypt:32768:8:1)
+        return password_hash.split('$', 1)[0] != self.method
+
+    def rehash_in_background(self, user_id, old_hash, password):
+        """
+        Upgrade a stored hash to the configured method after a successful login (best effort)
+
+        The row is updated only while it still holds `old_hash` (the hash verified at login),
+        so a password change made meanwhile is never overwritten.
+        """
+        def rehash():
+            new_hash = generate_password_hash(password, method=self.method)
+            # 요청의 scoped session과 분리된 세션 사용
+            with Session.session_factory() as session:
+                updated = session.query(User)\
+                    .filter(User.user_id == user_id, User.password_hash == old_hash)\
+                    .update({'password_hash': new_hash}, synchronize_session=False)
+                session.commit()
+            if not updated:
+                print(f"Password rehash skipped for user {user_id} : password changed meanwhile")
+
+        def report(future):
+            if future.exception():
+                print(f"Password rehash failed for user {user_id} on {future.exception()}")
+
+        try:
+            self._run(rehash).add_done_callback(report)
+        except CredentialServiceBusy:
+            pass  # 다음 로그인 시 다시 시도
+
+
+def find_user_conflicts(session, username, email):
+    """
+    (username taken, email taken) with a single query
+    """
+    rows = session.query(User.username, User.email).filter(
+        or_(User.username == username, User.email == email)
+    ).all()
+    return (any(row.username == username for row in rows),
+            any(row.email == email for row in rows))
+
+
+credentials = CredentialService(BaseConfig.PASSWORD_HASH_METHOD,
+                                workers=BaseConfig.PASSWORD_HASH_WORKERS,
+                                max_pending=BaseConfig.PASSWORD_HASH_MAX_PENDING)
@@ -0,0 +1,44 @@
+import hashlib
+
+from config import BaseConfig
+from utils.cache import get_cache
+
+
+def get_image_digest(image):
+    """
+    Exact content hash of the (optimized) PIL image pixels
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.mode}:{image.size[0]}x{image.size[1]}:".encode('utf-8'))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def _cache_key(image_digest):
+    # 모델 / 추론 설정이 바뀌면 이전 결과를 사용하지 않도록 key에 포함
+    return ":".join([
+        BaseConfig.DETECTION_CACHE_VERSION,
+        BaseConfig.INFERENCE_BACKEND,
+        BaseConfig.INFERENCE_PRECISION,
+        str(BaseConfig.CONF_SCORE),
+        image_digest,
+    ])
+
+
+def get_cached_detections(image_digest):
+    """
+    Cached /predict result ({'detections', 'box_count', 'image_key'}) for the image digest, None on miss
+
+    image_key : upload store key of the JPEG saved for this image (None until it is saved once)
+    """
+    cache = get_cache('detections', BaseConfig.DETECTION_CACHE_SIZE, BaseConfig.DETECTION_CACHE_TTL)
+    return cache.get(_cache_key(image_digest))
+
+
+def set_cached_detections(image_digest, detections, box_count, image_key=None):
+    cache = get_cache('detections', BaseConfig.DETECTION_CACHE_SIZE, BaseConfig.DETECTION_CACHE_TTL)
+    cache.set(_cache_key(image_digest), {
+        'detections': detections,
+        'box_count': box_count,
+        'image_key': image_key,
+    })
@@ -0,0 +1,230 @@
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+import threading
+import hashlib
+import gzip
+import json
+import time
+import re
+
+from config import BaseConfig
+from models.model import engine, FishingPlace
+from services.spatial_index import SpatialIndex
+from utils.url_utils import custom_sort_key
+
+
+def get_spot_summary(spot):
+    """
+    FishingPlace row to the /api/spots list item
+    """
+    return {
+        'fishing_place_id': spot.fishing_place_id,
+        'name': spot.name,
+        'type': spot.type,
+        'latitude': spot.latitude,
+        'longitude': spot.longitude,
+        'address_road': " ".join((spot.address_road or '').split()[:3]),
+        'address_land': " ".join((spot.address_land or '').split()[:3]),
+    }
+
+
+# 시/도 표기 (약칭 포함) -> Kakao coord2regioncode region_1depth_name
+_PROVINCES = {
+    '서울특별시': '서울특별시', '서울시': '서울특별시', '서울': '서울특별시',
+    '부산광역시': '부산광역시', '부산시': '부산광역시', '부산': '부산광역시',
+    '대구광역시': '대구광역시', '대구시': '대구광역시', '대구': '대구광역시',
+    '인천광역시': '인천광역시', '인천시': '인천광역시', '인천': '인천광역시',
+    '광주광역시': '광주광역시', '광주': '광주광역시',
+    '대전광역시': '대전광역시', '대전시': '대전광역시', '대전': '대전광역시',
+    '울산광역시': '울산광역시', '울산시': '울산광역시', '울산': '울산광역시',
+    '세종특별자치시': '세종특별자치시', '세종시': '세종특별자치시', '세종': '세종특별자치시',
+    '경기도': '경기도', '경기': '경기도',
+    '강원특별자치도': '강원특별자치도', '강원도': '강원특별자치도', '강원': '강원특별자치도',
+    '충청북도': '충청북도', '충북': '충청북도',
+    '충청남도': '충청남도', '충남': '충청남도',
+    '전북특별자치도': '전북특별자치도', '전라북도': '전북특별자치도', '전북': '전북특별자치도',
+    '전라남도': '전라남도', '전남': '전라남도',
+    '경상북도': '경상북도', '경북': '경상북도',
+    '경상남도': '경상남도', '경남': '경상남도',
+    '제주특별자치도': '제주특별자치도', '제주도': '제주특별자치도', '제주': '제주특별자치도',
+}
+
+# 도로명 주소의 참고항목 "(동숭동)", "지하(은행동)", "(동숭동, 아파트명)"
+_ROAD_ADDRESS_DONG = re.compile(r'\(([^,()\s]+(?:동|가))[,)]')
+
+
+def _parse_region(address):
+    """
+    [시/도, 시/군/구..., 읍/면/동] tokens of an address (시/도 is None when the address omits it)
+    """
+    tokens = (address or '').split()
+    if not tokens:
+        return []
+
+    province = _PROVINCES.get(tokens[0])
+    if province:
+        tokens = tokens[1:]
+
+    # 시/군/구 (일반구가 있는 시는 "청주시 상당구"처럼 두 단계)
+    districts = []
+    while tokens and len(districts) < 2 and tokens[0].endswith(('시', '군', '구')):
+        districts.append(tokens.pop(0))
+    if not province and not districts:
+        return []
+
+    region = [province, *districts]
+    if tokens and tokens[0].endswith(('읍', '면', '동', '가')):
+        region.append(tokens[0])
+    else:
+        dong = _ROAD_ADDRESS_DONG.search(address)
+        if dong:
+            region.append(dong.group(1))
+    return region
+
+
+def get_region_name(address_land, address_road=None):
+    """
+    '시/도 시/군/구 읍/면/동' region name of the spot addresses (Kakao coord2regioncode address_name form)
+
+    Province abbreviations are expanded, a missing province is taken from the other address and the
+    name stops at '시/도 시/군/구' when neither address has a 읍/면/동. None if no region can be read.
+    """
+    land, road = _parse_region(address_land), _parse_region(address_road)
+
+    # 시/도 누락 : 같은 시/군/구의 다른 주소에서 보완
+    for region, other in ((land, road), (road, land)):
+        if region and region[0] is None and other and other[0] and other[1:2] == region[1:2]:
+            region[0] = other[0]
+
+    candidates = [region for region in (land, road) if region and region[0] and len(region) > 1]
+    if not candidates:
+        return None
+    return " ".join(max(candidates, key=len))
+
+
+class SpotsSnapshot:
+    """
+    Pre-serialized /api/spots response (identity + gzip bodies with their ETags)
+    """
+    def __init__(self, spots, message):
+        payload = {
+            'status': 'success',
+            'message': message,
+            'data': sorted(spots, key=custom_sort_key),
+        }
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.gzip_body = gzip.compress(self.body, compresslevel=9, mtime=0)
+
+        # 표현(representation)별 strong ETag
+        digest = hashlib.blake2b(self.body, digest_size=16).hexdigest()
+        self.etag = digest
+        self.gzip_etag = f"{digest}-gz"
+
+
+class FishingSpotIndex:
+    """
+    In-memory spatial index (k-nearest / radius / bounding box) over FishingPlace summaries
+    """
+    def __init__(self, spots, regions=None):
+        self.spots = {spot['fishing_place_id']: spot for spot in spots}
+        # 역지오코딩 오프라인 대체용 행정구역명 (/api/spots 응답에는 포함하지 않음)
+        self.regions = regions or {}
+        self.max_id = max(self.spots, default=0)
+        self._snapshot = None
+        self._index = SpatialIndex([spot['latitude'] for spot in self.spots.values()],
+                                   [spot['longitude'] for spot in self.spots.values()],
+                                   list(self.spots))
+
+    def __len__(self):
+        return len(self.spots)
+
+    def extend(self, spots, regions):
+        """
+        New index with additional spots (indexes are immutable, swapped on refresh)
+        """
+        return FishingSpotIndex([*self.spots.values(), *spots], {**self.regions, **regions})
+
+    def region(self, spot_id):
+        return self.regions.get(spot_id)
+
+    def snapshot(self, message):
+        """
+        Full sorted spot list, serialized once per index (index is replaced when the table changes)
+        """
+        if self._snapshot is None:
+            self._snapshot = SpotsSnapshot(self.spots.values(), message)
+        return self._snapshot
+
+    def _with_distance(self, found):
+        return [{**self.spots[spot_id], 'distance': distance / 1000} for spot_id, distance in found]
+
+    def nearest(self, lat, lon, k=10):
+        return self._with_distance(self._index.nearest(lat, lon, k=k))
+
+    def within_radius(self, lat, lon, radius_km, limit=None):
+        return self._with_distance(self._index.within_radius(lat, lon, radius_km * 1000)[:limit])
+
+    def within_bbox(self, south, west, north, east):
+        return [self.spots[spot_id] for spot_id in self._index.within_bbox(south, west, north, east)]
+
+
+def _load_spots(session, after_id=0):
+    """
+    Spot summaries and region names {fishing_place_id: region} of rows after `after_id`
+    """
+    spots = session.query(FishingPlace).filter(FishingPlace.fishing_place_id > after_id).all()
+    regions = {spot.fishing_place_id: get_region_name(spot.address_land, spot.address_road) for spot in spots}
+    return [get_spot_summary(spot) for spot in spots], {key: value for key, value in regions.items() if value}
+
+
+def _table_fingerprint(session):
+    return tuple(session.query(func.count(FishingPlace.fishing_place_id),
+                               func.max(FishingPlace.fishing_place_id)).one())
+
+
+_index = None
+_fingerprint = None
+_checked_at = 0.0
+_index_lock = threading.Lock()
+
+
+def get_fishing_spot_index():
+    """
+    Shared spot index, refreshed when the FishingPlace table changes
+    """
+    global _index, _fingerprint, _checked_at
+
+    # 테이블 변경 여부는 일정 주기로만 확인 (조회 시 DB 접근 없음)
+    if _index is not None and time.monotonic() - _checked_at < BaseConfig.SPOT_INDEX_CHECK_INTERVAL:
+        return _index
+
+    with _index_lock:
+        if _index is not None and time.monotonic() - _checked_at < BaseConfig.SPOT_INDEX_CHECK_INTERVAL:
+            return _index
+
+        session = sessionmaker(bind=engine)()
+        try:
+            fingerprint = _table_fingerprint(session)
+            if _index is None or fingerprint != _fingerprint:
+                new_spots, new_regions = _load_spots(session, _index.max_id) if _index is not None else ([], {})
+                if _index is not None and len(_index) + len(new_spots) == fingerprint[0]:
+                    # 행 추가만 있는 경우 : 새 행만 조회하여 인덱스 확장
+                    _index = _index.extend(new_spots, new_regions)
+                else:
+                    _index = FishingSpotIndex(*_load_spots(session))
+                _fingerprint = fingerprint
+                print(f"Fishing spot index built : {len(_index)} spots")
+            _checked_at = time.monotonic()
+        finally:
+            session.close()
+
+    return _index
+
+
+def invalidate_fishing_spot_index():
+    """
+    Re-check the table on next lookup (called after insert_fishing_place_data)
+    """
+    global _checked_at
+    with _index_lock:
+        _checked_at = 0.0
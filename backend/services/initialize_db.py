@@ -47,6 +47,10 @@ def insert_tidal_data(json_file_path):
         session.execute(insert(TidalObservation), new_data)
         session.commit()
         print(f"Inserted {len(new_data)} new tidal observations.")
+
+        # 관측소 공간 인덱스 재생성
+        from services.tidal_stations import invalidate_tidal_station_index
+        invalidate_tidal_station_index()
         
     except SQLAlchemyError as e:
         session.rollback()
@@ -113,6 +117,10 @@ def insert_fishing_place_data(json_file_path):
         session.execute(insert(FishingPlace), new_data)
         session.commit()
         print(f"Inserted {len(new_data)} new fishing places.")
+
+        # 낚시터 공간 인덱스 갱신
+        from services.fishing_spots import invalidate_fishing_spot_index
+        invalidate_fishing_spot_index()
         
     except SQLAlchemyError as e:
         session.rollback()
@@ -1,30 +1,163 @@
 import requests
+import threading
+import atexit
+import json
+import time
 import os
 
+from config import BaseConfig
+from utils.cache import get_cache, LRUCache
+from utils.http_client import http_get
+from services.fishing_spots import get_fishing_spot_index
+
 # 환경변수에서 WEATHER_API_KEY를 가져옵니다.
 KAKAO_API_KEY = os.getenv('KAKAO_API_KEY')
 
+# Kakao 장애 시 일정 시간 동안 호출하지 않음 (장애가 응답 지연으로 이어지지 않도록)
+_kakao_retry_at = 0.0
+_unsaved = 0
+_persist_lock = threading.Lock()
+
+
+def _geocode_cache():
+    cache = get_cache('geocode', BaseConfig.GEOCODE_CACHE_SIZE)
+    if BaseConfig.GEOCODE_CACHE_FILE and isinstance(cache, LRUCache) and not getattr(cache, 'loaded', False):
+        _load_cache_file(cache)
+    return cache
+
+
+def _load_cache_file(cache):
+    with _persist_lock:
+        if getattr(cache, 'loaded', False):
+            return
+        try:
+            with open(BaseConfig.GEOCODE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                for key, value in json.load(f):
+                    cache.set(key, value)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Geocode cache file could not be loaded : {e}")
+        cache.loaded = True
+        atexit.register(save_geocode_cache)
+
+
+def save_geocode_cache():
+    """
+    Persist the in-process geocode cache to GEOCODE_CACHE_FILE (atomic replace)
+    """
+    cache = get_cache('geocode', BaseConfig.GEOCODE_CACHE_SIZE)
+    if not BaseConfig.GEOCODE_CACHE_FILE or not isinstance(cache, LRUCache):
+        return
+
+    with _persist_lock:
+        folder = os.path.dirname(BaseConfig.GEOCODE_CACHE_FILE)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = f"{BaseConfig.GEOCODE_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache.items(include_expiring=False), f, ensure_ascii=False)
+        os.replace(tmp_path, BaseConfig.GEOCODE_CACHE_FILE)
+
+
+def _remember(key, location_name, ttl=None):
+    global _unsaved
+    cache = _geocode_cache()
+    cache.set(key, location_name, ttl)
+
+    # 만료 시간이 있는 값(Kakao 장애 중 대체 응답)은 파일에 저장하지 않음
+    if ttl or not BaseConfig.GEOCODE_CACHE_FILE:
+        return
+
+    with _persist_lock:
+        _unsaved += 1
+        should_save = _unsaved >= BaseConfig.GEOCODE_SAVE_EVERY
+        if should_save:
+            _unsaved = 0
+    if should_save:
+        try:
+            save_geocode_cache()
+        except OSError as e:
+            print(f"Geocode cache file could not be saved : {e}")
+
+
+def get_local_location(lat, lon, max_distance_m):
+    """
+    Region name (시/도 시/군/구 읍/면/동) of the nearest FishingPlace within max_distance_m
+
+    Built from the spot's full addresses in the Kakao 'H' address_name form (see get_region_name).
+    """
+    index = get_fishing_spot_index()
+    for spot in index.nearest(lat, lon, k=5):
+        if spot['distance'] * 1000 > max_distance_m:
+            break
+        region = index.region(spot['fishing_place_id'])
+        if region:
+            return region
+    return None
+
+
+def fetch_kakao_location(lat, lon):
+    """
+    Call Kakao coord2regioncode (uncached) : administrative ('H') region name or None
+    """
+    url = f"https://dapi.kakao.com/v2/local/geo/coord2regioncode.json?x={lon}&y={lat}"
+    headers = {
+        "Authorization": KAKAO_API_KEY,
+    }
+
+    # 재시도 없이 실패 처리 (장애 시 backoff + 낚시터 주소 대체)
+    response = http_get(url, headers=headers, timeout=BaseConfig.GEOCODE_TIMEOUT, retries=0)
+    response.raise_for_status()  # Raise an error for bad status codes
+
+    data = response.json()
+
+    if "documents" in data and len(data["documents"]) > 0:
+        document = next((doc for doc in data["documents"] if doc.get("region_type") == "H"), None)
+        if document:
+            return document["address_name"]
+    return None  # Return None if no 'H' type is found
+
+
 def get_location_by_coordinates(lat, lon):
+    """
+    Region name of the coordinates : cache -> nearby spot address -> Kakao -> farther spot address
+    """
+    global _kakao_retry_at
+
+    lat, lon = float(lat), float(lon)
+    key = f"{round(lat, BaseConfig.GEOCODE_PRECISION)}:{round(lon, BaseConfig.GEOCODE_PRECISION)}"
+
+    missing = object()
+    location_name = _geocode_cache().get(key, missing)
+    if location_name is not missing:
+        return location_name
+
+    try:
+        # 가까운 낚시터 주소가 있으면 외부 호출 없이 응답
+        location_name = get_local_location(lat, lon, BaseConfig.GEOCODE_LOCAL_RADIUS_M)
+        if location_name:
+            _remember(key, location_name)
+            return location_name
+    except Exception as e:
+        print(f"Local geocoding failed on {e}")
+
+    if time.monotonic() >= _kakao_retry_at:
+        try:
+            location_name = fetch_kakao_location(lat, lon)
+            _remember(key, location_name)
+            return location_name
+
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Error during request: {e}")
+            _kakao_retry_at = time.monotonic() + BaseConfig.GEOCODE_OUTAGE_BACKOFF
+
+    # Kakao 장애 : 더 먼 거리의 낚시터 주소로 대체 (장애 대기 시간 동안만 캐시)
     try:
-        url = f"https://dapi.kakao.com/v2/local/geo/coord2regioncode.json?x={lon}&y={lat}"
-        headers = {
-            "Authorization": KAKAO_API_KEY,
-        }
-
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # Raise an error for bad status codes
-
-        data = response.json()
-
-        if "documents" in data and len(data["documents"]) > 0:
-            document = next((doc for doc in data["documents"] if doc.get("region_type") == "H"), None)
-            if document:
-                location_name = document["address_name"]
-                return  location_name
-            return None  # Return None if no 'H' type is found
-        else:
-            return None
-
-    except requests.exceptions.RequestException as e:
-        print(f"Error during request: {e}")
-        return None
\ No newline at end of file
+        location_name = get_local_location(lat, lon, BaseConfig.GEOCODE_FALLBACK_RADIUS_M)
+        if location_name:
+            _remember(key, location_name, ttl=BaseConfig.GEOCODE_OUTAGE_BACKOFF)
+        return location_name
+    except Exception as e:
+        print(f"Local geocoding failed on {e}")
+        return None
@@ -1,5 +1,7 @@
 from korean_lunar_calendar import KoreanLunarCalendar
-from datetime import datetime
+from datetime import datetime, date, timedelta
+import threading
+import numpy as np
 
  ## Initial 
 eight_tide_cycle = {
@@ -22,13 +24,15 @@ def get_tide_cycle(nowdate):
         # Calendar 불러오기
         calendar = KoreanLunarCalendar()
 
-        # 오늘 날짜 기준으로 Set
-        calendar.setSolarDate(nowdate.year,
-                            nowdate.month,
-                            nowdate.day)
+        # 오늘 날짜 기준으로 Set (지원 범위 밖이면 이전 값이 남으므로 실패 처리)
+        if not calendar.setSolarDate(nowdate.year,
+                                     nowdate.month,
+                                     nowdate.day):
+            raise ValueError(f"Unsupported solar date : {nowdate}")
 
         lunar_nowdate = calendar.LunarIsoFormat()
-        lunar_nowdate_day = int(lunar_nowdate.split("-")[-1])
+        # 윤달은 "YYYY-MM-DD Intercalation" 형식이므로 음력 일자는 lunarDay 사용
+        lunar_nowdate_day = calendar.lunarDay
         
         seohae_tide_cycle = seven_tide_cycle[lunar_nowdate_day]
         other_tide_cycle = eight_tide_cycle[lunar_nowdate_day]
@@ -54,4 +58,130 @@ def calculate_moon_phase(date):
         return moon_phase
     except Exception as e:
         print(f"calculated_moon_phase : Error Occured on {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+# 월령 계산 기준 (calculate_moon_phase와 동일)
+KNOWN_NEW_MOON = date(2000, 1, 6)
+LUNAR_CYCLE = 29.53058867
+
+# 사전 계산 범위 (korean_lunar_calendar 양력 지원 범위 : ~2050-12-31)
+TIDE_CALENDAR_START = date(1990, 1, 1)
+TIDE_CALENDAR_END = date(2050, 12, 31)
+
+
+class TideCalendar:
+    """
+    Array-backed daily table of lunar date, mulddae and moon phase (O(1) lookup by date)
+    """
+    def __init__(self, start=TIDE_CALENDAR_START, end=TIDE_CALENDAR_END):
+        self.start = start
+        self.end = end
+        days = (end - start).days + 1
+
+        self.lunar_year = np.zeros(days, dtype=np.int16)
+        self.lunar_month = np.zeros(days, dtype=np.int8)
+        self.lunar_day = np.zeros(days, dtype=np.int8)
+        self.intercalation = np.zeros(days, dtype=np.bool_)
+
+        # 음력 월은 29일 또는 30일 : 29일 이후에만 달력 변환 (월 경계 확인)
+        calendar = KoreanLunarCalendar()
+        for i in range(days):
+            if i > 0 and self.lunar_day[i - 1] < 29:
+                self.lunar_year[i] = self.lunar_year[i - 1]
+                self.lunar_month[i] = self.lunar_month[i - 1]
+                self.lunar_day[i] = self.lunar_day[i - 1] + 1
+                self.intercalation[i] = self.intercalation[i - 1]
+                continue
+
+            solar = start + timedelta(days=i)
+            if not calendar.setSolarDate(solar.year, solar.month, solar.day):
+                raise ValueError(f"Unsupported solar date : {solar}")
+            self.lunar_year[i] = calendar.lunarYear
+            self.lunar_month[i] = calendar.lunarMonth
+            self.lunar_day[i] = calendar.lunarDay
+            self.intercalation[i] = calendar.isIntercalation
+
+        delta_days = np.arange(days) + (start - KNOWN_NEW_MOON).days
+        self.moon_phase = (delta_days % LUNAR_CYCLE) / LUNAR_CYCLE
+
+    def __len__(self):
+        return len(self.lunar_day)
+
+    def _index(self, day):
+        if isinstance(day, datetime):
+            day = day.date()
+        if not self.start <= day <= self.end:
+            return None
+        return (day - self.start).days
+
+    def _entry(self, i):
+        lunar_day = int(self.lunar_day[i])
+        lunar_date = "%04d-%02d-%02d" % (self.lunar_year[i], self.lunar_month[i], lunar_day)
+        if self.intercalation[i]:
+            lunar_date += " Intercalation"  # 윤달 (LunarIsoFormat 형식)
+
+        return {
+            'date': (self.start + timedelta(days=i)).strftime('%Y-%m-%d'),
+            'lunar_date': lunar_date,
+            'seohae': seven_tide_cycle[lunar_day],
+            'other': eight_tide_cycle[lunar_day],
+            'moon_phase': float(self.moon_phase[i]),
+        }
+
+    def get(self, day):
+        """
+        Tide info of one date, None if out of the table range
+        """
+        i = self._index(day)
+        return self._entry(i) if i is not None else None
+
+    def get_range(self, start, end):
+        """
+        Tide info of every date in [start, end] (clipped to the table range)
+        """
+        start, end = max(start, self.start), min(end, self.end)
+        if start > end:
+            return []
+        return [self._entry(i) for i in range(self._index(start), self._index(end) + 1)]
+
+    def get_month(self, year, month):
+        first = date(year, month, 1)
+        last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        return self.get_range(first, last)
+
+    def get_year(self, year):
+        return self.get_range(date(year, 1, 1), date(year, 12, 31))
+
+
+_tide_calendar = None
+_tide_calendar_lock = threading.Lock()
+
+
+def get_tide_calendar():
+    """
+    Shared tide calendar (built once per process on first use)
+    """
+    global _tide_calendar
+    if _tide_calendar is None:
+        with _tide_calendar_lock:
+            if _tide_calendar is None:
+                _tide_calendar = TideCalendar()
+    return _tide_calendar
+
+
+def get_tide_info(nowdate):
+    """
+    lunar_date / seohae / other / moon_phase of the date (table lookup, calculated outside its range)
+    """
+    entry = get_tide_calendar().get(nowdate)
+    if entry is not None:
+        return {key: entry[key] for key in ('lunar_date', 'seohae', 'other', 'moon_phase')}
+
+    lunar_date, seohae, other = get_tide_cycle(nowdate)
+    return {
+        'lunar_date': lunar_date,
+        'seohae': seohae,
+        'other': other,
+        'moon_phase': calculate_moon_phase(nowdate),
+    }
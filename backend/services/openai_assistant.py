@@ -24,26 +24,20 @@ def assistant_talk_request(search_type):
     
     return request_id
 
-def assistant_talk_get(target_thread_id, target_run_id):
-    timeout = 30
-    start_time = time.time()
-    
+def get_run_status(target_thread_id, target_run_id):
+    with openai_client() as client:
+        run = client.beta.threads.runs.retrieve(
+            thread_id=target_thread_id, 
+            run_id=target_run_id
+        )
+    return run.status
+
+
+def get_assistant_answer(target_thread_id):
+    """
+    Formatted first assistant message of the thread (None if empty)
+    """
     with openai_client() as client:
-        # Run 상태 확인 및 타임아웃 처리
-        while True:
-            run = client.beta.threads.runs.retrieve(
-                thread_id=target_thread_id, 
-                run_id=target_run_id
-            )
-            if run.status == "completed":
-                print("complete")
-                break
-            elif run.status in ["failed", "error"]:
-                raise Exception(f"Run failed with status: {run.status}")
-            elif time.time() - start_time > timeout:
-                raise TimeoutError("Run did not complete within the timeout period.")
-            time.sleep(0.5)
-        
         # 메시지 리스트 가져오기
         messages = client.beta.threads.messages.list(thread_id=target_thread_id)
         
@@ -66,4 +60,22 @@ def assistant_talk_get(target_thread_id, target_run_id):
         return formatted_text
     else:
         return None
+
+
+def assistant_talk_get(target_thread_id, target_run_id):
+    timeout = 30
+    start_time = time.time()
+    
+    # Run 상태 확인 및 타임아웃 처리
+    while True:
+        status = get_run_status(target_thread_id, target_run_id)
+        if status == "completed":
+            print("complete")
+            break
+        elif status in ["failed", "error"]:
+            raise Exception(f"Run failed with status: {status}")
+        elif time.time() - start_time > timeout:
+            raise TimeoutError("Run did not complete within the timeout period.")
+        time.sleep(0.5)
     
+    return get_assistant_answer(target_thread_id)
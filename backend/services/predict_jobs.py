@@ -0,0 +1,405 @@
+from datetime import datetime
+import os
+import re
+import json
+import time
+import uuid
+import queue
+import threading
+
+from config import BaseConfig
+from models.model import Session, Catch
+from services.assistant_answers import get_cached_answer, request_answer
+from services.upload_store import upload_store
+from utils.cache import get_cache, get_redis_client
+from utils.file_utils import save_encoded_image
+
+# Job 상태
+JOB_PENDING = 'pending'
+JOB_DONE = 'done'
+JOB_NOT_FOUND = 'not_found'
+JOB_FAILED = 'failed'
+
+JOB_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+
+def create_predict_job(user_id, catch_id, filename, detections):
+    """
+    /predict post-inference persistence job (JSON-serializable for spooling)
+    """
+    return {
+        'job_id': uuid.uuid4().hex,
+        'user_id': user_id,
+        'catch_id': int(catch_id) if catch_id else None,
+        'filename': filename,
+        'detections': detections,
+        'top_fish': detections[0]['label'] if detections else None,
+        'created_at': datetime.now().isoformat(),
+        'attempts': 0,
+        # 재시도 시 중복 처리 방지용 단계별 결과
+        'saved_catch_id': None,
+        'assistant_request_id': None,
+        'assistant_answer': None,
+        'assistant_done': False,
+    }
+
+
+class PredictJobPipeline:
+    """
+    Bounded background queue for /predict image write, Catch commit and assistant kickoff
+
+    Every job is spooled to a local folder before it is queued and removed only after the
+    Catch commit, so jobs of a crashed / restarted worker are replayed by another one.
+    """
+    def __init__(self, store, spool_folder, workers=2, maxsize=256,
+                 max_attempts=5, retry_interval=10, claim_timeout=120):
+        self.store = store
+        self.spool_folder = spool_folder
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_interval = retry_interval
+        # 처리 중인 작업 파일은 sweeper가 주기적으로 갱신 : 이 시간 이상 갱신이 없으면 다른 워커가 재처리
+        self.claim_timeout = claim_timeout
+
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._threads = []
+        self._started = False
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._owner = None
+        self._owner_pid = None
+
+    @property
+    def owner(self):
+        # 프로세스별 claim 식별자 (fork 이후 워커마다 새로 생성, pid 재사용과 구분)
+        if self._owner_pid != os.getpid():
+            self._owner_pid = os.getpid()
+            self._owner = f"{self._owner_pid}-{uuid.uuid4().hex[:8]}"
+        return self._owner
+
+    # ---- status ----
+    # Redis 사용 시 Redis, 아니면 spool 폴더의 상태 파일 (프로세스 내 캐시는 다른 워커에서 조회 불가)
+    def _status_cache(self):
+        if get_redis_client() is None:
+            return None
+        return get_cache('predict_jobs', BaseConfig.PREDICT_JOB_STATUS_SIZE, BaseConfig.PREDICT_JOB_STATUS_TTL)
+
+    def _status_path(self, job_id):
+        return os.path.join(self.spool_folder, 'status', f"{job_id}.json")
+
+    def _write_status(self, job_status):
+        cache = self._status_cache()
+        if cache is not None:
+            cache.set(job_status['job_id'], job_status)
+            return
+
+        path = self._status_path(job_status['job_id'])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._write_json(path, job_status)
+
+    def _read_status(self, job_id):
+        cache = self._status_cache()
+        if cache is not None:
+            return cache.get(job_id)
+
+        path = self._status_path(job_id)
+        try:
+            if time.time() - os.path.getmtime(path) > BaseConfig.PREDICT_JOB_STATUS_TTL:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _prune_status(self):
+        folder = os.path.join(self.spool_folder, 'status')
+        if self._status_cache() is not None or not os.path.isdir(folder):
+            return
+        expires_before = time.time() - BaseConfig.PREDICT_JOB_STATUS_TTL
+        for entry in os.scandir(folder):
+            try:
+                if entry.stat().st_mtime < expires_before:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+
+    def _set_status(self, job, status, error=None):
+        job_status = {
+            'job_id': job['job_id'],
+            'user_id': job['user_id'],
+            'status': status,
+            'catch_id': job['saved_catch_id'],
+            'imageUrl': job['filename'],
+            'assistant_request_id': job['assistant_request_id'],
+            'assistant_answer': job.get('assistant_answer'),
+            'error': error,
+        }
+        self._write_status(job_status)
+        return job_status
+
+    def get_status(self, job_id):
+        if not JOB_ID_PATTERN.fullmatch(job_id):
+            return None
+        job_status = self._read_status(job_id)
+        if job_status is None:
+            # 상태가 만료 / 유실된 경우에도 spool에 남아있으면 처리 대기 중
+            job = self._find_spooled_job(job_id)
+            if job is not None:
+                job_status = self._set_status(job, JOB_PENDING)
+        return job_status
+
+    # ---- execution ----
+    def run(self, job, encoded_image=None, checkpoint=None):
+        """
+        Execute the job synchronously and return its status
+
+        checkpoint(job) is called right after the Catch commit (spooled jobs record the
+        saved catch there, so a replay after a crash does not insert twice).
+        """
+        # 1. 이미지 저장 (filename : content-addressed key, 같은 이미지는 한 번만 저장)
+        if encoded_image is None and not self.store.exists(job['filename']):
+            encoded_image = self._read_spooled_image(job)
+        self.store.write(job['filename'], encoded_image)
+
+        # 2. Catch 저장 / 수정
+        if job['saved_catch_id'] is None:
+            session = Session()
+            replaced_photo = None
+            try:
+                if job['catch_id']:
+                    catch = session.query(Catch).filter_by(catch_id=job['catch_id'], user_id=job['user_id']).first()
+                    if not catch:
+                        # 참조가 없는 blob은 upload_store GC에서 정리
+                        return self._set_status(job, JOB_NOT_FOUND, "Not found : existed catch_id")
+                    if catch.photo_url != job['filename']:
+                        replaced_photo = catch.photo_url
+                    catch.detect_data = job['detections']
+                    catch.photo_url = job['filename']
+                    catch.catch_date = datetime.now()
+                else:
+                    catch = Catch(
+                        user_id=job['user_id'],
+                        photo_url=job['filename'],
+                        detect_data=job['detections'],
+                        catch_date=datetime.now()
+                    )
+                    session.add(catch)
+                session.commit()
+                job['saved_catch_id'] = catch.catch_id
+                if checkpoint is not None:
+                    checkpoint(job)
+                if replaced_photo:
+                    self.store.release(session, [replaced_photo])
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+        # 3. Assistant 답변 : 어종별 캐시 우선, 없을 때만 생성 요청 (실패 시 재시도하지 않음)
+        if job['top_fish'] and not job['assistant_done']:
+            job['assistant_answer'] = get_cached_answer(job['top_fish'])
+            if not job['assistant_answer']:
+                try:
+                    # 같은 어종의 진행 중인 run 공유, 백그라운드 상태 확인 (완료 시 답변 캐시 저장)
+                    job['assistant_request_id'] = request_answer(job['top_fish'])
+                except Exception as e:
+                    print(f"assistant_request_id 호출 실패 : {e}")
+            job['assistant_done'] = True
+
+        return self._set_status(job, JOB_DONE)
+
+    def submit(self, job, encoded_image):
+        """
+        Spool the job, queue it for background execution and return its id
+        """
+        self.start()
+        self._set_status(job, JOB_PENDING)
+
+        # Queue에 넣기 전에 spool에 기록 (처리 완료 전 프로세스 종료 시 재처리)
+        claimed_path = self._spool(job, encoded_image, owner=self.owner)
+        try:
+            self._queue.put_nowait((job, encoded_image, claimed_path))
+        except queue.Full:
+            # Queue 초과 : claim 해제 후 sweeper가 재처리
+            os.replace(claimed_path, self._spool_path(job['job_id'], 'json'))
+
+        return job['job_id']
+
+    def _process(self, job, encoded_image, claimed_path):
+        job['attempts'] += 1
+        try:
+            self.run(job, encoded_image, checkpoint=lambda job: self._write_json(claimed_path, job))
+        except Exception as e:
+            print(f"PredictJobPipeline : job {job['job_id']} failed ({job['attempts']}) on {e}")
+            if job['attempts'] >= self.max_attempts:
+                self._set_status(job, JOB_FAILED, str(e))
+                self._spool(job, encoded_image, failed=True)
+                self._remove(claimed_path)
+            else:
+                # 시도 횟수 기록 후 claim 해제 (retry_interval 후 재처리)
+                self._write_json(claimed_path, job)
+                os.replace(claimed_path, self._spool_path(job['job_id'], 'json'))
+            return
+
+        # DB 저장 완료 후 spool 정리
+        self._remove_spooled_image(job)
+        self._remove(claimed_path)
+
+    def _worker(self):
+        while not self._stop.is_set():
+            try:
+                job, encoded_image, claimed_path = self._queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            try:
+                self._process(job, encoded_image, claimed_path)
+            except Exception as e:
+                print(f"PredictJobPipeline : job {job['job_id']} could not be spooled on {e}")
+            finally:
+                Session.remove()
+                self._queue.task_done()
+
+    # ---- durable spool ----
+    # <job_id>.json : 처리 대기, <job_id>.json.<owner>.claimed : 해당 프로세스가 처리 중
+    def _spool_path(self, job_id, extension, failed=False):
+        folder = os.path.join(self.spool_folder, 'failed') if failed else self.spool_folder
+        return os.path.join(folder, f"{job_id}.{extension}")
+
+    def _claimed_path(self, job_id, owner):
+        return self._spool_path(job_id, f"json.{owner}.claimed")
+
+    @staticmethod
+    def _write_json(path, data):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _spool(self, job, encoded_image, failed=False, owner=None):
+        os.makedirs(os.path.join(self.spool_folder, 'failed'), exist_ok=True)
+
+        # 이미지가 아직 업로드 폴더에 저장되지 않은 경우 spool 폴더에 함께 저장
+        image_path = self._spool_path(job['job_id'], 'jpg', failed)
+        if failed and os.path.exists(self._spool_path(job['job_id'], 'jpg')):
+            # 실패한 작업의 이미지는 job 파일과 함께 failed/ 로 이동 (spool 루트에 남기지 않음)
+            os.replace(self._spool_path(job['job_id'], 'jpg'), image_path)
+        elif encoded_image is not None and not self.store.exists(job['filename']):
+            if not os.path.exists(image_path):
+                save_encoded_image(encoded_image, image_path)
+
+        if owner is not None:
+            path = self._claimed_path(job['job_id'], owner)
+        else:
+            path = self._spool_path(job['job_id'], 'json', failed)
+        self._write_json(path, job)
+        return path
+
+    def _read_spooled_image(self, job):
+        with open(self._spool_path(job['job_id'], 'jpg'), 'rb') as f:
+            return f.read()
+
+    def _remove_spooled_image(self, job):
+        self._remove(self._spool_path(job['job_id'], 'jpg'))
+
+    def _find_spooled_job(self, job_id):
+        prefix = f"{job_id}.json"
+        try:
+            names = [name for name in os.listdir(self.spool_folder)
+                     if name == prefix or (name.startswith(f"{prefix}.") and name.endswith('.claimed'))]
+        except OSError:
+            return None
+        for name in names:
+            try:
+                with open(os.path.join(self.spool_folder, name), 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+        return None
+
+    def _claim(self, path, name):
+        """
+        Atomically claim a spooled job file and queue it, False if the queue is full
+        """
+        job_id = name.split('.', 1)[0]
+        claimed_path = self._claimed_path(job_id, self.owner)
+        try:
+            os.rename(path, claimed_path)
+        except FileNotFoundError:
+            return True  # 다른 워커가 먼저 가져감
+        os.utime(claimed_path)
+
+        try:
+            with open(claimed_path, 'r', encoding='utf-8') as f:
+                job = json.load(f)
+            self._queue.put_nowait((job, None, claimed_path))
+        except queue.Full:
+            os.replace(claimed_path, self._spool_path(job_id, 'json'))
+            return False
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"PredictJobPipeline : spooled job {name} could not be loaded on {e}")
+        return True
+
+    def _claim_spooled_jobs(self):
+        """
+        Claim pending and abandoned spooled jobs (several web workers may share the spool folder)
+        """
+        if not os.path.isdir(self.spool_folder):
+            return
+
+        owner_suffix = f".{self.owner}.claimed"
+        stale_before = time.time() - self.claim_timeout
+        for entry in sorted(os.scandir(self.spool_folder), key=lambda entry: entry.name):
+            name = entry.name
+            try:
+                if name.endswith(owner_suffix):
+                    # 이 프로세스가 처리 중인 작업 : 처리 중임을 표시 (heartbeat)
+                    os.utime(entry.path)
+                elif name.endswith('.claimed'):
+                    # 종료된 워커가 남긴 작업 : 일정 시간 갱신이 없으면 재처리
+                    if entry.stat().st_mtime < stale_before and not self._queue.full():
+                        self._claim(entry.path, name)
+                elif name.endswith('.json') and not self._queue.full():
+                    self._claim(entry.path, name)
+            except FileNotFoundError:
+                continue
+
+    def _sweeper(self):
+        # 시작 시 남아있는 spool 재처리 이후 주기적으로 확인
+        while not self._stop.is_set():
+            try:
+                self._claim_spooled_jobs()
+                self._prune_status()
+            except Exception as e:
+                print(f"PredictJobPipeline : spool sweep failed on {e}")
+            self._stop.wait(self.retry_interval)
+
+    def start(self):
+        """
+        Start worker / spool sweeper threads (once per process)
+        """
+        if self._started:
+            return
+        with self._start_lock:
+            if self._started:
+                return
+            self._threads = [threading.Thread(target=self._worker, name=f'predict-job-{i}', daemon=True)
+                             for i in range(self.workers)]
+            self._threads.append(threading.Thread(target=self._sweeper, name='predict-job-sweeper', daemon=True))
+            for thread in self._threads:
+                thread.start()
+            self._started = True
+
+
+predict_jobs = PredictJobPipeline(upload_store,
+                                  BaseConfig.PREDICT_JOB_SPOOL_FOLDER,
+                                  workers=BaseConfig.PREDICT_JOB_WORKERS,
+                                  maxsize=BaseConfig.PREDICT_JOB_QUEUE_SIZE,
+                                  claim_timeout=BaseConfig.PREDICT_JOB_CLAIM_TIMEOUT)
@@ -0,0 +1,85 @@
+from scipy.spatial import cKDTree
+import numpy as np
+
+# MySQL ST_Distance_Sphere 기본 지구 반지름 (m)
+EARTH_RADIUS_M = 6370986
+
+
+def to_unit_vectors(lats, lons):
+    """
+    Latitude / longitude (degrees) to 3D unit vectors
+    """
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lon = np.radians(np.asarray(lons, dtype=np.float64))
+    return np.column_stack([np.cos(lat) * np.cos(lon),
+                            np.cos(lat) * np.sin(lon),
+                            np.sin(lat)])
+
+
+def meters_to_chord(meters):
+    """
+    Great-circle distance (m) to chord length on the unit sphere
+    """
+    return 2 * np.sin(min(meters / EARTH_RADIUS_M, np.pi) / 2)
+
+
+def chord_to_meters(chord):
+    """
+    Chord length on the unit sphere to great-circle distance (m)
+    """
+    return 2 * np.arcsin(np.clip(np.asarray(chord) / 2, 0, 1)) * EARTH_RADIUS_M
+
+
+class SpatialIndex:
+    """
+    Great-circle nearest-neighbour index (KD-tree over unit-sphere vectors)
+
+    Chord distance between unit vectors is monotonic in great-circle distance,
+    so euclidean KD-tree neighbours are exact haversine neighbours.
+    """
+    def __init__(self, lats, lons, ids=None):
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lons = np.asarray(lons, dtype=np.float64)
+        self.ids = np.asarray(ids if ids is not None else np.arange(len(self.lats)))
+        self._tree = cKDTree(to_unit_vectors(self.lats, self.lons)) if len(self.lats) else None
+
+    def __len__(self):
+        return len(self.lats)
+
+    def nearest(self, lat, lon, k=1):
+        """
+        k nearest points as [(id, distance_m), ...] (closest first)
+        """
+        if self._tree is None:
+            return []
+
+        k = min(k, len(self))
+        chords, positions = self._tree.query(to_unit_vectors([lat], [lon])[0], k=k)
+        chords, positions = np.atleast_1d(chords), np.atleast_1d(positions)
+
+        return [(self.ids[position].item(), float(distance))
+                for position, distance in zip(positions, chord_to_meters(chords))]
+
+    def within_radius(self, lat, lon, radius_m):
+        """
+        Points within `radius_m` as [(id, distance_m), ...] (closest first)
+        """
+        if self._tree is None:
+            return []
+
+        vector = to_unit_vectors([lat], [lon])[0]
+        positions = np.asarray(self._tree.query_ball_point(vector, r=meters_to_chord(radius_m)), dtype=np.intp)
+        if not len(positions):
+            return []
+
+        chords = np.linalg.norm(self._tree.data[positions] - vector, axis=1)
+        order = np.argsort(chords, kind='stable')
+        return [(self.ids[position].item(), float(distance))
+                for position, distance in zip(positions[order], chord_to_meters(chords[order]))]
+
+    def within_bbox(self, south, west, north, east):
+        """
+        Ids of points inside the lat/lon bounding box (edges included)
+        """
+        mask = (self.lats >= south) & (self.lats <= north) & (self.lons >= west) & (self.lons <= east)
+        return self.ids[mask].tolist()
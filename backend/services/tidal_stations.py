@@ -0,0 +1,125 @@
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+import threading
+import time
+
+from config import BaseConfig
+from models.model import engine, TidalObservation
+from services.spatial_index import SpatialIndex
+
+# 관측 항목 (obs_object) bit 위치
+OBS_CAPABILITIES = ('조위', '수온', '염분', '기온', '기압', '풍속', '풍향',
+                    '조수간만', '유향', '유속', '파고', '없음')
+
+
+def capability_mask(*names):
+    mask = 0
+    for name in names:
+        mask |= 1 << OBS_CAPABILITIES.index(name)
+    return mask
+
+
+def parse_obs_object(obs_object):
+    """
+    obs_object string to capability bitset (substring match, same as LIKE '%...%')
+    """
+    return capability_mask(*[name for name in OBS_CAPABILITIES if name in (obs_object or '')])
+
+
+# /api/weather/sea 관측소 조건
+OBSRECENT_REQUIRED = capability_mask('조위', '수온', '기온', '기압')
+OBSPRETAB_REQUIRED = capability_mask('조수간만')
+OBSPRETAB_EXCLUDED = capability_mask('없음')
+
+
+class TidalStationIndex:
+    """
+    In-memory nearest tidal-station lookup with capability filters
+    """
+    def __init__(self, stations):
+        self.stations = stations
+        self._subsets = {}
+        self._subsets_lock = threading.Lock()
+
+    def _subset(self, required, excluded):
+        key = (required, excluded)
+        if key not in self._subsets:
+            matched = [i for i, station in enumerate(self.stations)
+                       if station['capabilities'] & required == required
+                       and not station['capabilities'] & excluded]
+            with self._subsets_lock:
+                self._subsets[key] = SpatialIndex([self.stations[i]['obs_lat'] for i in matched],
+                                                  [self.stations[i]['obs_lon'] for i in matched],
+                                                  matched)
+        return self._subsets[key]
+
+    def nearest(self, lat, lon, required=0, excluded=0):
+        """
+        Closest station having all `required` and none of `excluded` capabilities (distance in m)
+        """
+        found = self._subset(required, excluded).nearest(lat, lon, k=1)
+        if not found:
+            return None
+
+        index, distance = found[0]
+        return {**self.stations[index], 'distance': distance}
+
+
+def _load_stations(session):
+    return [{
+        'obs_station_id': row.obs_station_id,
+        'obs_post_id': row.obs_post_id,
+        'obs_post_name': row.obs_post_name,
+        'obs_lat': row.obs_lat,
+        'obs_lon': row.obs_lon,
+        'capabilities': parse_obs_object(row.obs_object),
+    } for row in session.query(TidalObservation).all()]
+
+
+def _table_fingerprint(session):
+    return tuple(session.query(func.count(TidalObservation.obs_station_id),
+                               func.max(TidalObservation.obs_station_id)).one())
+
+
+_index = None
+_fingerprint = None
+_checked_at = 0.0
+_index_lock = threading.Lock()
+
+
+def get_tidal_station_index():
+    """
+    Shared station index, rebuilt when the TidalObservations table changes
+    """
+    global _index, _fingerprint, _checked_at
+
+    # 테이블 변경 여부는 일정 주기로만 확인 (조회 시 DB 접근 없음)
+    if _index is not None and time.monotonic() - _checked_at < BaseConfig.TIDAL_INDEX_CHECK_INTERVAL:
+        return _index
+
+    with _index_lock:
+        if _index is not None and time.monotonic() - _checked_at < BaseConfig.TIDAL_INDEX_CHECK_INTERVAL:
+            return _index
+
+        session = sessionmaker(bind=engine)()
+        try:
+            fingerprint = _table_fingerprint(session)
+            if _index is None or fingerprint != _fingerprint:
+                _index = TidalStationIndex(_load_stations(session))
+                _fingerprint = fingerprint
+                print(f"Tidal station index built : {len(_index.stations)} stations")
+            _checked_at = time.monotonic()
+        finally:
+            session.close()
+
+    return _index
+
+
+def invalidate_tidal_station_index():
+    """
+    Force rebuild on next lookup (called after insert_tidal_data)
+    """
+    global _checked_at, _fingerprint
+    with _index_lock:
+        _checked_at = 0.0
+        _fingerprint = None
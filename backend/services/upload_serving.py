@@ -0,0 +1,60 @@
+from werkzeug.security import safe_join
+import hashlib
+import os
+
+from config import BaseConfig
+from services.upload_store import upload_store
+from utils.cache import get_cache
+
+
+def _content_addressed_etag(name):
+    """
+    ETag from the name of a content-addressed blob / derivative (no file access), None otherwise
+    """
+    parts = name.split('/')
+    if parts[0] == BaseConfig.UPLOAD_VARIANT_FOLDER and len(parts) > 2:
+        # variants/<width | full>/<key>.<ext> : 원본 blob은 변경되지 않고 derivative는 덮어쓰지 않음
+        key, extension = '/'.join(parts[2:]).rsplit('.', 1)
+        if upload_store.is_blob_key(key):
+            return f"{key.rsplit('/', 1)[1].split('.')[0]}-{parts[1]}-{extension}"
+    elif upload_store.is_blob_key(name):
+        return parts[-1].split('.')[0]
+    return None
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_content_addressed(name):
+    return _content_addressed_etag(name) is not None
+
+
+def get_upload_etag(name):
+    """
+    Strong ETag of an upload (path relative to the upload folder), None if the file does not exist
+
+    Content-addressed names carry their hash (only an existence check). Legacy files are hashed
+    once per (mtime, size).
+    """
+    path = safe_join(BaseConfig.UPLOAD_FOLDER, name)
+    if path is None:
+        return None
+
+    etag = _content_addressed_etag(name)
+    if etag is not None:
+        # 삭제(GC)된 blob은 route의 JSON 404로 처리되도록 존재 여부만 확인
+        return etag if os.path.isfile(path) else None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if not os.path.isfile(path):
+        return None
+
+    cache = get_cache('upload_etags', BaseConfig.UPLOAD_ETAG_CACHE_SIZE, use_redis=False)
+    return cache.get_or_load(f"{name}:{stat.st_mtime_ns}:{stat.st_size}", lambda: _file_digest(path))
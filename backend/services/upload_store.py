@@ -0,0 +1,225 @@
+from collections import Counter
+from sqlalchemy import String, cast
+import hashlib
+import os
+import re
+import time
+import uuid
+
+from config import BaseConfig
+from models.model import Catch, CommunicationBoard, User
+
+UPLOAD_URL_PREFIX = '/uploads/'
+
+# 저장 key 형식 : "ab/cd/abcd1234....jpg" (content hash 앞자리로 디렉토리 분산)
+_BLOB_NAME = re.compile(r'^[0-9a-f]{64}\.[a-z0-9]+$')
+
+
+def get_extension(filename, default='jpg'):
+    if filename and '.' in filename:
+        return filename.rsplit('.', 1)[1].lower()
+    return default
+
+
+def key_from_url(url):
+    """
+    Upload key (path relative to the upload folder) of a stored reference
+
+    Catch.photo_url stores the bare key, CommunicationBoard.images / User.avatar store "/uploads/<key>".
+    """
+    if not url:
+        return None
+    if url.startswith('http'):
+        # get_full_url 결과가 그대로 저장된 경우
+        index = url.find(UPLOAD_URL_PREFIX)
+        if index < 0:
+            return None
+        url = url[index:]
+    if url.startswith(UPLOAD_URL_PREFIX):
+        url = url[len(UPLOAD_URL_PREFIX):]
+    return url.lstrip('/')
+
+
+class UploadStore:
+    """
+    Content-addressed upload blobs, sharded into nested directories
+
+    Identical content is stored once. References live in Catch.photo_url, CommunicationBoard.images
+    and User.avatar : `release` drops blobs that lost their last reference, `collect_garbage` sweeps orphans.
+    Blobs used within `grace_period` are only removed by `collect_garbage` (run `manage_uploads.py gc` periodically).
+    """
+    def __init__(self, root, shard_depth=2, shard_width=2, grace_period=3600):
+        self.root = root
+        self.shard_depth = shard_depth
+        self.shard_width = shard_width
+        # 업로드 후 DB 커밋 전의 blob을 지우지 않도록 최근 사용된 blob은 삭제 대상에서 제외
+        self.grace_period = grace_period
+
+    # ---- naming ----
+    def key_for(self, digest, extension='jpg'):
+        shards = [digest[i * self.shard_width:(i + 1) * self.shard_width] for i in range(self.shard_depth)]
+        return '/'.join(shards + [f"{digest}.{extension}"])
+
+    def key_for_data(self, data, extension='jpg'):
+        """
+        Key of bytes : sha256 of the stored content (every upload path uses this scheme)
+        """
+        return self.key_for(hashlib.sha256(data).hexdigest(), extension)
+
+    def path(self, key):
+        return os.path.join(self.root, *key.split('/'))
+
+    def url(self, key):
+        return f"{UPLOAD_URL_PREFIX}{key}"
+
+    def is_blob_key(self, key):
+        parts = key.split('/') if key else []
+        return len(parts) == self.shard_depth + 1 and bool(_BLOB_NAME.match(parts[-1])) \
+            and parts[:-1] == [parts[-1][i * self.shard_width:(i + 1) * self.shard_width]
+                               for i in range(self.shard_depth)]
+
+    def exists(self, key):
+        return os.path.exists(self.path(key))
+
+    def touch(self, key):
+        """
+        Refresh the GC grace period of a stored blob (it is about to be referenced), False if missing
+        """
+        try:
+            os.utime(self.path(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    # ---- write ----
+    def write(self, key, data):
+        """
+        Store bytes (or Future of them) under `key` unless it already exists, return key
+        """
+        path = self.path(key)
+        if os.path.exists(path):
+            # 중복 업로드 : 기존 blob 재사용 (GC 유예 시간 갱신)
+            os.utime(path)
+            return key
+
+        if hasattr(data, 'result'):
+            data = data.result()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        # 같은 내용을 동시에 저장해도 원자적으로 교체
+        os.replace(tmp_path, path)
+        return key
+
+    def put(self, data, extension='jpg'):
+        """
+        Store bytes under their sha256 content hash, return key
+        """
+        return self.write(self.key_for_data(data, extension), data)
+
+    def put_file(self, file, extension=None):
+        """
+        Store an uploaded werkzeug FileStorage, return key
+        """
+        return self.put(file.read(), extension or get_extension(file.filename))
+
+    def delete(self, key):
+        try:
+            os.remove(self.path(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def iter_keys(self):
+        """
+        Keys of every stored blob (legacy flat files are skipped)
+        """
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            relative = os.path.relpath(dirpath, self.root)
+            depth = 0 if relative == '.' else len(relative.split(os.sep))
+            if depth < self.shard_depth:
+                dirnames[:] = [name for name in dirnames if len(name) == self.shard_width
+                               and all(c in '0123456789abcdef' for c in name)]
+                continue
+            dirnames[:] = []
+            for filename in filenames:
+                key = '/'.join(relative.split(os.sep) + [filename])
+                if self.is_blob_key(key):
+                    yield key
+
+    # ---- references ----
+    def count_references(self, session):
+        """
+        Reference count of every key from Catch.photo_url, CommunicationBoard.images and User.avatar
+        """
+        counts = Counter()
+        for (photo_url,) in session.query(Catch.photo_url).filter(Catch.photo_url.isnot(None)).yield_per(1000):
+            counts[key_from_url(photo_url)] += 1
+        for (images,) in session.query(CommunicationBoard.images).yield_per(1000):
+            for image in images or []:
+                counts[key_from_url(image)] += 1
+        for (avatar,) in session.query(User.avatar).filter(User.avatar.isnot(None)).yield_per(1000):
+            counts[key_from_url(avatar)] += 1
+        counts.pop(None, None)
+        return counts
+
+    def reference_count(self, session, key):
+        """
+        Reference count of a single key
+        """
+        url = self.url(key)
+        count = session.query(Catch).filter(Catch.photo_url.in_([key, url])).count()
+        count += session.query(User).filter(User.avatar == url).count()
+        # JSON 배열 검색 : 문자열 포함 여부로 후보를 찾은 뒤 정확히 비교
+        for (images,) in session.query(CommunicationBoard.images).filter(
+                cast(CommunicationBoard.images, String).like(f'%{key}%')):
+            count += sum(1 for image in images or [] if key_from_url(image) == key)
+        return count
+
+    def _is_recent(self, path, now):
+        try:
+            return now - os.path.getmtime(path) < self.grace_period
+        except FileNotFoundError:
+            return True
+
+    def release(self, session, urls):
+        """
+        Delete blobs of `urls` that have no reference left (call after the commit that dropped them)
+
+        Legacy (non content-addressed) files are removed as before. Blobs used within the grace period
+        are skipped and left to `collect_garbage` (`manage_uploads.py gc`).
+        """
+        now = time.time()
+        removed = 0
+        for key in {key_from_url(url) for url in urls if url}:
+            if not key or '..' in key.split('/'):
+                continue
+            try:
+                if not self.is_blob_key(key):
+                    # 이전 방식 (uuid 파일명) : 한 곳에서만 참조
+                    removed += self.delete(key)
+                elif not self._is_recent(self.path(key), now) and self.reference_count(session, key) == 0:
+                    removed += self.delete(key)
+            except Exception as e:
+                print(f"UploadStore : release of {key} failed on {e}")
+        return removed
+
+    def collect_garbage(self, session, dry_run=False):
+        """
+        Delete blobs with no reference (older than the grace period), return deleted keys
+        """
+        references = self.count_references(session)
+        now = time.time()
+        orphans = [key for key in self.iter_keys()
+                   if references[key] == 0 and not self._is_recent(self.path(key), now)]
+        if not dry_run:
+            for key in orphans:
+                self.delete(key)
+        return orphans
+
+
+upload_store = UploadStore(BaseConfig.UPLOAD_FOLDER,
+                           shard_depth=BaseConfig.UPLOAD_SHARD_DEPTH,
+                           grace_period=BaseConfig.UPLOAD_GC_GRACE_PERIOD)
@@ -0,0 +1,144 @@
+from werkzeug.security import safe_join
+from PIL import Image, ImageOps
+import os
+import uuid
+
+from config import BaseConfig
+from utils.cache import SingleFlight
+
+# format -> (Pillow format, 파일 확장자)
+VARIANT_FORMATS = {
+    'webp': ('WEBP', 'webp'),
+    'jpeg': ('JPEG', 'jpg'),
+    'png': ('PNG', 'png'),
+}
+
+
+def negotiate_format(requested, accept):
+    """
+    Output format : explicit ?format=, otherwise WebP if the client accepts it (None : keep original)
+    """
+    if requested:
+        requested = requested.lower()
+        requested = 'jpeg' if requested == 'jpg' else requested
+        return requested if requested in VARIANT_FORMATS else None
+    if accept and 'image/webp' in accept:
+        return 'webp'
+    return None
+
+
+class UploadVariants:
+    """
+    Fixed-width / WebP derivatives of uploads, generated lazily on first request and cached on disk
+
+    Derivatives live in `<variant folder>/<width | full>/<upload key>.<ext>` : uploads are
+    content-addressed, so a derivative never goes stale while its source exists.
+    """
+    def __init__(self, upload_root, variant_folder, widths=(160, 480, 1024), quality=80):
+        self.upload_root = upload_root
+        self.variant_folder = variant_folder
+        self.widths = sorted(widths)
+        self.quality = quality
+        self._flight = SingleFlight()
+
+    def select_width(self, width):
+        """
+        Smallest configured width >= requested (bounds the number of cached derivatives)
+        """
+        if not width or width <= 0:
+            return None
+        for candidate in self.widths:
+            if candidate >= width:
+                return candidate
+        return self.widths[-1]
+
+    def variant_name(self, key, width, fmt):
+        # upload 폴더 기준 상대 경로
+        return '/'.join([self.variant_folder, str(width or 'full'), f"{key}.{VARIANT_FORMATS[fmt][1]}"])
+
+    def resolve(self, key, width=None, fmt=None):
+        """
+        Path (relative to the upload folder) to serve for `key` at `width` / `fmt`, creating it if needed
+
+        Returns `key` itself when no derivative applies (or it cannot be produced).
+        """
+        width = self.select_width(width)
+        if width is None and fmt is None:
+            return key
+
+        source = safe_join(self.upload_root, key)
+        if source is None or not os.path.isfile(source) or key.startswith(self.variant_folder + '/'):
+            return key
+
+        # 포맷 미지정 : 원본 포맷 유지 (png 외에는 JPEG)
+        source_fmt = 'png' if key.lower().endswith('.png') else 'jpeg'
+        if width is None and fmt == source_fmt:
+            return key
+        fmt = fmt or source_fmt
+
+        name = self.variant_name(key, width, fmt)
+        path = os.path.join(self.upload_root, *name.split('/'))
+        if os.path.exists(path):
+            return name
+
+        try:
+            # 같은 derivative 동시 요청은 한 번만 생성
+            self._flight.do(name, lambda: self._generate(source, path, width, fmt))
+        except Exception as e:
+            print(f"UploadVariants : {name} could not be generated on {e}")
+            return key
+        return name
+
+    def _generate(self, source, path, width, fmt):
+        if os.path.exists(path):
+            return
+
+        with Image.open(source) as image:
+            if width:
+                # JPEG : 목표 크기 이상을 유지하는 선에서 축소 디코딩
+                image.draft('RGB', (width, width))
+            image = ImageOps.exif_transpose(image)
+
+            if width and image.width > width:
+                height = max(1, round(image.height * width / image.width))
+                image = image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+            pillow_format = VARIANT_FORMATS[fmt][0]
+            if pillow_format == 'JPEG' and image.mode != 'RGB':
+                image = image.convert('RGB')
+            elif image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            if pillow_format == 'PNG':
+                image.save(tmp_path, format=pillow_format, optimize=True)
+            else:
+                image.save(tmp_path, format=pillow_format, quality=self.quality)
+            os.replace(tmp_path, path)
+
+    def collect_garbage(self, dry_run=False):
+        """
+        Delete derivatives whose source upload no longer exists, return their names
+        """
+        root = os.path.join(self.upload_root, self.variant_folder)
+        removed = []
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.endswith('.tmp'):
+                    continue  # 생성 중
+                path = os.path.join(dirpath, filename)
+                parts = os.path.relpath(path, root).split(os.sep)
+                # <width>/<key>.<ext> -> <key>
+                key = '/'.join(parts[1:]).rsplit('.', 1)[0]
+                if not os.path.exists(os.path.join(self.upload_root, *key.split('/'))):
+                    removed.append('/'.join([self.variant_folder] + parts))
+                    if not dry_run:
+                        os.remove(path)
+        return removed
+
+
+upload_variants = UploadVariants(BaseConfig.UPLOAD_FOLDER,
+                                 BaseConfig.UPLOAD_VARIANT_FOLDER,
+                                 widths=BaseConfig.UPLOAD_VARIANT_WIDTHS,
+                                 quality=BaseConfig.UPLOAD_VARIANT_QUALITY)
@@ -2,12 +2,73 @@ import requests
 from datetime import datetime
 import pytz
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
+
+from config import BaseConfig
+from utils.cache import get_cache
+from utils.http_client import http_get, get_http_executor
 
 # API 키와 base URL 설정
 KHOA_API_KEY = os.getenv('KHOA_API_KEY')
 OPENWEATHER_API_KEY = os.getenv('OPENWEATHER_API_KEY')  # API 키를 환경변수로 관리
 OPENWEATHER_API_BASE_URL = 'https://api.openweathermap.org/data/2.5/weather'
+KHOA_API_BASE_URL = 'http://www.khoa.go.kr/api/oceangrid/{}/search.do'
+
+# KHOA 데이터 종류별 캐시 TTL(초)
+SEA_WEATHER_CACHE_TTL = {
+    'tideObsRecent': BaseConfig.SEA_RECENT_CACHE_TTL,
+    'tideObsPreTab': BaseConfig.SEA_PRETAB_CACHE_TTL,
+}
+
+
+def get_grid_cell(lat, lon, cell_size):
+    """
+    Quantize coordinates to a grid cell : (cell key, cell center lat, cell center lon)
+    """
+    lat_index, lon_index = round(float(lat) / cell_size), round(float(lon) / cell_size)
+    return f"{lat_index}:{lon_index}", round(lat_index * cell_size, 6), round(lon_index * cell_size, 6)
+
+
+def get_khoa_params(obs_post_id, date):
+    return {
+        'ServiceKey': KHOA_API_KEY,
+        'ObsCode': obs_post_id,
+        'Date': date,
+        'ResultType': 'json'
+    }
+
+
+def parse_khoa_response(api_data):
+    """
+    KHOA response JSON to its data list, or {'error': ...}
+    """
+    if 'result' not in api_data or 'data' not in api_data['result']:
+        if 'error' in api_data.get('result', {}):
+            return {'error': api_data['result']['error']}
+        else:
+            return {'error': 'Unexpected API response structure'}
+
+    return api_data['result']['data']
+
+
+def is_cacheable_sea_data(data):
+    # 오류 응답은 캐시하지 않음
+    return not (isinstance(data, dict) and 'error' in data)
+
+
+def get_sea_cache_key(DATA_TYPE, obs_post_id, date):
+    return f"{DATA_TYPE}:{obs_post_id}:{date}"
+
+
+def get_openweather_params(lat, lon):
+    return {
+        "lat": lat,
+        "lon": lon,
+        "appid": OPENWEATHER_API_KEY,
+        "lang": "kr",
+        "units": "metric"
+    }
+
 
 def get_sea_weather_by_seapostid(obs_data):
     """
@@ -17,51 +78,46 @@ def get_sea_weather_by_seapostid(obs_data):
 
     # 병렬로 처리할 함수
     def fetch_api_data(DATA_TYPE, obs_post_id):
-        api_url = f"http://www.khoa.go.kr/api/oceangrid/{DATA_TYPE}/search.do"
-        params = {
-            'ServiceKey': KHOA_API_KEY,
-            'ObsCode': obs_post_id,
-            'Date': current_date,
-            'ResultType': 'json'
-        }
         try:
-            response = requests.get(api_url, params=params)
+            response = http_get(KHOA_API_BASE_URL.format(DATA_TYPE),
+                                params=get_khoa_params(obs_post_id, current_date))
             response.raise_for_status()
             try:
                 api_data = response.json()
             except ValueError:
                 return (DATA_TYPE, {'error': 'Invalid JSON response'})
 
-            if 'result' not in api_data or 'data' not in api_data['result']:
-                if 'error' in api_data['result']:
-                    return (DATA_TYPE, {'error': api_data['result']['error']})
-                else:
-                    return (DATA_TYPE, {'error': 'Unexpected API response structure'})
-
-            filtered_api_data = api_data['result']['data']
-            return (DATA_TYPE, filtered_api_data)
+            return (DATA_TYPE, parse_khoa_response(api_data))
         
         except requests.exceptions.RequestException as e:
             return (DATA_TYPE, {'error': str(e)})
 
-    # ThreadPoolExecutor를 사용해 병렬 요청 실행
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = [
-            executor.submit(fetch_api_data, "tideObsRecent", obs_data['obsrecent']),
-            executor.submit(fetch_api_data, "tideObsPreTab", obs_data['obspretab'])
-        ]
-
-        results = {
-            'obsrecent': {},
-            'obspretab': {}
-        }
-        
-        for future in as_completed(futures):
-            DATA_TYPE, result = future.result()
-            if DATA_TYPE == "tideObsRecent":
-                results['obsrecent'] = result
-            else:
-                results['obspretab'] = result
+    # 관측소 + 날짜 단위 캐시 (동시 요청은 한 번의 API 호출로 병합, 오류 응답은 캐시하지 않음)
+    def fetch_cached_api_data(DATA_TYPE, obs_post_id):
+        cache = get_cache('sea_weather', BaseConfig.SEA_WEATHER_CACHE_SIZE)
+        return (DATA_TYPE, cache.get_or_load(get_sea_cache_key(DATA_TYPE, obs_post_id, current_date),
+                                             lambda: fetch_api_data(DATA_TYPE, obs_post_id)[1],
+                                             ttl=SEA_WEATHER_CACHE_TTL[DATA_TYPE],
+                                             should_cache=is_cacheable_sea_data))
+
+    # 프로세스 공용 executor로 병렬 요청 실행 (요청마다 스레드 풀을 만들지 않음)
+    executor = get_http_executor()
+    futures = [
+        executor.submit(fetch_cached_api_data, "tideObsRecent", obs_data['obsrecent']),
+        executor.submit(fetch_cached_api_data, "tideObsPreTab", obs_data['obspretab'])
+    ]
+
+    results = {
+        'obsrecent': {},
+        'obspretab': {}
+    }
+    
+    for future in as_completed(futures):
+        DATA_TYPE, result = future.result()
+        if DATA_TYPE == "tideObsRecent":
+            results['obsrecent'] = result
+        else:
+            results['obspretab'] = result
 
     return results
     
@@ -70,17 +126,19 @@ def get_weather_by_coordinates(lat, lon):
     """
     Get Current land Weather info by using latitude & longitude
     """
+    # 좌표를 격자 단위로 묶어 캐시 (격자 중심 좌표로 API 호출)
+    cell, cell_lat, cell_lon = get_grid_cell(lat, lon, BaseConfig.WEATHER_GRID_SIZE)
+    cache = get_cache('land_weather', BaseConfig.WEATHER_CACHE_SIZE, BaseConfig.WEATHER_CACHE_TTL)
+    return cache.get_or_load(cell, lambda: fetch_weather_by_coordinates(cell_lat, cell_lon))
+
+
+def fetch_weather_by_coordinates(lat, lon):
+    """
+    Call OpenWeather API (uncached)
+    """
     try:
         # Call OpenWeather API
-        params = {
-            "lat": lat,
-            "lon": lon,
-            "appid": OPENWEATHER_API_KEY,
-            "lang": "kr",
-            "units": "metric"
-        }
-        
-        response = requests.get(OPENWEATHER_API_BASE_URL, params=params)    
+        response = http_get(OPENWEATHER_API_BASE_URL, params=get_openweather_params(lat, lon))
         response.raise_for_status()
         
         data = response.json()
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# 테스트는 in-memory SQLite 사용 (config / models import 전에 설정)
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('SECRET_KEY', 'snapish-test-secret-key-for-hs256-tokens')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,133 @@
+"""
+Query-count regression for the community feed : /api/posts and /api/posts/top must stay
+at a fixed number of statements regardless of page size (no per-post author / like / count queries).
+"""
+from datetime import datetime, timedelta, timezone
+from contextlib import contextmanager
+
+import jwt
+import pytest
+from flask import Flask
+from sqlalchemy import event
+
+from config import BaseConfig
+from models.model import Base, Session, engine, User, CommunicationBoard, PostLike, PostComment
+from routes.route import set_route
+from services.community_feed import invalidate_total_posts
+
+# 목록 조회 1 + 전체 게시물 수 1 (캐시 미스)
+MAX_FEED_QUERIES = 2
+POSTS = 50
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def make_token(user_id):
+    return jwt.encode({'user_id': user_id, 'exp': datetime.now(timezone.utc) + timedelta(hours=1)},
+                      BaseConfig.SECRET_KEY, algorithm='HS256')
+
+
+@pytest.fixture
+def client():
+    Base.metadata.create_all(engine)
+    session = Session()
+    authors = [User(username=f'user{i}', password_hash='-', email=f'user{i}@snapish.test', avatar=f'uploads/avatar{i}.jpg')
+               for i in range(3)]
+    session.add_all(authors)
+    session.flush()
+
+    viewer = authors[0]
+    now = datetime(2024, 5, 1)
+    for i in range(POSTS):
+        post = CommunicationBoard(user_id=authors[i % len(authors)].user_id,
+                                  title=f'post {i}', content='content', images=[f'uploads/post{i}.jpg'],
+                                  likes_count=i % 4, comments_count=1, created_at=now + timedelta(minutes=i))
+        session.add(post)
+        session.flush()
+        session.add(PostComment(post_id=post.post_id, user_id=authors[1].user_id, content='comment'))
+        if i % 2 == 0:
+            session.add(PostLike(post_id=post.post_id, user_id=viewer.user_id))
+    session.commit()
+    viewer_id = viewer.user_id
+    Session.remove()
+    invalidate_total_posts()
+
+    app = Flask(__name__)
+    app.config.from_object(BaseConfig)
+    set_route(app, None, 'cpu')
+    with app.test_client() as test_client:
+        test_client.viewer_id = viewer_id
+        yield test_client
+
+    Session.remove()
+    Base.metadata.drop_all(engine)
+
+
+def auth_headers(client):
+    return {'Authorization': f'Bearer {make_token(client.viewer_id)}'}
+
+
+@pytest.mark.parametrize('per_page', [5, 20])
+def test_posts_page_query_count(client, per_page):
+    with count_queries() as statements:
+        response = client.get(f'/api/posts?page=2&per_page={per_page}', headers=auth_headers(client))
+
+    assert response.status_code == 200
+    posts = response.get_json()['data']['posts']
+    assert len(posts) == per_page
+    assert len(statements) <= MAX_FEED_QUERIES
+
+
+def test_posts_cursor_query_count(client):
+    headers = auth_headers(client)
+    first = client.get('/api/posts?cursor=&per_page=10', headers=headers).get_json()['data']
+
+    with count_queries() as statements:
+        response = client.get(f"/api/posts?cursor={first['next_cursor']}&per_page=10", headers=headers)
+
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert len(data['posts']) == 10
+    assert data['posts'][0]['post_id'] < first['posts'][-1]['post_id']
+    # cursor 페이지는 전체 게시물 수를 조회하지 않음
+    assert len(statements) <= 1
+
+
+def test_posts_is_liked_for_viewer(client):
+    with count_queries() as statements:
+        response = client.get('/api/posts?cursor=&per_page=20', headers=auth_headers(client))
+
+    assert response.status_code == 200
+    posts = response.get_json()['data']['posts']
+    assert len(statements) <= MAX_FEED_QUERIES
+
+    session = Session()
+    liked = {post_id for (post_id,) in session.query(PostLike.post_id).filter_by(user_id=client.viewer_id)}
+    assert any(post['is_liked'] for post in posts)
+    for post in posts:
+        assert post['is_liked'] == (post['post_id'] in liked)
+        assert post['username'].startswith('user')
+        assert post['comments_count'] == 1
+
+
+def test_top_posts_query_count(client):
+    with count_queries() as statements:
+        response = client.get('/api/posts/top')
+
+    assert response.status_code == 200
+    posts = response.get_json()['data']
+    assert len(posts) == 5
+    assert [post['likes_count'] for post in posts] == sorted((post['likes_count'] for post in posts), reverse=True)
+    assert len(statements) <= 1
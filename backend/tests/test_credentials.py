@@ -0,0 +1,68 @@
+"""
+Background rehash after login must not overwrite a password changed in the meantime
+"""
+from concurrent.futures import Future
+
+import pytest
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from models.model import Base, Session, engine, User
+from services.credentials import CredentialService
+
+METHOD = 'pbkdf2:sha256:1000'
+
+
+@pytest.fixture
+def user_id():
+    Base.metadata.create_all(engine)
+    session = Session()
+    user = User(username='angler', password_hash=generate_password_hash('old-password', method='pbkdf2:sha256:600'),
+                email='angler@snapish.test')
+    session.add(user)
+    session.commit()
+    user_id = user.user_id
+    Session.remove()
+    yield user_id
+    Base.metadata.drop_all(engine)
+
+
+def stored_hash(user_id):
+    with Session.session_factory() as session:
+        return session.query(User.password_hash).filter_by(user_id=user_id).scalar()
+
+
+class InlineExecutor:
+    # in-memory SQLite는 스레드마다 별도 DB : 같은 스레드에서 실행
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def rehash(user_id, old_hash, password):
+    service = CredentialService(METHOD, workers=1)
+    service._executor = InlineExecutor()
+    service.rehash_in_background(user_id, old_hash, password)
+
+
+def test_rehash_upgrades_verified_hash(user_id):
+    old_hash = stored_hash(user_id)
+    rehash(user_id, old_hash, 'old-password')
+
+    new_hash = stored_hash(user_id)
+    assert new_hash.startswith(METHOD)
+    assert check_password_hash(new_hash, 'old-password')
+
+
+def test_rehash_skips_changed_password(user_id):
+    old_hash = stored_hash(user_id)
+    changed_hash = generate_password_hash('new-password', method=METHOD)
+    with Session.session_factory() as session:
+        session.query(User).filter_by(user_id=user_id).update({'password_hash': changed_hash})
+        session.commit()
+
+    rehash(user_id, old_hash, 'old-password')
+    assert stored_hash(user_id) == changed_hash
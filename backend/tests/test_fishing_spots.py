@@ -0,0 +1,21 @@
+"""
+FishingPlace addresses normalized to the Kakao coord2regioncode address_name form
+"""
+import pytest
+
+from services.fishing_spots import get_region_name
+
+
+@pytest.mark.parametrize('address_land, address_road, expected', [
+    ('서울특별시 종로구 동숭동 1-48 지하1층', '서울특별시 종로구 대학로8가길 52, 지하1층 (동숭동)', '서울특별시 종로구 동숭동'),
+    ('충청북도 청주시 상당구 미원면 종암리 449', None, '충청북도 청주시 상당구 미원면'),
+    (None, '대전 중구 대종로 488번길 39, 지하(은행동)', '대전광역시 중구 은행동'),
+    ('경남 창녕군 성산면 방리 1067-14, 1067-44', None, '경상남도 창녕군 성산면'),
+    ('세종시 조치원읍 교리 17-14', '세종시 조치원읍 새내16길 28', '세종특별자치시 조치원읍'),
+    ('김포시 고촌읍 태리 968', '경기도 김포시 고촌읍 인향로210번길 52', '경기도 김포시 고촌읍'),
+    (None, '경기도 평택시 문화촌로 9', '경기도 평택시'),
+    ('김포시 고촌읍 태리 584-3', None, None),
+    (None, None, None),
+])
+def test_get_region_name(address_land, address_road, expected):
+    assert get_region_name(address_land, address_road) == expected
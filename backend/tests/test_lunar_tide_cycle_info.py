@@ -0,0 +1,46 @@
+"""
+The precomputed tide calendar must match the reference per-day calculation
+(get_tide_cycle / calculate_moon_phase) for every date of its range.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.lunar_tide_cycle_info import (
+    TideCalendar, TIDE_CALENDAR_START, TIDE_CALENDAR_END,
+    get_tide_cycle, calculate_moon_phase, get_tide_info,
+)
+
+
+@pytest.fixture(scope='module')
+def tide_calendar():
+    return TideCalendar()
+
+
+def test_tide_calendar_covers_range(tide_calendar):
+    assert TIDE_CALENDAR_START.year == 1990
+    assert TIDE_CALENDAR_END.year == 2050
+    assert len(tide_calendar) == (TIDE_CALENDAR_END - TIDE_CALENDAR_START).days + 1
+
+
+def test_tide_calendar_matches_reference(tide_calendar):
+    mismatches = []
+    day = TIDE_CALENDAR_START
+    while day <= TIDE_CALENDAR_END:
+        nowdate = datetime(day.year, day.month, day.day)
+        entry = tide_calendar.get(day)
+        expected = (*get_tide_cycle(nowdate), calculate_moon_phase(nowdate))
+        actual = (entry['lunar_date'], entry['seohae'], entry['other'], entry['moon_phase'])
+
+        if actual[:3] != expected[:3] or actual[3] != pytest.approx(expected[3], abs=1e-12):
+            mismatches.append((day.isoformat(), actual, expected))
+        day += timedelta(days=1)
+
+    assert not mismatches, f"{len(mismatches)} dates differ, first : {mismatches[:3]}"
+
+
+def test_get_tide_info_outside_range():
+    nowdate = datetime(2051, 1, 1)
+    info = get_tide_info(nowdate)
+    assert info['moon_phase'] == calculate_moon_phase(nowdate)
+    assert info['lunar_date'] == get_tide_cycle(nowdate)[0]
@@ -0,0 +1,112 @@
+"""
+Durability of the /predict persistence pipeline : jobs are spooled before they are queued,
+status is visible to other workers sharing the spool folder and abandoned claims are replayed.
+"""
+import os
+import time
+
+import pytest
+
+from services.predict_jobs import PredictJobPipeline, create_predict_job, JOB_PENDING, JOB_DONE, JOB_FAILED
+
+
+class MemoryStore:
+    def __init__(self):
+        self.blobs = {}
+
+    def exists(self, key):
+        return key in self.blobs
+
+    def write(self, key, data):
+        self.blobs.setdefault(key, data)
+        return key
+
+
+def make_pipeline(spool_folder, store, **kwargs):
+    pipeline = PredictJobPipeline(store, str(spool_folder), **kwargs)
+    pipeline._started = True  # 스레드 없이 직접 처리
+    return pipeline
+
+
+@pytest.fixture
+def job():
+    return create_predict_job(1, None, 'ab/cd/abcd.jpg', [{'label': '참돔', 'confidence': 0.9}])
+
+
+def spooled(spool_folder):
+    return sorted(name for name in os.listdir(spool_folder) if name.endswith(('.json', '.claimed')))
+
+
+def test_submit_spools_before_queueing(tmp_path, job):
+    pipeline = make_pipeline(tmp_path, MemoryStore())
+    job_id = pipeline.submit(job, b'jpeg')
+
+    assert spooled(tmp_path) == [f"{job_id}.json.{pipeline.owner}.claimed"]
+    assert os.path.exists(tmp_path / f"{job_id}.jpg")
+
+    # 같은 spool 폴더를 사용하는 다른 워커에서도 상태 조회 가능
+    other = make_pipeline(tmp_path, MemoryStore())
+    assert other.get_status(job_id)['status'] == JOB_PENDING
+
+
+def test_spool_removed_after_commit(tmp_path, job, monkeypatch):
+    store = MemoryStore()
+    pipeline = make_pipeline(tmp_path, store)
+    checkpoints = []
+
+    def run(job, encoded_image=None, checkpoint=None):
+        store.write(job['filename'], encoded_image)
+        job['saved_catch_id'] = 7
+        checkpoint(job)
+        checkpoints.append(spooled(tmp_path))
+        return pipeline._set_status(job, JOB_DONE)
+
+    monkeypatch.setattr(pipeline, 'run', run)
+    job_id = pipeline.submit(job, b'jpeg')
+    pipeline._process(*pipeline._queue.get_nowait())
+
+    # Catch 커밋 시점에는 spool이 남아있고, 완료 후 정리
+    assert checkpoints == [[f"{job_id}.json.{pipeline.owner}.claimed"]]
+    assert spooled(tmp_path) == []
+    assert not os.path.exists(tmp_path / f"{job_id}.jpg")
+    assert pipeline.get_status(job_id)['catch_id'] == 7
+
+
+def test_abandoned_claim_is_replayed(tmp_path, job):
+    crashed = make_pipeline(tmp_path, MemoryStore())
+    job_id = crashed.submit(job, b'jpeg')
+    claimed_path = tmp_path / f"{job_id}.json.{crashed.owner}.claimed"
+
+    other = make_pipeline(tmp_path, MemoryStore(), claim_timeout=60)
+    other._owner, other._owner_pid = 'other', os.getpid()
+
+    # 갱신된 claim은 가져가지 않음
+    other._claim_spooled_jobs()
+    assert other._queue.empty()
+
+    stale = time.time() - 120
+    os.utime(claimed_path, (stale, stale))
+    other._claim_spooled_jobs()
+
+    replayed, encoded_image, path = other._queue.get_nowait()
+    assert replayed['job_id'] == job_id
+    assert encoded_image is None
+    assert spooled(tmp_path) == [f"{job_id}.json.other.claimed"]
+    assert path == str(tmp_path / f"{job_id}.json.other.claimed")
+
+
+def test_failed_job_moves_image_to_failed(tmp_path, job, monkeypatch):
+    pipeline = make_pipeline(tmp_path, MemoryStore(), max_attempts=1)
+
+    def run(job, encoded_image=None, checkpoint=None):
+        raise RuntimeError('db down')
+
+    monkeypatch.setattr(pipeline, 'run', run)
+    job_id = pipeline.submit(job, b'jpeg')
+    pipeline._process(*pipeline._queue.get_nowait())
+
+    assert spooled(tmp_path) == []
+    assert not os.path.exists(tmp_path / f"{job_id}.jpg")
+    assert os.path.exists(tmp_path / 'failed' / f"{job_id}.json")
+    assert (tmp_path / 'failed' / f"{job_id}.jpg").read_bytes() == b'jpeg'
+    assert pipeline.get_status(job_id)['status'] == JOB_FAILED
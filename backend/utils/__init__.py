@@ -1,6 +1,12 @@
 from .file_utils import allowed_file
-from .file_utils import optimize_image
+from .file_utils import decode_image
+from .file_utils import encode_image
+from .file_utils import save_encoded_image
 from .url_utils import get_full_url
 from .url_utils import custom_sort_key
 from .response import success_response
-from .response import error_response
\ No newline at end of file
+from .response import error_response
+from .cache import get_cache
+from .cache import cache_stats
+from .http_client import http_get
+from .http_client import get_http_executor
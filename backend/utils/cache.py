@@ -0,0 +1,241 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+import threading
+import json
+import time
+import redis
+
+from config import BaseConfig
+
+# 생성된 캐시 목록 (name -> cache), 통계 조회용
+_caches = {}
+_caches_lock = threading.Lock()
+_redis_client = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one execution
+    """
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+
+        # 이미 같은 key를 처리 중인 경우 결과를 기다려 공유
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                self.calls += 1
+
+
+class LoaderMixin:
+    """
+    get_or_load for cache backends : cache hit, otherwise one (coalesced) loader call
+    """
+    def get_or_load(self, key, loader, ttl=None, should_cache=None):
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+
+        def load():
+            value = loader()
+            if should_cache is None or should_cache(value):
+                self.set(key, value, ttl)
+            return value
+
+        return self._flight.do(key, load)
+
+    def loader_stats(self):
+        return {
+            'upstream_calls': self._flight.calls,
+            'coalesced': self._flight.coalesced,
+            # 캐시 적중 + 동시 요청 병합으로 생략된 호출 수
+            'calls_saved': self.hits + self._flight.coalesced,
+        }
+
+
+class LRUCache(LoaderMixin):
+    """
+    Thread-safe in-process LRU cache with optional TTL and hit/miss counters
+    """
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                value, expires_at = item
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=None):
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def items(self, include_expiring=True):
+        """
+        Unexpired (key, value) pairs, least recently used first (include_expiring=False : entries without TTL only)
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [(key, value) for key, (value, expires_at) in self._data.items()
+                    if expires_at is None or (include_expiring and expires_at > now)]
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'backend': 'memory',
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            **self.loader_stats(),
+        }
+
+
+class RedisCache(LoaderMixin):
+    """
+    Redis-backed cache (JSON values) with the same interface as LRUCache
+    """
+    def __init__(self, client, prefix, ttl=None):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._flight = SingleFlight()
+
+    def _key(self, key):
+        return f"snapish:{self.prefix}:{key}"
+
+    def get(self, key, default=None):
+        try:
+            raw = self.client.get(self._key(key))
+        except redis.RedisError as e:
+            print(f"RedisCache({self.prefix}) : get failed on {e}")
+            self.errors += 1
+            raw = None
+
+        if raw is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return json.loads(raw)
+
+    def set(self, key, value, ttl=None):
+        ttl = ttl if ttl is not None else self.ttl
+        try:
+            self.client.set(self._key(key), json.dumps(value, ensure_ascii=False), ex=int(ttl) if ttl else None)
+        except redis.RedisError as e:
+            print(f"RedisCache({self.prefix}) : set failed on {e}")
+            self.errors += 1
+
+    def delete(self, key):
+        try:
+            self.client.delete(self._key(key))
+        except redis.RedisError as e:
+            print(f"RedisCache({self.prefix}) : delete failed on {e}")
+            self.errors += 1
+
+    def clear(self):
+        try:
+            keys = list(self.client.scan_iter(match=self._key('*')))
+            if keys:
+                self.client.delete(*keys)
+        except redis.RedisError as e:
+            print(f"RedisCache({self.prefix}) : clear failed on {e}")
+            self.errors += 1
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'backend': 'redis',
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'errors': self.errors,
+            **self.loader_stats(),
+        }
+
+
+def get_redis_client():
+    """
+    Shared redis client (None if REDIS_URL is not set)
+    """
+    global _redis_client
+    if _redis_client is None and BaseConfig.REDIS_URL:
+        _redis_client = redis.Redis.from_url(BaseConfig.REDIS_URL,
+                                             socket_timeout=0.5,
+                                             socket_connect_timeout=0.5)
+    return _redis_client
+
+
+def get_cache(name, maxsize=1024, ttl=None, use_redis=True):
+    """
+    Get (or create) a named cache : Redis if REDIS_URL is set, otherwise in-process LRU
+    """
+    with _caches_lock:
+        if name not in _caches:
+            client = get_redis_client() if use_redis else None
+            if client is not None:
+                _caches[name] = RedisCache(client, name, ttl)
+            else:
+                _caches[name] = LRUCache(maxsize, ttl)
+        return _caches[name]
+
+
+def cache_stats():
+    """
+    Hit / miss statistics of every named cache
+    """
+    with _caches_lock:
+        return {name: cache.stats() for name, cache in _caches.items()}
@@ -12,21 +12,34 @@ def allowed_file(filename):
 
     return files
  
-# 이미지 최적화 함수 추가
-def optimize_image(image, max_size=1024):
-    """Optimize image size and quality for mobile"""
+# 이미지 디코딩 (1회) 및 리사이즈
+def decode_image(stream, max_size=1024):
+    """Decode upload once, fitted within max_size (JPEG : draft-mode downscale while decoding)"""
+    image = Image.open(stream)
+
     if max(image.size) > max_size:
         ratio = max_size / max(image.size)
         new_size = tuple(int(dim * ratio) for dim in image.size)
-        image = image.resize(new_size, Image.Resampling.LANCZOS)
-    
-    # Convert to RGB if necessary
-    if image.mode in ('RGBA', 'P'):
+
+        # JPEG : DCT 단계에서 1/2 ~ 1/8 축소 디코딩 (new_size 이상 크기 유지)
+        image.draft('RGB', new_size)
+        image = image.convert('RGB')
+        if image.size != new_size:
+            image = image.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+    else:
         image = image.convert('RGB')
-    
-    # Optimize
+
+    return image
+
+def encode_image(image, quality=85):
+    """Encode image as JPEG bytes for storage"""
     buffer = BytesIO()
-    image.save(buffer, format='JPEG', quality=85, optimize=True)
-    buffer.seek(0)
-    
-    return Image.open(buffer)
\ No newline at end of file
+    image.save(buffer, format='JPEG', quality=quality, optimize=True)
+    return buffer.getvalue()
+
+def save_encoded_image(encoded, file_path):
+    """Write encoded image bytes (or Future of them) to disk"""
+    if hasattr(encoded, 'result'):
+        encoded = encoded.result()
+    with open(file_path, 'wb') as f:
+        f.write(encoded)
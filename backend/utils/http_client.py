@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
+import requests
+import os
+
+from config import BaseConfig
+
+# 프로세스별 공유 세션 (재시도 횟수별) / executor (fork 이후 자식 프로세스에서는 새로 생성)
+_sessions = {}
+_sessions_pid = None
+_executor = None
+_executor_pid = None
+_lock = threading.Lock()
+
+
+def _create_session(retries):
+    retry = Retry(total=retries,
+                  backoff_factor=BaseConfig.HTTP_RETRY_BACKOFF,
+                  status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(['GET', 'HEAD']),
+                  raise_on_status=False)
+    # host별 keep-alive 연결 풀
+    adapter = HTTPAdapter(pool_connections=BaseConfig.HTTP_POOL_CONNECTIONS,
+                          pool_maxsize=BaseConfig.HTTP_POOL_MAXSIZE,
+                          max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_http_session(retries=None):
+    """
+    Shared keep-alive session with per-host connection pools and bounded retries (default HTTP_RETRIES)
+    """
+    global _sessions, _sessions_pid
+    retries = BaseConfig.HTTP_RETRIES if retries is None else retries
+    session = _sessions.get(retries) if _sessions_pid == os.getpid() else None
+    if session is None:
+        with _lock:
+            if _sessions_pid != os.getpid():
+                _sessions = {}
+                _sessions_pid = os.getpid()
+            session = _sessions.get(retries)
+            if session is None:
+                session = _sessions[retries] = _create_session(retries)
+    return session
+
+
+def http_get(url, retries=None, **kwargs):
+    """
+    GET through the shared session with default connect / read timeouts
+
+    retries=0 : fail fast (callers with their own fallback, e.g. geocoding)
+    """
+    kwargs.setdefault('timeout', (BaseConfig.HTTP_CONNECT_TIMEOUT, BaseConfig.HTTP_READ_TIMEOUT))
+    return get_http_session(retries).get(url, **kwargs)
+
+
+def get_http_executor():
+    """
+    Process-wide executor for parallel outbound calls
+    """
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        with _lock:
+            if _executor is None or _executor_pid != os.getpid():
+                _executor = ThreadPoolExecutor(max_workers=BaseConfig.HTTP_EXECUTOR_WORKERS,
+                                               thread_name_prefix='http-client')
+                _executor_pid = os.getpid()
+    return _executor
@@ -3,9 +3,14 @@ import re
 
 baseUrl = os.getenv('BASE_URL')
 
-def get_full_url(url):
+def get_full_url(url, width=None):
+    """
+    Public URL of a stored image (width : resized derivative, see /uploads ?w=)
+    """
     if not url:
         return None
+    if width and '/uploads/' in url:
+        url = f"{url}{'&' if '?' in url else '?'}w={int(width)}"
     if url.startswith('http'):
         return url
     return os.path.join(f"{baseUrl}:5000", url)
@@ -0,0 +1,45 @@
+import sys
+import time
+
+from config import BaseConfig
+from utils.cache import get_redis_client
+from services.assistant_answers import get_cached_answer, request_answer
+from services.assistant_runs import assistant_runs, RUN_PENDING
+
+
+def warm_assistant_answers(labels=None):
+    """
+    Generate per-species assistant answers missing from the shared Redis cache (run once per deploy)
+
+    Without REDIS_URL each web process keeps its own cache, so answers warmed here would not be served.
+    """
+    if get_redis_client() is None:
+        print("REDIS_URL is not set : answers are cached per web process on first use")
+        return
+
+    runs = {}
+    for label in labels or BaseConfig.LABELS_KOREAN.values():
+        if get_cached_answer(label):
+            continue
+        try:
+            runs[label] = request_answer(label)
+        except Exception as e:
+            print(f"Assistant answer warmup failed for {label} on {e}")
+    print(f"Assistant answer warmup : {len(runs)} runs started")
+
+    # 답변은 run 완료 시 캐시에 저장되므로 모든 run이 끝날 때까지 대기
+    deadline = time.monotonic() + BaseConfig.ASSISTANT_RUN_TIMEOUT + 5
+    while runs and time.monotonic() < deadline:
+        for label, request_id in list(runs.items()):
+            status = assistant_runs.get(*request_id)['status']
+            if status != RUN_PENDING:
+                print(f"{label} : {status}")
+                del runs[label]
+        time.sleep(BaseConfig.ASSISTANT_POLL_INTERVAL)
+
+    for label in runs:
+        print(f"{label} : no result")
+
+
+if __name__ == "__main__":
+    warm_assistant_answers(sys.argv[1:] or None)
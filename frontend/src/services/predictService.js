@@ -46,25 +46,35 @@ export async function requestPredict(formdata, token=null) {
   }
 
 // ChatGPT Assistant Request
+// 서버는 답변 생성 중이면 202를 반환하므로 완료될 때까지 짧게 재요청
+const ASSIST_MAX_POLLS = 90;
+
 export async function fetchchatgptAssist(thread_id, run_id) {
   try {
-    const response = await axios.post(
-      apiassistBaseUrl,
-      new URLSearchParams({ thread_id: thread_id, run_id: run_id }).toString(),
-      {
-        headers: {
-          "Content-Type": "application/x-www-form-urlencoded",
+    for (let attempt = 0; attempt < ASSIST_MAX_POLLS; attempt++) {
+      const response = await axios.post(
+        apiassistBaseUrl,
+        new URLSearchParams({ thread_id: thread_id, run_id: run_id }).toString(),
+        {
+          headers: {
+            "Content-Type": "application/x-www-form-urlencoded",
+          }
         }
-      }
-    );
+      );
 
-    if (response.status === 200) {
+      if (response.status === 200) {
         return response.data.data;
-    } else {
-      return null
+      }
+      if (response.status !== 202) {
+        return null
+      }
+
+      const retryAfter = Number(response.headers['retry-after']) || 1;
+      await new Promise(resolve => setTimeout(resolve, retryAfter * 1000));
     }
+    return null
   } catch (error) {
     console.error("Error Request chatGPT assistant data:", error);
     return { error: error.message };
   }
-}
\ No newline at end of file
+}